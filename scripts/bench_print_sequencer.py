@@ -0,0 +1,197 @@
+"""Microbenchmarks for the label print sequencer.
+
+Compares filename grouping (batch parser vs one file at a time), print
+sequence building (lazy :class:`PrintSequence` vs the eager list of items)
+and the item record itself (slotted :class:`PrintItem` with shared material
+strings vs a plain dataclass with a string per item).
+
+Usage (from the repository root)::
+
+    python scripts/bench_print_sequencer.py            # 10k and 100k files
+    python scripts/bench_print_sequencer.py 50000      # custom sizes
+
+Each case reports the best of a few runs, so a cold cache or a busy machine
+does not skew the comparison.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import sys
+import timeit
+import tracemalloc
+from dataclasses import dataclass
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "source"))
+
+import print_sequencer  # noqa: E402
+from print_sequencer import (  # noqa: E402
+    LABEL_KIND,
+    SEPARATOR_LABEL_KIND,
+    UNKNOWN_MATERIAL,
+    PrintItem,
+    build_print_sequence_from_groups,
+    compute_peel_order,
+    extract_material_from_filename,
+    group_ljd_files_by_material,
+)
+
+MATERIALS = ("WHMR", "OAK", "MDF", "WALNUT", "BlackHMR", "MO", "HG", "ASH")
+REPEATS = 5
+
+
+def make_names(count: int, seed: int = 0) -> list[str]:
+    """*count* realistic label paths over a few jobs, in scan order."""
+    rng = random.Random(seed)
+    names = [
+        f"C:/CNC/Jobs/JOB{index % 7}/JOB{index % 7}_"
+        f"{rng.choice(MATERIALS)}_{index:05d}.ljd"
+        for index in range(count)
+    ]
+    rng.shuffle(names)
+    return names
+
+
+def group_per_file(ljd_files):
+    """The one-file-at-a-time grouping the batch parser replaced."""
+    grouped: dict[str, list[tuple[int, str]]] = {}
+    for index, path in enumerate(ljd_files):
+        parsed = extract_material_from_filename(path)
+        if parsed is None:
+            grouped.setdefault(UNKNOWN_MATERIAL, []).append((-1 - index, path))
+            continue
+        _job, material, board = parsed
+        grouped.setdefault(material, []).append((board, path))
+    for material in grouped:
+        grouped[material].sort(key=lambda entry: (entry[0], entry[1]))
+    return grouped
+
+
+@dataclass(frozen=True)
+class DictPrintItem:
+    """PrintItem as it was: a frozen dataclass with a ``__dict__``."""
+
+    kind: str
+    file_path: str
+    material: str
+    board_number: int | None
+    job_name: str = ""
+
+
+def build_items(item_class, rows):
+    """One label item per ``(material, board, path)`` row."""
+    return [
+        item_class(LABEL_KIND, path, material, board)
+        for material, board, path in rows
+    ]
+
+
+def walk_items(items) -> int:
+    return sum(1 for item in items if item.material and item.board_number)
+
+
+def build_list_sequence(job_name, grouped):
+    """The eager sequence build the lazy view replaced, plus the worker's
+    defensive copy: every item made up front, then copied twice."""
+    counts = {m: len(entries) for m, entries in grouped.items()}
+    peel_items = []
+    for material in compute_peel_order(list(grouped), (), counts):
+        peel_items.append(
+            PrintItem(SEPARATOR_LABEL_KIND, "", material, None, job_name)
+        )
+        for board, path in grouped[material]:
+            peel_items.append(PrintItem(LABEL_KIND, path, material, board))
+    sequence = list(reversed(peel_items))
+    return list(sequence)
+
+
+def build_view_sequence(job_name, grouped):
+    return build_print_sequence_from_groups(job_name, grouped)
+
+
+def peak_kib(func, *args) -> float:
+    tracemalloc.start()
+    try:
+        result = func(*args)
+        return tracemalloc.get_traced_memory()[1] / 1024, result
+    finally:
+        tracemalloc.stop()
+
+
+def best_ms(func, *args) -> float:
+    return min(timeit.repeat(lambda: func(*args), number=1, repeat=REPEATS)) * 1000
+
+
+def bench_grouping(count: int) -> None:
+    names = make_names(count)
+    assert group_ljd_files_by_material(names) == group_per_file(names)
+    per_file = best_ms(group_per_file, names)
+    batch = best_ms(group_ljd_files_by_material, names)
+    print(
+        f"group {count:>7} files: per-file {per_file:8.1f} ms   "
+        f"batch {batch:8.1f} ms   x{per_file / batch:4.1f}"
+    )
+
+
+def bench_sequence(count: int) -> None:
+    grouped = {
+        material: tuple(entries)
+        for material, entries in group_ljd_files_by_material(
+            make_names(count)
+        ).items()
+    }
+    for name, build in (
+        ("list", build_list_sequence),
+        ("view", build_view_sequence),
+    ):
+        peak, sequence = peak_kib(build, "JOB", grouped)
+        build_ms = best_ms(build, "JOB", grouped)
+        iterate_ms = best_ms(lambda: sum(1 for _item in sequence))
+        print(
+            f"sequence {count:>7} files, {name}: build {build_ms:8.1f} ms   "
+            f"iterate {iterate_ms:8.1f} ms   peak {peak:10.0f} KiB"
+        )
+
+
+def bench_items(count: int) -> None:
+    names = make_names(count)
+    # Before: a fresh material string per parsed name.
+    before = [extract_material_from_filename(name) for name in names]
+    columns = print_sequencer.parse_ljd_filenames(names)
+    cases = (
+        (
+            "dataclass",
+            DictPrintItem,
+            [(m, b, path) for (_j, m, b), path in zip(before, names)],
+        ),
+        (
+            "slotted",
+            PrintItem,
+            list(zip(columns.materials, columns.boards, names)),
+        ),
+    )
+    for name, item_class, rows in cases:
+        peak, items = peak_kib(build_items, item_class, rows)
+        build_ms = best_ms(build_items, item_class, rows)
+        walk_ms = best_ms(walk_items, items)
+        print(
+            f"items    {count:>7} labels, {name:>9}: "
+            f"build {build_ms:7.1f} ms   iterate {walk_ms:6.1f} ms   peak {peak:8.0f} KiB"
+        )
+
+
+def main(argv: list[str]) -> int:
+    sizes = [int(arg) for arg in argv] or [10_000, 100_000]
+    print(f"numpy: {'yes' if print_sequencer.HAS_NUMPY else 'no'}")
+    for count in sizes:
+        bench_grouping(count)
+    for count in sizes:
+        bench_sequence(count)
+    for count in sizes:
+        bench_items(count)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
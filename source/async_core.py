@@ -0,0 +1,322 @@
+"""An asyncio event loop for the application's I/O, bridged to Qt.
+
+Background I/O used to be one blocking call per worker thread: a scan of
+``S:\\Jobs`` lists a source folder, then lists every job folder in it one
+after another, each listing a full SMB round trip. :class:`AsyncCore` runs
+one asyncio event loop on a dedicated thread next to the Qt event loop.
+Work is written as coroutines; the blocking calls they make
+(``os.scandir`` and friends) go to the loop's executor with
+:func:`asyncio.to_thread`, so many small round trips can be in flight at
+once while the coroutine stays a single, cancellable unit.
+
+:meth:`AsyncCore.submit` schedules a coroutine from the GUI thread with an
+optional timeout and returns an :class:`AsyncHandle`. Cancelling the handle
+(or hitting the timeout) cancels the coroutine and everything it awaits; a
+blocking call already running in the executor cannot be interrupted, but
+its result is dropped. Results and errors come back through a Qt signal, on
+the thread that created the core — the same contract as
+:class:`task_executor.TaskExecutor`.
+
+The loop's executor is bounded (:data:`DEFAULT_IO_WORKERS`), and
+:func:`map_blocking` bounds how many calls one coroutine keeps in flight,
+so a slow share is never hit with an unbounded burst.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Hashable,
+    Iterable,
+    Optional,
+    TypeVar,
+)
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+logger = logging.getLogger(__name__)
+
+#: Threads in the loop's executor, i.e. blocking calls in flight at once
+#: across every coroutine.
+DEFAULT_IO_WORKERS = 16
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class AsyncHandle:
+    """The caller's view of one submitted coroutine."""
+
+    def __init__(
+        self,
+        name: str,
+        key: Optional[Hashable],
+        on_result: Optional[Callable[[Any], None]],
+        on_error: Optional[Callable[[BaseException], None]],
+    ) -> None:
+        self.name = name
+        self.key = key
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self._on_result = on_result
+        self._on_error = on_error
+        self._cancelled = False
+        self._future = None
+        self._done = threading.Event()
+
+    def cancel(self) -> None:
+        """Cancel the coroutine; a cancelled coroutine delivers nothing."""
+        self._cancelled = True
+        if self._future is not None:
+            self._future.cancel()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def discard(self) -> None:
+        """Drop the callbacks, e.g. before their receiver is destroyed."""
+        self._on_result = self._on_error = None
+
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def wait(self, timeout_ms: int) -> bool:
+        """Block until the coroutine has finished or been cancelled."""
+        return self._done.wait(max(0, timeout_ms) / 1000.0)
+
+
+class _SignalBridge(QObject):
+    """Carries loop-thread results onto the core's thread."""
+
+    delivered = pyqtSignal(object, str, object)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.delivered.connect(self._dispatch)
+
+    @staticmethod
+    def _dispatch(handle: AsyncHandle, kind: str, payload: object) -> None:
+        if handle.cancelled:
+            return
+        try:
+            if kind == "result" and handle._on_result is not None:
+                handle._on_result(payload)
+            elif kind == "error" and handle._on_error is not None:
+                handle._on_error(payload)
+        except Exception:  # noqa: BLE001 - one bad callback must not leak
+            logger.exception("Callback for coroutine %s failed", handle.name)
+
+
+class AsyncCore:
+    """An asyncio loop on its own thread, with a bounded I/O executor.
+
+    Create the core on the GUI thread: callbacks run on the creating
+    thread. The loop thread starts immediately and lives until
+    :meth:`shutdown`.
+    """
+
+    def __init__(self, io_workers: int = DEFAULT_IO_WORKERS) -> None:
+        self._io_workers = max(1, int(io_workers))
+        self._pool = ThreadPoolExecutor(
+            max_workers=self._io_workers, thread_name_prefix="AsyncCore-io"
+        )
+        self._loop = asyncio.new_event_loop()
+        # asyncio.to_thread and run_in_executor(None, ...) use this pool.
+        self._loop.set_default_executor(self._pool)
+        self._keys: set[Hashable] = set()
+        self._lock = threading.Lock()
+        self._shutdown = False
+        self._bridge = _SignalBridge()
+        self._thread = threading.Thread(
+            target=self._run_loop, name="AsyncCore", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def io_workers(self) -> int:
+        return self._io_workers
+
+    def submit(
+        self,
+        coro: Coroutine[Any, Any, Any],
+        key: Optional[Hashable] = None,
+        timeout: Optional[float] = None,
+        on_result: Optional[Callable[[Any], None]] = None,
+        on_error: Optional[Callable[[BaseException], None]] = None,
+        name: str = "coroutine",
+    ) -> Optional[AsyncHandle]:
+        """Schedule *coro*; return its handle, or None if *key* is in flight.
+
+        After *timeout* seconds the coroutine is cancelled and ``on_error``
+        receives a :class:`TimeoutError`. ``on_result`` receives the
+        coroutine's return value and ``on_error`` the exception it raised;
+        neither runs for a cancelled coroutine.
+        """
+        handle = AsyncHandle(name, key, on_result, on_error)
+        with self._lock:
+            if self._shutdown:
+                coro.close()
+                raise RuntimeError("AsyncCore has been shut down")
+            if key is not None:
+                if key in self._keys:
+                    coro.close()
+                    return None
+                self._keys.add(key)
+        future = asyncio.run_coroutine_threadsafe(
+            self._guard(coro, handle, timeout), self._loop
+        )
+        handle._future = future
+
+        def _settled(fut) -> None:
+            # Backstop for a coroutine cancelled before it ever started:
+            # _guard never ran, so release its key and close it here.
+            if fut.cancelled():
+                coro.close()
+            self._finish(handle)
+
+        future.add_done_callback(_settled)
+        return handle
+
+    def run(
+        self, awaitable: Awaitable[T], timeout: Optional[float] = None
+    ) -> T:
+        """Run *awaitable* on the loop and block until it finishes.
+
+        For worker threads that want a coroutine's result synchronously;
+        never call it from the loop thread itself.
+        """
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("AsyncCore.run() called from the loop thread")
+        future = asyncio.run_coroutine_threadsafe(
+            asyncio.wait_for(awaitable, timeout), self._loop
+        )
+        return future.result()
+
+    def is_running(self, key: Hashable) -> bool:
+        """True while a coroutine submitted with *key* has not finished."""
+        with self._lock:
+            return key in self._keys
+
+    def shutdown(self, wait_ms: int = 5000) -> None:
+        """Cancel every coroutine and stop the loop. Safe to call twice.
+
+        Blocking calls still running in the executor are abandoned, not
+        joined: the executor's threads are daemons.
+        """
+        with self._lock:
+            if self._shutdown:
+                return
+            self._shutdown = True
+        timeout = max(0, wait_ms) / 1000.0
+        drain = asyncio.run_coroutine_threadsafe(_cancel_all(), self._loop)
+        try:
+            drain.result(timeout)
+        except Exception:  # noqa: BLE001 - shutting down regardless
+            logger.warning("AsyncCore did not drain in time", exc_info=True)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout)
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    # -- internal helpers --------------------------------------------
+
+    def _run_loop(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._loop.run_forever()
+        finally:
+            self._loop.close()
+
+    async def _guard(
+        self,
+        coro: Coroutine[Any, Any, Any],
+        handle: AsyncHandle,
+        timeout: Optional[float],
+    ) -> None:
+        kind, payload = "result", None
+        try:
+            payload = await asyncio.wait_for(coro, timeout)
+            handle.result = payload
+        except asyncio.CancelledError:
+            self._finish(handle)
+            raise
+        except TimeoutError as exc:
+            logger.warning(
+                "Coroutine %s timed out after %ss", handle.name, timeout
+            )
+            handle.error = exc
+            kind, payload = "error", exc
+        except Exception as exc:  # noqa: BLE001 - delivered to the caller
+            logger.exception("Coroutine %s failed", handle.name)
+            handle.error = exc
+            kind, payload = "error", exc
+        # Release the key before delivering, so the result's receiver may
+        # submit the next coroutine with the same key straight away.
+        self._finish(handle)
+        self._bridge.delivered.emit(handle, kind, payload)
+
+    def _finish(self, handle: AsyncHandle) -> None:
+        with self._lock:
+            if handle.key is not None:
+                self._keys.discard(handle.key)
+        handle._done.set()
+
+
+async def _cancel_all() -> None:
+    current = asyncio.current_task()
+    tasks = [task for task in asyncio.all_tasks() if task is not current]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def map_blocking(
+    func: Callable[[T], R], items: Iterable[T], limit: int
+) -> list[R]:
+    """``[func(item) for item in items]`` on the executor, *limit* at a time.
+
+    Results keep the order of *items*. If one call raises, the calls not
+    yet started are cancelled and the exception propagates.
+    """
+    gate = asyncio.Semaphore(max(1, int(limit)))
+
+    async def one(item: T) -> R:
+        async with gate:
+            return await asyncio.to_thread(func, item)
+
+    tasks = [asyncio.ensure_future(one(item)) for item in items]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+
+_shared: Optional[AsyncCore] = None
+_shared_lock = threading.Lock()
+
+
+def shared_core() -> AsyncCore:
+    """The application's async core, created on first use (GUI thread)."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = AsyncCore()
+        return _shared
+
+
+def shutdown_shared_core(wait_ms: int = 5000) -> None:
+    """Stop the application's async core, if it was ever created."""
+    global _shared
+    with _shared_lock:
+        core, _shared = _shared, None
+    if core is not None:
+        core.shutdown(wait_ms)
@@ -0,0 +1,140 @@
+"""Pick several CD jobs and confirm each one's material order in one dialog.
+
+Left: the jobs with label files, checkable, dragged into the order their
+stacks should come off the roll (top = peeled first). Right: the material
+stack of the job highlighted on the left, draggable exactly like
+:class:`print_order_dialog.PrintOrderDialog`. One Print click confirms the
+whole batch, which the main window then prints as a single merged sequence
+(:func:`print_sequencer.build_batch_print_sequence`).
+
+Like the single-job dialog this one does not touch :mod:`settings`.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QBrush, QColor
+from PyQt5.QtWidgets import (
+    QAbstractItemView,
+    QDialog,
+    QDialogButtonBox,
+    QHBoxLayout,
+    QLabel,
+    QListWidget,
+    QListWidgetItem,
+    QStackedWidget,
+    QVBoxLayout,
+    QWidget,
+)
+
+from print_order_dialog import PrintOrderDialog
+
+#: ``(job_key, display_name, [(material, count), ...])`` per candidate job.
+BatchCandidate = tuple[str, str, list[tuple[str, int]]]
+
+
+class BatchPrintDialog(QDialog):
+    """Choose jobs for a batch print and confirm their material orders."""
+
+    def __init__(
+        self,
+        candidates: list[BatchCandidate],
+        preselected: tuple[str, ...] = (),
+        parent: Optional[QWidget] = None,
+    ) -> None:
+        super().__init__(parent)
+        self.setWindowTitle("Batch Print Labels")
+        self.resize(760, 520)
+
+        root = QVBoxLayout(self)
+        hint = QLabel(
+            "Tick the jobs to print and drag them into peel order (top job "
+            "comes off the roll first). Select a job to check its material "
+            "order."
+        )
+        hint.setWordWrap(True)
+        root.addWidget(hint)
+
+        columns = QHBoxLayout()
+        root.addLayout(columns, stretch=1)
+
+        self._jobs = QListWidget()
+        self._jobs.setDragDropMode(QAbstractItemView.InternalMove)
+        self._jobs.setDefaultDropAction(Qt.MoveAction)
+        self._jobs.setSelectionMode(QAbstractItemView.SingleSelection)
+        columns.addWidget(self._jobs, stretch=1)
+
+        self._stacks = QStackedWidget()
+        columns.addWidget(self._stacks, stretch=1)
+        self._material_lists: dict[str, QListWidget] = {}
+
+        palette = PrintOrderDialog.default_palette()
+        for key, display, materials in candidates:
+            labels = sum(count for _material, count in materials)
+            item = QListWidgetItem(f"{display}  ({labels} labels)")
+            item.setData(Qt.UserRole, key)
+            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+            item.setCheckState(
+                Qt.Checked if key in preselected else Qt.Unchecked
+            )
+            self._jobs.addItem(item)
+
+            stack = QListWidget()
+            stack.setDragDropMode(QAbstractItemView.InternalMove)
+            stack.setDefaultDropAction(Qt.MoveAction)
+            for index, (material, count) in enumerate(materials):
+                row = QListWidgetItem(f"  {material}   -   {count}")
+                row.setData(Qt.UserRole, material)
+                row.setBackground(QBrush(palette[index % len(palette)]))
+                row.setForeground(QBrush(QColor(30, 30, 30)))
+                stack.addItem(row)
+            self._stacks.addWidget(stack)
+            self._material_lists[key] = stack
+
+        self._jobs.currentItemChanged.connect(self._show_job)
+        self._jobs.itemChanged.connect(lambda _item: self._update_ok())
+
+        buttons = QDialogButtonBox(
+            QDialogButtonBox.Ok | QDialogButtonBox.Cancel
+        )
+        self._ok_button = buttons.button(QDialogButtonBox.Ok)
+        self._ok_button.setText("Print Batch")
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        root.addWidget(buttons)
+
+        if self._jobs.count():
+            self._jobs.setCurrentRow(0)
+        self._update_ok()
+
+    # -- public API --------------------------------------------------------
+
+    def selected_jobs(self) -> list[tuple[str, tuple[str, ...]]]:
+        """Checked jobs in peel order, each with its material order."""
+        chosen: list[tuple[str, tuple[str, ...]]] = []
+        for row in range(self._jobs.count()):
+            item = self._jobs.item(row)
+            if item.checkState() != Qt.Checked:
+                continue
+            key = str(item.data(Qt.UserRole))
+            stack = self._material_lists[key]
+            materials = tuple(
+                str(stack.item(i).data(Qt.UserRole))
+                for i in range(stack.count())
+            )
+            chosen.append((key, materials))
+        return chosen
+
+    # -- internal helpers --------------------------------------------------
+
+    def _show_job(self, current: Optional[QListWidgetItem], _previous) -> None:
+        if current is None:
+            return
+        stack = self._material_lists.get(str(current.data(Qt.UserRole)))
+        if stack is not None:
+            self._stacks.setCurrentWidget(stack)
+
+    def _update_ok(self) -> None:
+        self._ok_button.setEnabled(len(self.selected_jobs()) > 0)
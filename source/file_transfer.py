@@ -14,8 +14,16 @@ current job's label data, so ``Label Data`` is emptied before the new
 ``Pix`` is a merge: images are copied over, but files whose size and mtime
 already match the source are skipped (re-transfers of the same job would
 otherwise re-pull every image over the network for nothing).
+
+When a :class:`transfer_journal.TransferJournal` is supplied the transfer is
+also **resumable**: the staging folder gets a stable per-job name and is
+kept when staging fails, every staged label file is journaled, and large
+files (label or image) are copied through a ``.partial`` file. Pressing
+"Transfer Files" again after a dropped share or a closed app then skips what
+already arrived and picks large files up from the last byte written.
 """
 
+import hashlib
 import logging
 import os
 import shutil
@@ -25,6 +33,14 @@ from pathlib import Path
 from PyQt5.QtCore import QThread, pyqtSignal
 
 from transfer_common import describe_failure, files_identical
+from transfer_journal import (
+    PARTIAL_SUFFIX,
+    RESUME_MIN_BYTES,
+    TransferJournal,
+    copy_resumable,
+    identity_matches,
+    source_identity,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -40,11 +56,20 @@ class FileTransferThread(QThread):
         mdb_files: tuple[str, ...],
         wmf_files: tuple[str, ...],
         dest_base: str = r"C:\CADCode",
+        journal: TransferJournal | None = None,
+        job_key: str = "",
     ) -> None:
         super().__init__()
         self._mdb_files = mdb_files
         self._wmf_files = wmf_files
         self._dest_base = Path(dest_base)
+        # Resume support is opt-in: without a journal (and a key to file the
+        # job under) the transfer behaves exactly as a one-shot copy.
+        self._journal = journal if job_key else None
+        self._job_key = job_key
+        # Journal's finished-file records for the staging dir, read once
+        # per run rather than once per staged file.
+        self._completed: dict = {}
 
     # ------------------------------------------------------------------
     # Steps (split out so each failure mode is separately reportable)
@@ -70,6 +95,103 @@ class FileTransferThread(QThread):
                 )
         return None
 
+    def _journal_dest(self, dest: Path) -> str:
+        """Journal destination key: the folder a file is being copied into."""
+        return str(dest.parent)
+
+    def _journal_call(self, action: str, *args):
+        """Run one journal method; bookkeeping trouble only turns resume off.
+
+        The journal is an optimisation. A full disk or a locked journal file
+        must not fail a copy that itself succeeded, so an ``OSError`` here is
+        logged, the journal is dropped for the rest of the run, and the
+        transfer carries on as a one-shot copy.
+        """
+        if self._journal is None:
+            return None
+        try:
+            return getattr(self._journal, action)(self._job_key, *args)
+        except OSError:
+            logger.warning(
+                "Transfer journal unavailable; resume disabled for this run",
+                exc_info=True,
+            )
+            self._journal = None
+            return None
+
+    def _already_transferred(self, src: str, dest: Path) -> bool:
+        """True if a previous, interrupted run already delivered *src*.
+
+        Checks against the snapshot loaded once at the start of staging, and
+        costs one stat of the source, which is what detects a file edited on
+        S: since the interrupted run.
+        """
+        if self._journal is None or not dest.exists():
+            return False
+        try:
+            identity = source_identity(src)
+        except OSError:
+            return False  # the copy itself reports the missing source
+        return identity_matches(self._completed.get(src), identity)
+
+    def _copy_file(
+        self, src: str, dest: Path, record_complete: bool = True
+    ) -> None:
+        """Copy one file, journaled and byte-resumable when a journal is set.
+
+        ``record_complete`` False (Pix) skips the per-file "complete" write —
+        Pix already skips unchanged images by size and mtime — so only large
+        files touch the journal, to make their ``.partial`` resumable.
+        """
+        if self._journal is None:
+            shutil.copy2(src, dest)
+            return
+
+        identity = source_identity(src)
+        journal_dest = self._journal_dest(dest)
+        chunked = identity[0] >= RESUME_MIN_BYTES
+        if not chunked:
+            shutil.copy2(src, dest)
+        else:
+            resume = bool(self._journal_call(
+                "can_resume_partial", journal_dest, src, identity
+            ))
+            if not resume:
+                self._journal_call("mark_partial", journal_dest, src, identity)
+            offset = copy_resumable(src, str(dest), resume=resume)
+            if offset:
+                logger.info(
+                    "Resumed %s at byte %d of %d", src, offset, identity[0]
+                )
+        if record_complete:
+            self._journal_call("mark_complete", journal_dest, src, identity)
+        elif chunked:
+            self._journal_call("forget_partial", journal_dest, src)
+
+    def _make_staging_dir(self, label_dir: Path) -> Path:
+        """Create the staging folder for this run.
+
+        One-shot transfers get a throwaway temp dir. Journaled transfers use
+        a stable name derived from the job key, so the files staged before
+        an interruption are still there next time; staging folders left by
+        OTHER jobs are removed, since only one job's label data is ever
+        installed.
+        """
+        if self._journal is None:
+            return Path(tempfile.mkdtemp(prefix=".staging_", dir=label_dir))
+
+        digest = hashlib.sha1(self._job_key.encode("utf-8")).hexdigest()[:12]
+        staging_dir = label_dir / f".staging_resume_{digest}"
+        for item in os.scandir(label_dir):
+            if (
+                item.is_dir()
+                and item.name.startswith(".staging_")
+                and item.name != staging_dir.name
+            ):
+                shutil.rmtree(item.path, ignore_errors=True)
+        staging_dir.mkdir(exist_ok=True)
+        return staging_dir
+
     def _stage_mdb_files(self, staging_dir: Path) -> list[str]:
         """Copy every .mdb into the staging dir. Returns failure lines."""
         failures: list[str] = []
@@ -78,11 +200,14 @@ class FileTransferThread(QThread):
             if self.isInterruptionRequested():
                 failures.append("Cancelled by user.")
                 return failures
+            dest = staging_dir / Path(src).name
+            if self._already_transferred(src, dest):
+                continue
             self.progress.emit(
                 f"Copying label file {index} of {total}: {Path(src).name}"
             )
             try:
-                shutil.copy2(src, staging_dir / Path(src).name)
+                self._copy_file(src, dest)
             except Exception as exc:  # noqa: BLE001 - reported per file
                 logger.exception("Failed to stage %s", src)
                 failures.append(
@@ -93,9 +218,29 @@ class FileTransferThread(QThread):
                 return failures
         return failures
 
+    def _prune_staging_dir(self, staging_dir: Path) -> None:
+        """Remove anything in the staging dir this job did not stage.
+
+        A resumable staging dir outlives a run, so it can hold a ``.partial``
+        left by an interrupted copy, or a file the job no longer lists
+        because the .mdb set on S: changed between attempts. Neither may be
+        installed into Label Data.
+        """
+        expected = {Path(src).name for src in self._mdb_files}
+        for item in os.scandir(staging_dir):
+            if item.is_dir():
+                shutil.rmtree(item.path, ignore_errors=True)
+            elif (
+                item.name not in expected
+                or item.name.endswith(PARTIAL_SUFFIX)
+            ):
+                logger.info("Discarding stale staged file %s", item.name)
+                os.unlink(item.path)
+
     def _commit_label_data(self, label_dir: Path, staging_dir: Path) -> None:
         """Replace Label Data's contents with the staged files."""
         self.progress.emit("Installing new label data...")
+        self._prune_staging_dir(staging_dir)
         for item in os.scandir(label_dir):
             if item.is_file():
                 os.unlink(item.path)
@@ -122,7 +267,7 @@ class FileTransferThread(QThread):
                 f"Copying image {index} of {total}: {Path(src).name}"
             )
             try:
-                shutil.copy2(src, dest)
+                self._copy_file(src, dest, record_complete=False)
                 copied += 1
             except Exception as exc:  # noqa: BLE001 - collected per file
                 logger.exception("Failed to copy %s", src)
@@ -148,11 +293,20 @@ class FileTransferThread(QThread):
 
             # Phase 1: stage. The old label data is untouched until every
             # new file has arrived safely.
-            staging_dir = Path(
-                tempfile.mkdtemp(prefix=".staging_", dir=label_dir)
-            )
+            staging_dir = self._make_staging_dir(label_dir)
+            self._completed = self._journal_call(
+                "completed_files", str(staging_dir)
+            ) or {}
+            if self._completed:
+                self.progress.emit(
+                    f"Resuming transfer — {len(self._completed)} file(s) "
+                    "already copied"
+                )
             stage_failures = self._stage_mdb_files(staging_dir)
             if stage_failures:
+                if self._journal is not None:
+                    # Keep what arrived: the next attempt resumes from here.
+                    staging_dir = None
                 self.finished.emit(
                     False,
                     "Label transfer stopped — the old label data is "
@@ -162,6 +316,7 @@ class FileTransferThread(QThread):
 
             # Phase 2: commit (local, near-instant).
             self._commit_label_data(label_dir, staging_dir)
+            self._journal_call("clear", str(staging_dir))
 
             copied, skipped, pix_failures = self._copy_pix_files(pix_dir)
 
@@ -175,6 +330,8 @@ class FileTransferThread(QThread):
                 )
                 return
 
+            self._journal_call("clear", str(pix_dir))
+
             summary = f"Transferred {mdb_total} label files"
             if copied or skipped:
                 summary += f" and {copied} images"
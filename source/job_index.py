@@ -0,0 +1,325 @@
+"""Shared job index: one PC scans ``S:\\Jobs``, the others read its result.
+
+Every workshop PC used to walk the whole share on its own refresh timer —
+four machines, four times the SMB load, all for the same answer. In the
+cooperative mode one machine at a time holds a *lease* and publishes what
+it scanned; the others read that single file instead of scanning.
+
+Two files live in the jobs root:
+
+``.jobindex.lease``
+    ``{"holder", "seq", "renewed"}``. The holder rewrites it with the next
+    ``seq`` after every refresh whose scan succeeded and was published, so
+    a holder whose scans keep failing stops renewing and is replaced. A
+    missing lease is claimed with an exclusive create. A lease whose ``(holder, seq)`` has not changed for
+    ``lease_ttl_s`` — measured on the *reader's* clock, so clock skew
+    between PCs does not matter — is stale and is taken over.
+``.jobindex``
+    The holder's latest scan: format version, a write counter, the
+    holder, a digest of the content and every job with its file lists.
+    Rewritten (atomically) only when the digest changes.
+
+Readers stat ``.jobindex`` on each refresh and parse it only when its
+stamp (mtime and size) changes. A reader that finds no usable index —
+none written yet, unreadable, or an unknown format — scans for itself that
+once, exactly as in the standalone mode.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import socket
+import tempfile
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Optional
+
+from job_scanner import Job
+from job_types import JobFiles, JobType
+from task_executor import Task
+
+logger = logging.getLogger(__name__)
+
+#: Where the lease and the index live.
+DEFAULT_JOBS_ROOT = r"S:\Jobs"
+
+#: Bump when the index layout changes; readers ignore other formats.
+INDEX_FORMAT = 1
+
+#: Seconds without a lease renewal before another PC takes over. Well
+#: above the longest adaptive refresh interval, so an idle holder keeps it.
+DEFAULT_LEASE_TTL_S = 180.0
+
+_LEASE_FILE = ".jobindex.lease"
+_INDEX_FILE = ".jobindex"
+
+#: ``() -> (active_jobs, printed_jobs)``
+ScanFn = Callable[[], tuple[list, list]]
+
+
+def default_holder_id() -> str:
+    """This process's name in the lease: ``host:pid``."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _job_to_dict(job: Job) -> dict[str, Any]:
+    return {
+        "name": job.name,
+        "path": job.path,
+        "job_type": job.job_type.name,
+        "files": {
+            "nc": list(job.files.nc_files),
+            "mdb": list(job.files.mdb_files),
+            "wmf": list(job.files.wmf_files),
+            "ljd": list(job.files.ljd_files),
+            "emf": list(job.files.emf_files),
+        },
+        "source_folder": job.source_folder,
+        "display_name": job.display_name,
+        "is_printed": job.is_printed,
+    }
+
+
+def _job_from_dict(data: dict[str, Any]) -> Job:
+    files = data["files"]
+    return Job(
+        name=str(data["name"]),
+        path=str(data["path"]),
+        job_type=JobType[data["job_type"]],
+        files=JobFiles(
+            nc_files=tuple(files["nc"]),
+            mdb_files=tuple(files["mdb"]),
+            wmf_files=tuple(files["wmf"]),
+            ljd_files=tuple(files["ljd"]),
+            emf_files=tuple(files["emf"]),
+        ),
+        source_folder=str(data["source_folder"]),
+        display_name=str(data.get("display_name", "")),
+        is_printed=bool(data.get("is_printed", False)),
+    )
+
+
+class JobIndex:
+    """One PC's side of the cooperative scan. Thread-safe."""
+
+    def __init__(
+        self,
+        scan: ScanFn,
+        jobs_root: str = DEFAULT_JOBS_ROOT,
+        holder_id: Optional[str] = None,
+        lease_ttl_s: float = DEFAULT_LEASE_TTL_S,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._scan = scan
+        self._root = jobs_root
+        self._lease_path = os.path.join(jobs_root, _LEASE_FILE)
+        self._index_path = os.path.join(jobs_root, _INDEX_FILE)
+        self.holder_id = holder_id or default_holder_id()
+        self._ttl = float(lease_ttl_s)
+        self._clock = clock
+        self._lock = threading.Lock()
+        # (holder, seq) of the lease last seen, and when it was first seen.
+        self._seen_lease: Optional[tuple[str, int]] = None
+        self._seen_since = 0.0
+        self._seq = 0
+        self._written_digest: Optional[str] = None
+        self._written_version = 0
+        self._read_stamp: Optional[tuple[int, int]] = None
+        self._read_result: Optional[tuple[list, list]] = None
+        #: What the last refresh did: "writer", "reader" or "fallback".
+        self.role = ""
+
+    def refresh(self) -> tuple[list, list]:
+        """One refresh: scan and publish as the holder, otherwise read.
+
+        Returns ``(active_jobs, printed_jobs)``. Scan errors propagate, as
+        from the plain scan.
+        """
+        with self._lock:
+            if self._hold_lease():
+                self.role = "writer"
+                # Renewed only once the scan is out: a holder that cannot
+                # scan must let the lease go stale, or every reader keeps
+                # serving its last index forever.
+                result = self._scan()
+                if self._publish(result):
+                    self._renew_lease()
+                return result
+            cached = self._read_index()
+            if cached is not None:
+                self.role = "reader"
+                return cached
+            self.role = "fallback"
+            return self._scan()
+
+    # -- lease --------------------------------------------------------
+
+    def _hold_lease(self) -> bool:
+        """Keep, claim or take over the lease; True if this PC holds it.
+
+        Keeping it writes nothing: :meth:`_renew_lease` does, after the
+        scan.
+        """
+        lease = self._read_lease()
+        if lease is None:
+            return self._claim_lease()
+        holder, seq = lease
+        if holder == self.holder_id:
+            self._seq = max(seq, self._seq)
+            return True
+        now = self._clock()
+        if lease != self._seen_lease:
+            self._seen_lease, self._seen_since = lease, now
+            return False
+        if now - self._seen_since < self._ttl:
+            return False
+        logger.warning(
+            "Job index lease of %s went stale; taking over", holder
+        )
+        if not self._write_lease(seq + 1):
+            return False
+        # Another PC may have taken over at the same moment: whoever's
+        # write landed last holds the lease.
+        lease = self._read_lease()
+        return lease is not None and lease[0] == self.holder_id
+
+    def _read_lease(self) -> Optional[tuple[str, int]]:
+        try:
+            with open(self._lease_path, "r", encoding="utf-8") as fh:
+                data = json.load(fh)
+            return str(data["holder"]), int(data["seq"])
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError):
+            # Unreadable right now (e.g. mid-create): treat it as held by
+            # an unknown PC, which goes stale like any other lease.
+            return ("", -1)
+
+    def _lease_text(self, seq: int) -> str:
+        return json.dumps({
+            "holder": self.holder_id,
+            "seq": seq,
+            "renewed": datetime.now().isoformat(timespec="seconds"),
+        })
+
+    def _claim_lease(self) -> bool:
+        try:
+            fd = os.open(
+                self._lease_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY
+            )
+        except OSError:
+            return False  # someone else got there first, or no share
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            fh.write(self._lease_text(1))
+        self._seq = 1
+        logger.info("Claimed the job index lease as %s", self.holder_id)
+        return True
+
+    def _renew_lease(self) -> None:
+        """Bump the lease's ``seq`` unless another PC took it over meanwhile."""
+        lease = self._read_lease()
+        if lease is None or lease[0] != self.holder_id:
+            return
+        self._write_lease(max(lease[1], self._seq) + 1)
+
+    def _write_lease(self, seq: int) -> bool:
+        try:
+            self._write_atomic(self._lease_path, self._lease_text(seq))
+        except OSError:
+            logger.warning("Cannot write job index lease", exc_info=True)
+            return False
+        self._seq = seq
+        return True
+
+    # -- index --------------------------------------------------------
+
+    def _publish(self, result: tuple[list, list]) -> bool:
+        """Write *result* as the index; False if it could not be written."""
+        active, printed = result
+        jobs = {
+            "active": [_job_to_dict(job) for job in active],
+            "printed": [_job_to_dict(job) for job in printed],
+        }
+        body = json.dumps(jobs, sort_keys=True, ensure_ascii=False)
+        digest = hashlib.blake2b(body.encode("utf-8"), digest_size=16).hexdigest()
+        if digest == self._written_digest:
+            return True
+        self._written_version += 1
+        document = {
+            "format": INDEX_FORMAT,
+            "version": self._written_version,
+            "holder": self.holder_id,
+            "written": datetime.now().isoformat(timespec="seconds"),
+            "digest": digest,
+            **jobs,
+        }
+        try:
+            self._write_atomic(
+                self._index_path, json.dumps(document, ensure_ascii=False)
+            )
+        except OSError:
+            logger.warning("Cannot write job index", exc_info=True)
+            return False
+        self._written_digest = digest
+        return True
+
+    def _read_index(self) -> Optional[tuple[list, list]]:
+        """The published scan, re-parsed only when its file changed."""
+        try:
+            st = os.stat(self._index_path)
+        except OSError:
+            return None
+        stamp = (st.st_mtime_ns, st.st_size)
+        if stamp == self._read_stamp and self._read_result is not None:
+            return self._read_result
+        try:
+            with open(self._index_path, "r", encoding="utf-8") as fh:
+                data = json.load(fh)
+            if data.get("format") != INDEX_FORMAT:
+                logger.warning(
+                    "Ignoring job index in format %r", data.get("format")
+                )
+                return None
+            result = (
+                [_job_from_dict(d) for d in data["active"]],
+                [_job_from_dict(d) for d in data["printed"]],
+            )
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            logger.warning("Ignoring unreadable job index: %s", exc)
+            return None
+        self._read_stamp, self._read_result = stamp, result
+        return result
+
+    def _write_atomic(self, path: str, text: str) -> None:
+        """Atomically replace *path* with *text*."""
+        fd, tmp_path = tempfile.mkstemp(
+            dir=self._root, suffix=".tmp", prefix=".jobindex_"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                fh.write(text)
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+
+class IndexedScanTask(Task):
+    """Executor task refreshing through a :class:`JobIndex`.
+
+    Returns ``(active_jobs, printed_jobs)`` like
+    :class:`job_scan_worker.ScanJobsTask`.
+    """
+
+    name = "job scan (shared index)"
+
+    def __init__(self, index: JobIndex) -> None:
+        self._index = index
+
+    def run(self, token, progress) -> tuple[list, list]:
+        return self._index.refresh()
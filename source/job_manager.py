@@ -4,10 +4,17 @@ Manages job files from S drive for Continental Kitchens workshop.
 Supports Cabinetry Online and Custom Design job workflows.
 """
 
+from __future__ import annotations
+
+# First, so the startup timeline's clock covers every import below.
+from startup_timeline import STARTUP  # isort: skip
+
 import logging
+import multiprocessing
 import os
 import sys
-from typing import Optional
+import time
+from typing import TYPE_CHECKING, Optional
 
 try:
     import winsound  # type: ignore[import-not-found]
@@ -17,24 +24,21 @@ except ImportError:  # pragma: no cover - non-Windows hosts (dev boxes, CI)
     # window. Sound is cosmetic, so its absence is a silent no-op.
     winsound = None  # type: ignore[assignment]
 
-from PyQt5 import uic
-from PyQt5.QtCore import QEvent, QTimer, pyqtSignal
+from PyQt5.QtCore import QEvent, Qt, QTimer, pyqtSignal
 from PyQt5.QtGui import QIcon
 from PyQt5.QtWidgets import (
     QApplication,
     QDialog,
+    QDockWidget,
     QInputDialog,
     QMainWindow,
     QMessageBox,
     QPushButton,
 )
 
-import preflight
-import print_sequencer
 import printer_service
 from drop_zone import DropZone
-from file_transfer import FileTransferThread
-from job_scan_worker import JobScanThread
+from job_scan_worker import ScanJobsTask
 from job_scanner import (
     PRINTED_DIR,
     Job,
@@ -49,24 +53,62 @@ from job_types import (
     detect_job_type,
     scan_folder_files,
 )
-from label_printer import LabelPrinterThread
-from move_job import MoveJobThread
-from preflight import check_cadcode_free_space
-from print_order_dialog import PrintOrderDialog
+from operation_queue import (
+    CADCODE_RESOURCE,
+    DEFAULT_PRINTER_RESOURCE,
+    MOVE_OPERATION,
+    PRINT_OPERATION,
+    TRANSFER_OPERATION,
+    USB_OPERATION,
+    OperationQueue,
+    job_resource,
+    printer_resource,
+    usb_resource,
+)
+from print_run_record import PrintRunRecord
 from printer_status_widget import PrinterStatusWidget
+from queue_panel import OperationQueuePanel
+from refresh_scheduler import RefreshScheduler
 from settings import AppSettings, load_settings, save_settings, update_settings
-from settings_dialog import SettingsDialog
+from task_executor import (
+    TaskHandle,
+    shared_executor,
+    shutdown_shared_executor,
+)
 from transfer_history import TransferHistory
+from transfer_journal import TransferJournal
 from ui_font import apply_ui_font_size
 from update_flow import UpdateFlow
 from updater import CURRENT_VERSION
-from usb_transfer import USBTransferThread, detect_usb_drives
+
+try:
+    # Generated from job_manager.ui by job_manager.spec at build time. A
+    # source checkout has no generated module and parses the .ui at runtime.
+    from job_manager_ui import Ui_MainWindow  # type: ignore[import-not-found]
+except ImportError:
+    Ui_MainWindow = None
+
+# Dialogs, operation workers, the print sequencer and the optional scan
+# back ends are imported where they are first used: none of them is needed
+# to put the window on screen, and together they were most of the import
+# time in front of the first paint.
+if TYPE_CHECKING:
+    import preflight
+    from async_core import AsyncHandle
+    from file_transfer import FileTransferThread
+    from job_index import JobIndex
+    from sequence_plan import PlanPrefetchThread
+    from usb_transfer import USBTransferThread
+
+STARTUP.mark("imports")
 
 logger = logging.getLogger(__name__)
 
 DEST_PATH = r"C:\CADCode"
 PRINTED_PATH = PRINTED_DIR  # re-export for any external callers that import PRINTED_PATH
-AUTO_REFRESH_MS = 5000  # Poll S drive every 5 seconds
+AUTO_REFRESH_MS = 5000  # Poll S drive every 5 seconds (fixed interval)
+_SCAN_TASK_KEY = "job-scan"  # at most one job scan in flight
+_SCAN_TIMEOUT_S = 60.0  # a concurrent scan still running by then is cancelled
 
 # Module-level alias so tests can monkeypatch the migration seam without
 # reaching into job_scanner.
@@ -80,6 +122,26 @@ def _resource_path(filename: str) -> str:
     return os.path.join(os.path.dirname(os.path.abspath(__file__)), filename)
 
 
+def _setup_main_window_ui(window: QMainWindow) -> None:
+    """Build the main window's widgets onto *window*.
+
+    Prefers the precompiled UI: ``uic.loadUi`` parses the XML and resolves
+    every widget class at runtime, on the startup path.
+    """
+    if Ui_MainWindow is None:
+        from PyQt5 import uic
+
+        uic.loadUi(_resource_path("job_manager.ui"), window)
+        return
+    ui = Ui_MainWindow()
+    ui.setupUi(window)
+    # loadUi sets each named widget as an attribute of the window itself;
+    # the generated class sets them on the Ui object. Copy them across so
+    # the window code works the same either way.
+    for name, widget in vars(ui).items():
+        setattr(window, name, widget)
+
+
 def _beep(success: bool) -> None:
     """Play the OK / error system sound, if the platform provides one."""
     if winsound is None:
@@ -99,7 +161,10 @@ class JobManager(QMainWindow):
     def __init__(self) -> None:
         super().__init__()
 
-        uic.loadUi(_resource_path("job_manager.ui"), self)
+        _setup_main_window_ui(self)
+        STARTUP.mark("ui")
+        # Removed again by eventFilter on the first paint.
+        self.installEventFilter(self)
 
         icon_path = _resource_path("icon.ico")
         if os.path.exists(icon_path):
@@ -114,6 +179,7 @@ class JobManager(QMainWindow):
 
         # Data stores
         self._history = TransferHistory()
+        self._run_record = PrintRunRecord()
         self._active_jobs: list[Job] = []
         self._printed_jobs: list[Job] = []
         self._dropped_jobs: dict[str, Job] = {}
@@ -130,7 +196,14 @@ class JobManager(QMainWindow):
         self._updates = UpdateFlow(self, self.statusbar)
 
         # In-flight background scan, if any.
-        self._scan_thread: Optional[JobScanThread] = None
+        self._executor = shared_executor()
+        self._scan_handle: Optional[TaskHandle | AsyncHandle] = None
+        # Chooses the refresh interval when adaptive_refresh is on; fed
+        # with each scan's outcome and duration.
+        self._refresh_scheduler = RefreshScheduler()
+        self._scan_started: Optional[float] = None
+        # Cooperative scanning with the other PCs, created on first use.
+        self._job_index: Optional[JobIndex] = None
 
         # The one long operation allowed at a time (transfer / print / USB
         # copy / folder move). While it runs, self._busy is True and every
@@ -140,6 +213,21 @@ class JobManager(QMainWindow):
         # and crash the app, so the gate is load-bearing, not cosmetic.
         self._busy = False
         self._active_thread = None
+        # Latest per-printer progress line while a print farm run is active.
+        self._farm_progress: dict[str, str] = {}
+        # Timing line of the print run that just ended, shown instead of
+        # "Ready" once its finished handler runs.
+        self._timing_summary = ""
+        # Background parse of the selected CD job's labels (one at a time;
+        # a selection made meanwhile is picked up when it finishes).
+        self._plan_thread: Optional[PlanPrefetchThread] = None
+        self._plan_pending = False
+
+        # Operations queued across jobs run back-to-back (and side by side
+        # when they need different resources) without the UI going busy.
+        # The queue is paused while an interactive operation runs.
+        self._queue = OperationQueue(parent=self)
+        self._queue.itemFinished.connect(self._on_queue_item_finished)
 
         # Printer status tracked via PrinterStatusWidget; assume offline
         # until the first poll reports otherwise. This is consulted by
@@ -173,7 +261,7 @@ class JobManager(QMainWindow):
         # Auto-refresh timer
         self._refresh_timer = QTimer(self)
         self._refresh_timer.timeout.connect(self._auto_refresh)
-        self._refresh_timer.start(AUTO_REFRESH_MS)
+        self._refresh_timer.start(self._refresh_interval_ms())
 
         QTimer.singleShot(2000, lambda: self._updates.check(force=False))
 
@@ -238,6 +326,13 @@ class JobManager(QMainWindow):
         settings_action = settings_menu.addAction("Print Settings...")
         settings_action.triggered.connect(self._on_settings_triggered)
 
+        print_menu = self.menuBar().addMenu("&Print")
+        print_menu.addAction("Batch Print Labels...", self._batch_print)
+        print_menu.addAction("Resume Print...", self._resume_print)
+        print_menu.addAction("Reprint Labels...", self._reprint_labels)
+
+        self._setup_queue_ui()
+
         # Help menu. The lambda matters: QAction.triggered passes a checked
         # bool that would otherwise land in the force parameter.
         help_menu = self.menuBar().addMenu("Help")
@@ -247,7 +342,31 @@ class JobManager(QMainWindow):
         )
         help_menu.addAction("About", self._show_about)
 
-        self.statusbar.showMessage("Ready")
+        if self._run_record.has_unfinished():
+            self.statusbar.showMessage(
+                "The last print run did not finish — Print > Resume Print "
+                "continues it"
+            )
+        else:
+            self.statusbar.showMessage("Ready")
+
+    def _setup_queue_ui(self) -> None:
+        """Build the Queue menu and the (initially hidden) queue dock."""
+        self._queue_panel = OperationQueuePanel(self._queue, parent=self)
+        self._queue_dock = QDockWidget("Operation Queue", self)
+        self._queue_dock.setObjectName("operationQueueDock")
+        self._queue_dock.setWidget(self._queue_panel)
+        self.addDockWidget(Qt.BottomDockWidgetArea, self._queue_dock)
+        self._queue_dock.hide()
+
+        queue_menu = self.menuBar().addMenu("&Queue")
+        queue_menu.addAction("Queue Transfer", self._queue_transfer)
+        queue_menu.addAction("Queue NC Copy to USB", self._queue_copy_nc)
+        queue_menu.addAction("Queue Print Labels", self._queue_print)
+        queue_menu.addAction("Queue Move to Printed", self._queue_move)
+        queue_menu.addSeparator()
+        queue_menu.addAction("Show Queue", self._queue_dock.show)
+        queue_menu.addAction("Cancel All Queued", self._queue.cancel_all)
 
     # -- Printer status widget -------------------------------------------
 
@@ -275,6 +394,7 @@ class JobManager(QMainWindow):
             poll_interval_ms=self._settings.status_poll_interval_ms,
             printer_name=self._settings.zebra_printer_name,
             parent=self,
+            event_driven=self._settings.printer_change_notifications,
         )
         widget.statusChanged.connect(self._on_printer_status_changed)
 
@@ -321,6 +441,7 @@ class JobManager(QMainWindow):
         spooler.
         """
         self._busy = busy
+        self._queue.set_paused(busy)
         enabled = not busy
         self.refreshButton.setEnabled(enabled)
         self.jobTreeWidget.setEnabled(enabled)
@@ -338,7 +459,9 @@ class JobManager(QMainWindow):
             # e.g. light up Print Labels for a job with no label files.
             self._on_selection_changed()
             # Catch up on anything that changed on disk while we were busy —
-            # scan results that arrived mid-operation were discarded.
+            # scan results that arrived mid-operation were discarded. An
+            # operation just changed things, so poll quickly for a while.
+            self._refresh_scheduler.note_activity()
             self.refresh_jobs()
 
         self._sync_polling()
@@ -361,12 +484,12 @@ class JobManager(QMainWindow):
         """
         active = not getattr(self, "_busy", False) and not self.isMinimized()
 
-        # getattr: Qt can deliver events during uic.loadUi, before __init__
+        # getattr: Qt can deliver events while the UI is being built, before __init__
         # has finished assigning our own attributes.
         timer = getattr(self, "_refresh_timer", None)
         if timer is not None:
             if active and not timer.isActive():
-                timer.start(AUTO_REFRESH_MS)
+                timer.start(self._refresh_interval_ms())
             elif not active and timer.isActive():
                 timer.stop()
 
@@ -380,6 +503,13 @@ class JobManager(QMainWindow):
             except Exception:  # noqa: BLE001 - polling is never load-bearing
                 logger.exception("Failed to toggle printer status polling")
 
+    def eventFilter(self, obj, event) -> bool:  # noqa: N802 - Qt override
+        """Record the window's first paint on the startup timeline."""
+        if obj is self and event.type() == QEvent.Paint:
+            STARTUP.mark("first paint")
+            self.removeEventFilter(self)
+        return super().eventFilter(obj, event)
+
     def changeEvent(self, event) -> None:  # noqa: N802 - Qt override
         """Re-evaluate polling when the window is minimised or restored.
 
@@ -389,9 +519,49 @@ class JobManager(QMainWindow):
         super().changeEvent(event)
         if event.type() == QEvent.WindowStateChange:
             self._sync_polling()
+        elif (
+            event.type() == QEvent.ActivationChange
+            and self.isActiveWindow()
+            and getattr(self, "_settings", None) is not None
+            and self._settings.adaptive_refresh
+        ):
+            # Coming back to the window is when stale data would be seen:
+            # refresh now instead of at the end of a long idle interval.
+            self._note_user_activity()
+            self.refresh_jobs()
 
     # -- Auto-refresh --
 
+    def _refresh_interval_ms(self) -> int:
+        """Delay before the next automatic refresh."""
+        if self._settings.adaptive_refresh:
+            return self._refresh_scheduler.next_delay_ms()
+        return AUTO_REFRESH_MS
+
+    def _rearm_refresh_timer(self) -> None:
+        """Restart a running refresh timer with the current interval."""
+        timer = getattr(self, "_refresh_timer", None)
+        if timer is not None and timer.isActive():
+            timer.start(self._refresh_interval_ms())
+
+    def _note_user_activity(self) -> None:
+        """Switch the adaptive refresh back to its fast interval."""
+        self._refresh_scheduler.note_activity()
+        self._rearm_refresh_timer()
+
+    def _note_scan_outcome(self, changed: bool = False, failed: bool = False) -> None:
+        """Feed a finished scan's outcome and duration to the scheduler."""
+        if self._scan_started is None:
+            return
+        cost = time.monotonic() - self._scan_started
+        self._scan_started = None
+        if failed:
+            self._refresh_scheduler.note_failure(cost)
+        else:
+            self._refresh_scheduler.note_scan(changed, cost)
+        if self._settings.adaptive_refresh:
+            self._rearm_refresh_timer()
+
     def _auto_refresh(self) -> None:
         """Silent refresh that preserves the current selection."""
         self._refresh_preserving_selection()
@@ -424,7 +594,7 @@ class JobManager(QMainWindow):
             # The refresh timer is parked while busy, but a stray call must
             # not add S: load or rebuild the tree under a running operation.
             return
-        if self._scan_thread is not None and self._scan_thread.isRunning():
+        if self._scan_handle is not None and not self._scan_handle.done():
             return
 
         # Only announce scanning when there is nothing on screen yet. On the
@@ -433,23 +603,78 @@ class JobManager(QMainWindow):
         if not self._active_jobs and not self._printed_jobs:
             self.statusbar.showMessage("Scanning jobs...")
 
-        thread = JobScanThread(
-            scan_active=scan_jobs, scan_printed=scan_printed_jobs, parent=self
+        self._scan_started = time.monotonic()
+
+        if self._settings.shared_job_index:
+            # Reads the lease holder's published scan; scans (and
+            # publishes) only while this PC holds the lease.
+            from job_index import IndexedScanTask, JobIndex
+
+            if self._job_index is None:
+                self._job_index = JobIndex(scan=self._scan_for_index)
+            self._scan_handle = self._executor.submit(
+                IndexedScanTask(self._job_index),
+                key=_SCAN_TASK_KEY,
+                on_result=lambda lists: self._on_scan_finished(*lists),
+                on_error=lambda exc: self._on_scan_failed(str(exc)),
+            )
+            return
+
+        if self._settings.isolated_job_scan:
+            # The helper process is killed and replaced if the share hangs
+            # it, so a stuck SMB call cannot hold the scan key forever.
+            from scan_process import HelperScanTask, shared_scan_process
+
+            self._scan_handle = self._executor.submit(
+                HelperScanTask(
+                    shared_scan_process(),
+                    concurrent=self._settings.concurrent_job_scan,
+                ),
+                key=_SCAN_TASK_KEY,
+                on_result=lambda lists: self._on_scan_finished(*lists),
+                on_error=lambda exc: self._on_scan_failed(str(exc)),
+            )
+            return
+
+        if self._settings.concurrent_job_scan:
+            # The async core lists several job folders at once and cancels
+            # the whole scan if the share stops answering.
+            from async_core import shared_core
+            from job_scan_worker import scan_all_jobs_async
+
+            self._scan_handle = shared_core().submit(
+                scan_all_jobs_async(),
+                key=_SCAN_TASK_KEY,
+                timeout=_SCAN_TIMEOUT_S,
+                on_result=lambda lists: self._on_scan_finished(*lists),
+                on_error=lambda exc: self._on_scan_failed(str(exc)),
+                name="job scan",
+            )
+            return
+
+        # A pooled worker runs the scan: no thread is started or torn down
+        # per tick of the refresh timer.
+        self._scan_handle = self._executor.submit(
+            ScanJobsTask(scan_active=scan_jobs, scan_printed=scan_printed_jobs),
+            key=_SCAN_TASK_KEY,
+            on_result=lambda lists: self._on_scan_finished(*lists),
+            on_error=lambda exc: self._on_scan_failed(str(exc)),
         )
-        thread.scanned.connect(self._on_scan_finished)
-        thread.failed.connect(self._on_scan_failed)
-        # Retire the thread once it ends. It is parented to the window, so
-        # without this a new QThread child would accumulate on every tick of
-        # the refresh timer for the lifetime of the process.
-        thread.finished.connect(lambda t=thread: self._retire_scan_thread(t))
-        self._scan_thread = thread
-        thread.start()
 
-    def _retire_scan_thread(self, thread: JobScanThread) -> None:
-        """Drop and delete a finished scan thread."""
-        if self._scan_thread is thread:
-            self._scan_thread = None
-        thread.deleteLater()
+    def _scan_for_index(self) -> tuple[list, list]:
+        """The scan this PC publishes while it holds the job index lease.
+
+        Runs on a pool worker; honours the other scan settings.
+        """
+        from job_scan_worker import scan_all_jobs
+        from scan_process import shared_scan_process
+
+        settings = self._settings
+        if settings.isolated_job_scan:
+            return shared_scan_process().scan(
+                concurrent=settings.concurrent_job_scan
+            )
+        return scan_all_jobs(concurrent=settings.concurrent_job_scan)
 
     def _on_scan_failed(self, _message: str) -> None:
         """Report a failed scan without discarding the jobs already listed.
@@ -458,6 +683,8 @@ class JobManager(QMainWindow):
         next refresh a few seconds later will recover.
         """
         self.statusbar.showMessage("Error: could not read S drive")
+        self._note_scan_outcome(failed=True)
+        STARTUP.mark("first scan")
         self.jobsRefreshed.emit()
 
     def _on_scan_finished(self, active: list, printed: list) -> None:
@@ -491,6 +718,8 @@ class JobManager(QMainWindow):
         self._printed_jobs = list(printed)
 
         changed = self._populate_tree()
+        self._note_scan_outcome(changed=changed)
+        STARTUP.mark("first scan")
 
         # Only refresh the counts when something actually changed, so a
         # running transfer or print keeps its progress message visible.
@@ -553,6 +782,8 @@ class JobManager(QMainWindow):
         # takes file presence into account, but overlays an "offline"
         # tooltip so Marinko understands *why* the button is disabled.
         has_labels = bool(files.ljd_files)
+        if has_labels:
+            self._prefetch_print_plan(job)
         if not has_labels:
             self.printButton.setEnabled(False)
             self.printButton.setToolTip("")
@@ -565,6 +796,31 @@ class JobManager(QMainWindow):
             self.printButton.setEnabled(True)
             self.printButton.setToolTip("")
 
+    def _prefetch_print_plan(self, job: Job) -> None:
+        """Parse *job*'s labels in the background so Print opens instantly."""
+        from sequence_plan import PlanPrefetchThread
+
+        if self._plan_thread is not None:
+            self._plan_pending = True
+            return
+        thread = PlanPrefetchThread(
+            job.files.ljd_files, self._settings.material_priority
+        )
+        thread.finished.connect(self._on_plan_prefetched)
+        self._plan_thread = thread
+        thread.start()
+
+    def _on_plan_prefetched(self) -> None:
+        thread, self._plan_thread = self._plan_thread, None
+        if thread is not None:
+            thread.wait(2000)
+            thread.deleteLater()
+        if self._plan_pending and not self._busy:
+            self._plan_pending = False
+            job = self._selected_job()
+            if job is not None and not job.is_printed and job.files.ljd_files:
+                self._prefetch_print_plan(job)
+
     # -- Double-click to open folder --
 
     def _open_job_folder(self) -> None:
@@ -589,9 +845,25 @@ class JobManager(QMainWindow):
 
     # -- File transfer (CO jobs: .mdb / .wmf) --
 
+    def _queue_blocks_direct_operation(self) -> bool:
+        """Refuse an interactive operation while the queue is working.
+
+        Both would run workers against the same CADCode folder, stick or
+        printer; the queue is the one place that arbitrates those.
+        """
+        if not self._queue.is_active():
+            return False
+        self.statusbar.showMessage(
+            "The operation queue is running — add this to the queue "
+            "instead (Queue menu), or wait for it to finish"
+        )
+        return True
+
     def _transfer_files(self) -> None:
+        from preflight import check_cadcode_free_space
+
         job = self._selected_job()
-        if job is None or self._busy:
+        if job is None or self._busy or self._queue_blocks_direct_operation():
             return
 
         # CADCode free space is a local, bounded check — fine inline. The
@@ -604,11 +876,7 @@ class JobManager(QMainWindow):
             return
 
         self._set_ui_busy(True)
-        self._active_thread = FileTransferThread(
-            mdb_files=job.files.mdb_files,
-            wmf_files=job.files.wmf_files,
-            dest_base=self._dest_path,
-        )
+        self._active_thread = self._make_transfer_thread(job)
         self._active_thread.progress.connect(self._update_status)
         self._active_thread.finished.connect(
             lambda ok, msg, j=job: self._on_operation_finished(
@@ -617,13 +885,212 @@ class JobManager(QMainWindow):
         )
         self._active_thread.start()
 
+    def _make_transfer_thread(self, job: Job) -> FileTransferThread:
+        # Journaled per job, so a transfer cut short by a dropped S: drive
+        # or a closed app resumes where it stopped on the next click.
+        from file_transfer import FileTransferThread
+
+        return FileTransferThread(
+            mdb_files=job.files.mdb_files,
+            wmf_files=job.files.wmf_files,
+            dest_base=self._dest_path,
+            journal=TransferJournal(),
+            job_key=job.name,
+        )
+
     # -- Label printing (CD jobs: .ljd) --
 
     def _print_labels(self) -> None:
         job = self._selected_job()
-        if job is None or self._busy:
+        if job is None or self._busy or self._queue_blocks_direct_operation():
             return
 
+        prepared = self._prepare_print(job)
+        if prepared is None:
+            return
+        sequence, zebra = prepared
+
+        self._start_print_worker(
+            sequence,
+            zebra,
+            [(job.name, job.job_type.name)],
+            lambda ok, msg, j=job: self._on_operation_finished(
+                ok, msg, "printed", j
+            ),
+        )
+
+    def _start_print_worker(
+        self,
+        sequence: list,
+        zebra: str,
+        jobs: list[tuple[str, str]],
+        on_finished,
+        start_index: int = 0,
+        record_run: bool = True,
+    ) -> None:
+        """Run *sequence* as the active operation (one printer or the farm).
+
+        A single-printer run keeps the resumable run record; *jobs* are the
+        ``(name, job type)`` pairs it covers. ``start_index`` continues a
+        recorded run, always on its original printer. ``record_run=False``
+        runs without a record and leaves the saved one alone.
+        """
+        from label_printer import LabelPrinterThread
+        from print_farm import PrintFarmController
+
+        self._set_ui_busy(True)
+        printers = [zebra] if start_index else self._print_printers(zebra)
+        assignments = self._farm_assignments(
+            sequence, self._settings, printers
+        )
+        if assignments is not None:
+            worker = PrintFarmController(assignments, self._settings)
+        else:
+            if start_index:
+                record = self._run_record
+            elif record_run:
+                record = self._begin_run_record(zebra, jobs, sequence)
+            else:
+                record = None
+            worker = LabelPrinterThread(
+                sequence=sequence,
+                settings=self._settings,
+                zebra_printer=zebra,
+                run_record=record,
+                start_index=start_index,
+            )
+        self._active_thread = worker
+        if isinstance(worker, PrintFarmController):
+            self._farm_progress = {}
+            worker.printerProgress.connect(self._on_farm_progress)
+        else:
+            worker.progress.connect(self._on_print_progress)
+        worker.timingSummary.connect(self._on_timing_summary)
+        worker.finished.connect(on_finished)
+        worker.start()
+
+    def _on_timing_summary(self, summary: str) -> None:
+        """Keep a finished run's timing line for :meth:`_show_ready`."""
+        self._timing_summary = summary
+
+    def _show_ready(self) -> None:
+        """Status bar back to "Ready" — or, straight after a print run, to
+        that run's timing summary."""
+        self.statusbar.showMessage(self._timing_summary or "Ready")
+        self._timing_summary = ""
+
+    def _print_printers(self, zebra: str) -> list[str]:
+        """Printers a run may use: *zebra* first, then any other Zebras.
+
+        Only with the print farm enabled; the extra spooler enumeration is
+        the price of opting in.
+        """
+        if not self._settings.print_farm_enabled:
+            return [zebra]
+        others = [
+            name
+            for name in printer_service.find_zebra_printers()
+            if name != zebra
+        ]
+        return [zebra, *others]
+
+    @staticmethod
+    def _farm_assignments(
+        sequence: list, settings: AppSettings, printers: list[str]
+    ) -> Optional[dict]:
+        """Per-printer shares when the run spans printers, else None."""
+        from print_farm import assign_groups
+
+        if len(printers) < 2:
+            return None
+        assignments = assign_groups(
+            sequence,
+            printers,
+            settings.print_delay_seconds,
+            settings.separator_delay_seconds,
+        )
+        return assignments if len(assignments) > 1 else None
+
+    @classmethod
+    def _make_print_worker(
+        cls, sequence: list, settings: AppSettings, printers: list[str]
+    ):
+        """A farm controller when the job spans printers, else one thread."""
+        from label_printer import LabelPrinterThread
+        from print_farm import PrintFarmController
+
+        assignments = cls._farm_assignments(sequence, settings, printers)
+        if assignments is not None:
+            return PrintFarmController(assignments, settings)
+        return LabelPrinterThread(
+            sequence=sequence, settings=settings, zebra_printer=printers[0]
+        )
+
+    def _begin_run_record(
+        self, printer: str, jobs: list[tuple[str, str]], sequence: list
+    ) -> Optional[PrintRunRecord]:
+        """Record a new interactive run so it can be resumed if cut short."""
+        try:
+            self._run_record.start(printer, jobs, sequence)
+        except OSError:
+            logger.exception("Could not record print run; resume unavailable")
+            return None
+        return self._run_record
+
+    def _resume_print(self) -> None:
+        """Continue the recorded unfinished run from a chosen item."""
+        from label_printer import LabelPrinterThread
+
+        if self._busy or self._queue_blocks_direct_operation():
+            return
+        saved = self._run_record.load()
+        if saved is None or saved.sent >= saved.total:
+            QMessageBox.information(
+                self,
+                "Resume Print",
+                "There is no interrupted print run to resume.",
+            )
+            return
+
+        choices = [
+            f"{index}/{saved.total}: {LabelPrinterThread._describe_item(item)}"
+            for index, item in enumerate(saved.sequence, start=1)
+        ]
+        job_names = ", ".join(name for name, _type in saved.jobs) or "?"
+        choice, ok = QInputDialog.getItem(
+            self,
+            "Resume Print",
+            f"Jobs: {job_names}\nPrinter: {saved.printer}\n"
+            f"Started {saved.started}; {saved.sent} of {saved.total} items "
+            "were sent.\n\nContinue from:",
+            choices,
+            saved.sent,
+            False,
+        )
+        if not ok:
+            return
+        self._start_print_worker(
+            list(saved.sequence),
+            saved.printer,
+            list(saved.jobs),
+            lambda ok, msg, js=saved.jobs: self._on_resumed_print_finished(
+                ok, msg, js
+            ),
+            start_index=choices.index(choice),
+        )
+
+    def _reprint_labels(self) -> None:
+        """Print only the chosen boards/materials of the selected job.
+
+        Also offered for printed jobs — a damaged label usually turns up
+        after the job has moved on. No order dialog: the reprint follows
+        the sticky material order, like the stack it replaces.
+        """
+        import print_sequencer
+
+        job = self._selected_job()
+        if job is None or self._busy or self._queue_blocks_direct_operation():
+            return
         if not job.files.ljd_files:
             QMessageBox.warning(
                 self,
@@ -631,17 +1098,77 @@ class JobManager(QMainWindow):
                 f"No .ljd label files were found for '{job.name}'.",
             )
             return
+        text, ok = QInputDialog.getText(
+            self,
+            "Reprint Labels",
+            "Boards to reprint — board numbers, ranges or materials:\n"
+            "e.g.  7   12-15   WHMR   OAK:3-5",
+        )
+        if not ok or not text.strip():
+            return
+        try:
+            selection = print_sequencer.parse_board_selection(text)
+        except ValueError as exc:
+            QMessageBox.warning(self, "Reprint Labels", str(exc))
+            return
 
-        # Printer availability comes from the status widget's background
-        # poll (self._zebra_online gates the Print button already) — the old
-        # inline EnumPrinters preflight re-enumerated the spooler on the GUI
-        # thread on every click, freezing the window whenever the spooler
-        # was slow. S:-drive reachability is the worker's problem: a label
-        # that fails to submit surfaces a real error there.
+        zebra = self._resolve_print_printer()
+        if not zebra:
+            return
+        sequence = print_sequencer.build_reprint_sequence(
+            job.display_name or job.name,
+            job.files.ljd_files,
+            selection,
+            material_priority=self._settings.material_priority,
+            reverse_within=self._settings.reverse_order,
+            include_separators=self._settings.print_separators,
+        )
+        if not sequence:
+            QMessageBox.warning(
+                self,
+                "Reprint Labels",
+                f"No labels of '{job.name}' match {text.strip()!r}.",
+            )
+            return
+        self._start_print_worker(
+            sequence,
+            zebra,
+            [(job.name, job.job_type.name)],
+            lambda ok, msg, j=job: self._on_operation_finished(
+                ok, msg, "reprinted", j
+            ),
+            # A few spoiled labels: not worth resuming, and recording them
+            # would replace an interrupted run's record.
+            record_run=False,
+        )
+
+    def _on_resumed_print_finished(
+        self, success: bool, message: str, jobs: tuple[tuple[str, str], ...]
+    ) -> None:
+        if success:
+            for name, job_type in jobs:
+                self._history.mark_printed(name, job_type)
+        self._set_ui_busy(False)
+        self._show_ready()
+        _beep(success)
+        if success:
+            QMessageBox.information(self, "Success", message)
+        else:
+            QMessageBox.critical(self, "Error", message)
 
-        # Resolve the actual printer name: user override wins, then the name
-        # the status widget already resolved on its last poll, and only as a
-        # last resort another spooler enumeration.
+    def _resolve_print_printer(self) -> Optional[str]:
+        """Return the Zebra to print to, or None (the user has been told).
+
+        Printer availability comes from the status widget's background
+        poll (self._zebra_online gates the Print button already) — the old
+        inline EnumPrinters preflight re-enumerated the spooler on the GUI
+        thread on every click, freezing the window whenever the spooler
+        was slow. S:-drive reachability is the worker's problem: a label
+        that fails to submit surfaces a real error there.
+        """
+        # User override wins, then the name the status widget already
+        # resolved on its last poll, and only as a last resort another
+        # spooler enumeration.
         zebra = self._settings.zebra_printer_name
         if not zebra and self._printer_status is not None:
             zebra = self._printer_status.resolved_printer_name()
@@ -654,14 +1181,37 @@ class JobManager(QMainWindow):
                 "No Zebra label printer could be detected.\n\n"
                 "Check that the Zebra GC420D is powered on and connected via USB.",
             )
-            return
+            return None
+        return zebra
+
+    def _prepare_print(self, job: Job) -> Optional[tuple[list, str]]:
+        """Resolve the printer and confirm the material order for *job*.
+
+        Returns ``(sequence, printer_name)``, or None when the user cancelled
+        or there is nothing to print (the reason has been shown already).
+        Shared by the Print Labels button and the Queue menu.
+        """
+        from print_order_dialog import PrintOrderDialog
+        from sequence_plan import SEQUENCE_PLANS
+
+        if not job.files.ljd_files:
+            QMessageBox.warning(
+                self,
+                "Nothing to Print",
+                f"No .ljd label files were found for '{job.name}'.",
+            )
+            return None
+
+        zebra = self._resolve_print_printer()
+        if not zebra:
+            return None
 
         # Auto-detect materials for this job, seeded with the sticky default
         # priority from the last print run. Top of the returned list = peeled
-        # first on the roll.
-        materials = print_sequencer.detect_materials_in_job(
-            list(job.files.ljd_files),
-            self._settings.material_priority,
+        # first on the roll. Usually already parsed by the selection's
+        # background prefetch.
+        materials = SEQUENCE_PLANS.materials(
+            job.files.ljd_files, self._settings.material_priority
         )
         if not materials:
             QMessageBox.warning(
@@ -669,7 +1219,7 @@ class JobManager(QMainWindow):
                 "No Labels",
                 "No valid .ljd files found in this job.",
             )
-            return
+            return None
 
         display_job = job.display_name or job.name
 
@@ -683,7 +1233,7 @@ class JobManager(QMainWindow):
             parent=self,
         )
         if order_dialog.exec_() != QDialog.Accepted:
-            return  # user cancelled
+            return None  # user cancelled
 
         ordered_priority = order_dialog.get_ordered_materials()
 
@@ -701,9 +1251,9 @@ class JobManager(QMainWindow):
         # Build the full sequence with the user's chosen order. This runs
         # AFTER the reorder dialog so the sequence reflects exactly what the
         # user saw in the dialog's preview.
-        sequence = print_sequencer.build_print_sequence(
+        sequence = SEQUENCE_PLANS.sequence(
             display_job,
-            list(job.files.ljd_files),
+            job.files.ljd_files,
             material_priority=ordered_priority,
             reverse_within=self._settings.reverse_order,
             include_separators=self._settings.print_separators,
@@ -714,21 +1264,9 @@ class JobManager(QMainWindow):
                 "Nothing to Print",
                 "Could not build a valid print sequence for this job.",
             )
-            return
+            return None
 
-        self._set_ui_busy(True)
-        self._active_thread = LabelPrinterThread(
-            sequence=sequence,
-            settings=self._settings,
-            zebra_printer=zebra,
-        )
-        self._active_thread.progress.connect(self._on_print_progress)
-        self._active_thread.finished.connect(
-            lambda ok, msg, j=job: self._on_operation_finished(
-                ok, msg, "printed", j
-            )
-        )
-        self._active_thread.start()
+        return sequence, zebra
 
     def _on_print_progress(self, current: int, total: int, description: str) -> None:
         """Route the rich (current,total,description) print progress signal
@@ -737,36 +1275,139 @@ class JobManager(QMainWindow):
             f"Printing {current}/{total}: {description}"
         )
 
-    # -- NC copy to USB --
+    def _batch_print(self) -> None:
+        """Print several jobs' labels as one merged, gap-free run."""
+        import print_sequencer
+        from batch_print_dialog import BatchPrintDialog
+        from sequence_plan import SEQUENCE_PLANS
 
-    def _copy_nc_to_usb(self) -> None:
-        job = self._selected_job()
-        if job is None or self._busy:
+        if self._busy or self._queue_blocks_direct_operation():
             return
+        jobs = [j for j in self._active_jobs if j.files.ljd_files]
+        if not jobs:
+            QMessageBox.warning(
+                self,
+                "Nothing to Print",
+                "No active job has .ljd label files.",
+            )
+            return
+        zebra = self._resolve_print_printer()
+        if not zebra:
+            return
+
+        by_key = {job.name: job for job in jobs}
+        candidates = [
+            (
+                job.name,
+                job.display_name or job.name,
+                SEQUENCE_PLANS.materials(
+                    job.files.ljd_files, self._settings.material_priority
+                ),
+            )
+            for job in jobs
+        ]
+        selected = self._selected_job()
+        dialog = BatchPrintDialog(
+            candidates,
+            preselected=(selected.name,) if selected is not None else (),
+            parent=self,
+        )
+        if dialog.exec_() != QDialog.Accepted:
+            return
+        chosen = [
+            (by_key[key], order) for key, order in dialog.selected_jobs()
+        ]
+
+        sequence = print_sequencer.build_batch_print_sequence(
+            [
+                print_sequencer.BatchJob(
+                    job_name=job.display_name or job.name,
+                    ljd_files=tuple(job.files.ljd_files),
+                    material_priority=order,
+                )
+                for job, order in chosen
+            ],
+            reverse_within=self._settings.reverse_order,
+            include_separators=self._settings.print_separators,
+            build=SEQUENCE_PLANS.sequence,
+        )
+        if not sequence:
+            QMessageBox.warning(
+                self,
+                "Nothing to Print",
+                "Could not build a valid print sequence for these jobs.",
+            )
+            return
+
+        batch_jobs = [job for job, _order in chosen]
+        self._start_print_worker(
+            sequence,
+            zebra,
+            [(job.name, job.job_type.name) for job in batch_jobs],
+            lambda ok, msg, js=batch_jobs: self._on_batch_print_finished(
+                ok, msg, js
+            ),
+        )
+
+    def _on_batch_print_finished(
+        self, success: bool, message: str, jobs: list[Job]
+    ) -> None:
+        """Record every job of a finished batch; auto-moves go via the queue."""
+        if success:
+            for job in jobs:
+                self._record_history("printed", job)
+        self._set_ui_busy(False)
+        self._show_ready()
+        _beep(success)
+        if not success:
+            QMessageBox.critical(self, "Error", message)
+            return
+        QMessageBox.information(self, "Success", message)
+        for job in jobs:
+            if self._wants_auto_move("printed", job):
+                self._enqueue_move(job)
+
+    def _on_farm_progress(
+        self, printer: str, current: int, total: int, _description: str
+    ) -> None:
+        """One status-bar entry per printer while the farm prints."""
+        self._farm_progress[printer] = f"{printer} {current}/{total}"
+        self.statusbar.showMessage(
+            "Printing — " + "  |  ".join(self._farm_progress.values())
+        )
+
+    # -- NC copy to USB --
+
+    def _choose_usb_drive(self) -> Optional[str]:
+        """Return the USB drive to copy to, asking when there are several."""
+        from usb_transfer import detect_usb_drives
 
         drives = detect_usb_drives()
         if not drives:
             QMessageBox.warning(self, "No USB Drive", "Please insert a USB drive and try again.")
-            return
+            return None
 
         if len(drives) == 1:
-            target_drive = drives[0]
-        else:
-            drive, ok = QInputDialog.getItem(
-                self, "Select USB Drive", "Choose a drive:", drives, 0, False,
-            )
-            if not ok:
-                return
-            target_drive = drive
+            return drives[0]
+        drive, ok = QInputDialog.getItem(
+            self, "Select USB Drive", "Choose a drive:", drives, 0, False,
+        )
+        return drive if ok else None
+
+    def _copy_nc_to_usb(self) -> None:
+        job = self._selected_job()
+        if job is None or self._busy or self._queue_blocks_direct_operation():
+            return
+
+        target_drive = self._choose_usb_drive()
+        if target_drive is None:
+            return
 
         # Size estimation and the free-space check happen inside the worker
         # now — sizing every NC file is one SMB stat per file, which used to
         # run on the GUI thread before the dialog could even appear.
         self._set_ui_busy(True)
-        self._active_thread = USBTransferThread(
-            nc_files=job.files.nc_files,
-            target_drive=target_drive,
-        )
+        self._active_thread = self._make_usb_thread(job, target_drive)
         self._active_thread.progress.connect(self._update_status)
         self._active_thread.finished.connect(
             lambda ok, msg, j=job: self._on_operation_finished(
@@ -775,26 +1416,47 @@ class JobManager(QMainWindow):
         )
         self._active_thread.start()
 
+    def _make_usb_thread(self, job: Job, target_drive: str) -> USBTransferThread:
+        from usb_transfer import USBTransferThread
+
+        thread = USBTransferThread(
+            nc_files=job.files.nc_files,
+            target_drive=target_drive,
+            verify=self._settings.verify_usb_copy,
+            sync=self._settings.usb_sync_mode,
+            remove_stale=self._settings.usb_remove_stale_nc,
+        )
+        thread.fileVerified.connect(self._on_usb_file_verified)
+        return thread
+
+    def _on_usb_file_verified(self, name: str, ok: bool, detail: str) -> None:
+        if ok:
+            self.statusbar.showMessage(f"Verified {name} on the USB drive")
+        else:
+            self.statusbar.showMessage(f"Verify FAILED for {name}: {detail}")
+
     # -- Move to Printed --
 
     def _move_to_printed(self) -> None:
         job = self._selected_job()
-        if job is None or self._busy:
+        if job is None or self._busy or self._queue_blocks_direct_operation():
             return
         if job.is_printed:
             # Safety: can't re-move an already-printed job.
             return
+        if not self._confirm_move_to_printed(job):
+            return
+
+        self._start_move_to_printed(job)
 
+    def _confirm_move_to_printed(self, job: Job) -> bool:
         reply = QMessageBox.question(
             self,
             "Move to Printed",
             f"Move job '{job.name}' to the Printed folder and remove it from the list?",
             QMessageBox.Yes | QMessageBox.No,
         )
-        if reply != QMessageBox.Yes:
-            return
-
-        self._start_move_to_printed(job)
+        return reply == QMessageBox.Yes
 
     def _start_move_to_printed(self, job: Job) -> None:
         """Move *job* into the Printed folder on a worker thread.
@@ -803,6 +1465,8 @@ class JobManager(QMainWindow):
         can live anywhere and ``shutil.move`` silently degrades to a full
         copy over the network — minutes of frozen GUI if run inline.
         """
+        from move_job import MoveJobThread
+
         self._set_ui_busy(True)
         dest = os.path.join(PRINTED_PATH, job.name)
         self._active_thread = MoveJobThread(src=job.path, dest=dest)
@@ -836,8 +1500,15 @@ class JobManager(QMainWindow):
             2. ``.ljd`` files   -> Custom Design
             3. No recognised files -> ask the user
         """
+        from move_job import MoveJobThread
+
         job = self._selected_job()
-        if job is None or not job.is_printed or self._busy:
+        if (
+            job is None
+            or not job.is_printed
+            or self._busy
+            or self._queue_blocks_direct_operation()
+        ):
             return
 
         source_type = self._detect_restore_target(job)
@@ -898,6 +1569,144 @@ class JobManager(QMainWindow):
             return "Custom Design"
         return None
 
+    # -- Operation queue --
+
+    def _queue_target_job(self) -> Optional[Job]:
+        """Return the selected active job, or None (with a status hint)."""
+        job = self._selected_job()
+        if job is None or job.is_printed:
+            self.statusbar.showMessage("Select an active job to queue")
+            return None
+        return job
+
+    def _enqueue(
+        self,
+        kind: str,
+        job: Job,
+        resources: set[str],
+        make_thread,
+        history_action: str,
+    ) -> None:
+        self._queue.enqueue(
+            kind,
+            job.display_name or job.name,
+            resources | {job_resource(job.path)},
+            make_thread,
+            on_finished=lambda ok, msg, j=job, a=history_action: (
+                self._on_queued_operation_finished(ok, msg, a, j)
+            ),
+        )
+        self._queue_dock.show()
+        self.statusbar.showMessage(
+            f"Queued for {job.name} ({self._queue.pending_count()} waiting)"
+        )
+
+    def _queue_transfer(self) -> None:
+        from preflight import check_cadcode_free_space
+
+        job = self._queue_target_job()
+        if job is None:
+            return
+        if not (job.files.mdb_files or job.files.wmf_files):
+            self.statusbar.showMessage(f"{job.name} has no files to transfer")
+            return
+        cad_result = check_cadcode_free_space(self._dest_path, min_mb=500)
+        if not cad_result.ok:
+            self._show_preflight_failure(cad_result)
+            return
+        self._enqueue(
+            TRANSFER_OPERATION,
+            job,
+            {CADCODE_RESOURCE},
+            lambda j=job: self._make_transfer_thread(j),
+            "transferred",
+        )
+
+    def _queue_copy_nc(self) -> None:
+        job = self._queue_target_job()
+        if job is None:
+            return
+        if not job.files.nc_files:
+            self.statusbar.showMessage(f"{job.name} has no NC files")
+            return
+        drive = self._choose_usb_drive()
+        if drive is None:
+            return
+        self._enqueue(
+            USB_OPERATION,
+            job,
+            {usb_resource(drive)},
+            lambda j=job, d=drive: self._make_usb_thread(j, d),
+            "nc_copied",
+        )
+
+    def _queue_print(self) -> None:
+        job = self._queue_target_job()
+        if job is None:
+            return
+        prepared = self._prepare_print(job)
+        if prepared is None:
+            return
+        sequence, zebra = prepared
+        settings = self._settings
+        printers = self._print_printers(zebra)
+        self._enqueue(
+            PRINT_OPERATION,
+            job,
+            # Every print also holds the Windows default printer: the
+            # printto fallback swaps it for the whole run, and two runs
+            # overlapping would save and restore each other's swap.
+            {printer_resource(p) for p in printers}
+            | {DEFAULT_PRINTER_RESOURCE},
+            lambda: self._make_print_worker(sequence, settings, printers),
+            "printed",
+        )
+
+    def _queue_move(self) -> None:
+        job = self._queue_target_job()
+        if job is None or not self._confirm_move_to_printed(job):
+            return
+        self._enqueue_move(job)
+
+    def _enqueue_move(self, job: Job) -> None:
+        from move_job import MoveJobThread
+
+        dest = os.path.join(PRINTED_PATH, job.name)
+        self._enqueue(
+            MOVE_OPERATION,
+            job,
+            {job_resource(dest)},
+            lambda j=job, d=dest: MoveJobThread(src=j.path, dest=d),
+            "moved",
+        )
+
+    def _on_queued_operation_finished(
+        self, success: bool, message: str, history_action: str, job: Job
+    ) -> None:
+        """Record a queued operation's outcome — no modal dialogs.
+
+        A batch left running unattended must not stall behind a message
+        box; the queue panel keeps each entry's full result instead.
+        """
+        if not success:
+            _beep(False)
+            return
+        self._record_history(history_action, job)
+        if self._wants_auto_move(history_action, job):
+            # Queued rather than started directly: the move then waits for
+            # anything else still queued against this job's folder.
+            self._enqueue_move(job)
+
+    def _on_queue_item_finished(
+        self, _op_id: int, success: bool, message: str
+    ) -> None:
+        first_line = message.splitlines()[0] if message else ""
+        prefix = "Queue" if success else "Queue item failed"
+        self.statusbar.showMessage(f"{prefix}: {first_line}")
+        if not self._queue.is_active():
+            _beep(True)
+        self.refresh_jobs()
+
     # -- Operation callbacks --
 
     def _update_status(self, message: str) -> None:
@@ -909,34 +1718,50 @@ class JobManager(QMainWindow):
         if success:
             # Record history BEFORE _set_ui_busy(False): un-busying kicks a
             # refresh, and the tree should paint the new status first time.
-            if history_action == "transferred":
-                self._history.mark_transferred(job.name, job.job_type.name)
-            elif history_action == "printed":
-                self._history.mark_printed(job.name, job.job_type.name)
-            elif history_action == "nc_copied":
-                self._history.mark_nc_copied(job.name, job.job_type.name)
+            self._record_history(history_action, job)
 
             self._set_ui_busy(False)
-            self.statusbar.showMessage("Ready")
+            self._show_ready()
             _beep(True)
             QMessageBox.information(self, "Success", message)
 
-            # Optional workflow shortcut: a job whose labels just printed
-            # goes straight to the Printed folder without the confirm
-            # dialog. (This setting existed in the UI for a while without
-            # being wired to anything.)
-            if (
-                history_action == "printed"
-                and self._settings.auto_mark_printed
-                and not job.is_printed
-            ):
+            if self._wants_auto_move(history_action, job):
                 self._start_move_to_printed(job)
         else:
             self._set_ui_busy(False)
-            self.statusbar.showMessage("Ready")
+            self._show_ready()
             _beep(False)
             QMessageBox.critical(self, "Error", message)
 
+    def _record_history(self, history_action: str, job: Job) -> None:
+        """Persist a successful operation's outcome to the job history.
+
+        Shared by the interactive buttons and the operation queue so both
+        paths leave exactly the same trail.
+        """
+        if history_action == "transferred":
+            self._history.mark_transferred(job.name, job.job_type.name)
+        elif history_action == "printed":
+            self._history.mark_printed(job.name, job.job_type.name)
+        elif history_action == "nc_copied":
+            self._history.mark_nc_copied(job.name, job.job_type.name)
+        elif history_action == "moved":
+            self._history.mark_moved_to_printed(job.name, job.job_type.name)
+            self._dropped_jobs.pop(job.name, None)
+
+    def _wants_auto_move(self, history_action: str, job: Job) -> bool:
+        """True if *job* should now go straight to the Printed folder.
+
+        Optional workflow shortcut: a job whose labels just printed moves
+        without the confirm dialog. (This setting existed in the UI for a
+        while without being wired to anything.)
+        """
+        return (
+            history_action == "printed"
+            and self._settings.auto_mark_printed
+            and not job.is_printed
+        )
+
     # -- Drop zone --
 
     def _handle_dropped_folder(self, path: str) -> None:
@@ -979,6 +1804,8 @@ class JobManager(QMainWindow):
 
     def _on_settings_triggered(self) -> None:
         """Open the Print Settings dialog and wire its Apply signal."""
+        from settings_dialog import SettingsDialog
+
         dialog = SettingsDialog(self._settings, parent=self)
         dialog.settingsApplied.connect(self._on_settings_applied)
         dialog.exec_()
@@ -1006,12 +1833,17 @@ class JobManager(QMainWindow):
                 self._printer_status.set_printer_name(
                     new_settings.zebra_printer_name
                 )
+                self._printer_status.set_event_driven(
+                    new_settings.printer_change_notifications
+                )
             except AttributeError:
                 logger.debug(
                     "Printer status widget missing expected setters; "
                     "ignoring settings propagation"
                 )
 
+        self._rearm_refresh_timer()
+
         self.statusbar.showMessage("Print settings updated")
 
     # -- About --
@@ -1035,6 +1867,23 @@ class JobManager(QMainWindow):
         print thread dies inside its default-printer swap, the system
         default is left pointing at the Zebra.
         """
+        if self._queue.is_active() and self.isVisible():
+            reply = QMessageBox.question(
+                self,
+                "Queue in Progress",
+                "Queued operations are still running or waiting.\n\n"
+                "Cancel them and exit?",
+                QMessageBox.Yes | QMessageBox.No,
+            )
+            if reply != QMessageBox.Yes:
+                event.ignore()
+                return
+        if self._queue.is_active():
+            # A hidden window (headless teardown) has nobody to ask.
+            self._queue.cancel_all()
+            if not self._queue.wait_for_running(15000):
+                logger.error("Queued workers did not stop within 15s")
+
         active = self._active_thread
         if active is not None and active.isRunning():
             reply = QMessageBox.question(
@@ -1051,6 +1900,9 @@ class JobManager(QMainWindow):
             if not active.wait(15000):
                 logger.error("Active worker did not stop within 15s")
 
+        if self._plan_thread is not None:
+            self._plan_thread.wait(5000)
+
         self._updates.shutdown()
 
         timer = getattr(self, "_refresh_timer", None)
@@ -1067,20 +1919,19 @@ class JobManager(QMainWindow):
 
         # Let an in-flight scan finish before the window goes away, so its
         # completion slot never runs against half-destroyed widgets.
-        if self._scan_thread is not None:
-            try:
-                self._scan_thread.scanned.disconnect(self._on_scan_finished)
-                self._scan_thread.failed.disconnect(self._on_scan_failed)
-            except TypeError:
-                pass  # already disconnected
-            if self._scan_thread.isRunning():
-                self._scan_thread.wait(5000)
-            self._scan_thread = None
+        if self._scan_handle is not None:
+            self._scan_handle.discard()
+            self._scan_handle.wait(5000)
+            self._scan_handle = None
 
         super().closeEvent(event)
 
 
 if __name__ == "__main__":
+    # The frozen exe doubles as the job scan helper (scan_process): in a
+    # helper this runs the helper's loop and never returns.
+    multiprocessing.freeze_support()
+
     from app_logging import setup_logging
 
     setup_logging()
@@ -1091,4 +1942,15 @@ if __name__ == "__main__":
     apply_ui_font_size(load_settings().ui_font_size)
     window = JobManager()
     window.show()
-    sys.exit(app.exec_())
+    exit_code = app.exec_()
+    shutdown_shared_executor()
+    # Only what was used: importing a module just to stop it would slow
+    # down the exit.
+    for module_name, shutdown in (
+        ("async_core", "shutdown_shared_core"),
+        ("scan_process", "shutdown_shared_scan_process"),
+    ):
+        module = sys.modules.get(module_name)
+        if module is not None:
+            getattr(module, shutdown)()
+    sys.exit(exit_code)
@@ -10,12 +10,21 @@ app never touches. Every launch self-extracts the whole archive to %TEMP%
 upx is OFF: UPX-packed DLLs barely shrink the final zlib-compressed
 archive, they slow extraction, and packed unsigned exes are a known
 Defender false-positive magnet.
+
+job_manager.ui is compiled to job_manager_ui.py before analysis, so the exe
+builds its main window from generated code instead of parsing the XML with
+uic.loadUi on every launch. The .ui stays bundled as the fallback.
 """
 
 import os
 
+from PyQt5 import uic
+
 block_cipher = None
 
+with open('job_manager_ui.py', 'w', encoding='utf-8') as _ui_out:
+    uic.compileUi('job_manager.ui', _ui_out)
+
 a = Analysis(
     ['job_manager.py'],
     pathex=[],
@@ -28,21 +37,32 @@ a = Analysis(
         'PyQt5.QtCore',
         'PyQt5.QtGui',
         'PyQt5.QtWidgets',
+        'job_manager_ui',
+        'startup_timeline',
         'job_types',
         'job_scanner',
         'job_scan_worker',
+        'task_executor',
+        'async_core',
+        'scan_process',
+        'refresh_scheduler',
+        'job_index',
         'file_transfer',
         'label_printer',
         'usb_transfer',
         'move_job',
+        'operation_queue',
+        'queue_panel',
         'transfer_common',
         'transfer_history',
+        'transfer_journal',
         'drop_zone',
         'updater',
         'app_logging',
         # pywin32 modules for printer control and ShellExecute
         'win32print',
         'win32api',
+        'win32event',
         'win32con',
         'pywintypes',
         # pure-Python modules — listed so PyInstaller bundles them even if
@@ -51,8 +71,15 @@ a = Analysis(
         'preflight',
         'printer_service',
         'print_sequencer',
+        'sequence_plan',
+        'print_pacing',
+        'print_farm',
+        'batch_print_dialog',
+        'print_profile',
+        'print_run_record',
         'zpl_templates',
         'printer_status_widget',
+        'printer_monitor',
         'settings_dialog',
         'print_order_dialog',
     ],
@@ -5,20 +5,103 @@ share. That is a network traversal whose latency is bounded only by the SMB
 timeout, so running it on the Qt GUI thread stalls painting and input for as
 long as it takes — and the auto-refresh timer repeats it every few seconds.
 
-This module runs that scan on a worker thread instead, following the same
-``QThread``-per-operation pattern the app already uses for file transfer and
-label printing. The GUI thread only ever touches the *result*.
+This module runs that scan off the GUI thread instead: the main window
+submits a :class:`ScanJobsTask` to the shared
+:class:`task_executor.TaskExecutor`, so the refresh loop reuses a pooled
+worker rather than starting a thread per tick. :class:`JobScanThread` runs
+the same scan on a dedicated ``QThread``, :func:`scan_all_jobs_async`
+is the concurrent version for :class:`async_core.AsyncCore`, and
+:func:`scan_all_jobs` is a plain blocking call for scans that run outside
+Qt (the scan helper process, the shared job index). The GUI thread only
+ever touches the *result*.
 """
 
 import logging
 
 from PyQt5.QtCore import QThread, pyqtSignal
 
-from job_scanner import scan_jobs, scan_printed_jobs
+from job_scanner import (
+    SCAN_CONCURRENCY,
+    scan_jobs,
+    scan_jobs_async,
+    scan_printed_jobs,
+    scan_printed_jobs_async,
+)
+from task_executor import Task
 
 logger = logging.getLogger(__name__)
 
 
+def _scan_printed_or_empty(scan_printed) -> list:
+    try:
+        return list(scan_printed())
+    except Exception:  # noqa: BLE001 - printed folder is non-critical
+        logger.exception("Failed to scan printed job folder")
+        return []
+
+
+async def _scan_printed_or_empty_async(concurrency: int) -> list:
+    try:
+        return await scan_printed_jobs_async(concurrency=concurrency)
+    except Exception:  # noqa: BLE001 - printed folder is non-critical
+        logger.exception("Failed to scan printed job folder")
+        return []
+
+
+async def scan_all_jobs_async(
+    concurrency: int = SCAN_CONCURRENCY,
+) -> tuple[list, list]:
+    """Coroutine twin of :class:`ScanJobsTask`.
+
+    Scans the active and printed folders side by side, listing up to
+    *concurrency* job folders of each at once. Returns
+    ``(active_jobs, printed_jobs)`` with the same failure semantics: a
+    failing active scan raises, a failing printed scan yields ``[]``.
+    """
+    import asyncio
+
+    active, printed = await asyncio.gather(
+        scan_jobs_async(concurrency=concurrency),
+        _scan_printed_or_empty_async(concurrency),
+    )
+    return active, printed
+
+
+def scan_all_jobs(concurrent: bool = False) -> tuple[list, list]:
+    """Blocking :class:`ScanJobsTask` scan, ``(active_jobs, printed_jobs)``.
+
+    With *concurrent*, runs :func:`scan_all_jobs_async` on an event loop
+    of its own instead.
+    """
+    if concurrent:
+        import asyncio
+
+        return asyncio.run(scan_all_jobs_async())
+    return list(scan_jobs()), _scan_printed_or_empty(scan_printed_jobs)
+
+
+class ScanJobsTask(Task):
+    """Executor task scanning the active and printed job folders.
+
+    Returns ``(active_jobs, printed_jobs)``. A failing active scan raises,
+    which the executor delivers to the submitter's error callback; a
+    failing printed scan alone yields an empty printed list, exactly like
+    :class:`JobScanThread`.
+    """
+
+    name = "job scan"
+
+    def __init__(self, scan_active=None, scan_printed=None) -> None:
+        self._scan_active = scan_active or scan_jobs
+        self._scan_printed = scan_printed or scan_printed_jobs
+
+    def run(self, token, progress) -> tuple[list, list]:
+        active = list(self._scan_active())
+        if token.cancelled:
+            return active, []
+        return active, _scan_printed_or_empty(self._scan_printed)
+
+
 class JobScanThread(QThread):
     """Scans the active and printed job folders off the GUI thread.
 
@@ -58,10 +141,5 @@ class JobScanThread(QThread):
             self.failed.emit(str(exc))
             return
 
-        try:
-            printed = self._scan_printed()
-        except Exception:  # noqa: BLE001 - printed folder is non-critical
-            logger.exception("Failed to scan printed job folder")
-            printed = []
-
-        self.scanned.emit(list(active), list(printed))
+        printed = _scan_printed_or_empty(self._scan_printed)
+        self.scanned.emit(list(active), printed)
@@ -4,7 +4,7 @@ The Zebra GC420D is a roll-fed thermal printer: the first label printed ends
 up at the bottom of the stack and is the last one peeled, so the print queue
 has to be fed in reverse of the desired peel order. That ordering is computed
 upstream by :mod:`print_sequencer` and arrives here as a ready-to-emit
-``list[PrintItem]`` — this module's only job is to execute the sequence and
+:class:`print_sequencer.PrintSequence` — this module's only job is to execute the sequence and
 emit progress signals, so it stays dead simple and testable.
 
 Two item kinds live in the sequence:
@@ -16,33 +16,69 @@ Two item kinds live in the sequence:
     the system default printer.
 
 ``kind == "separator"``
-    A raw ZPL label rendered by :mod:`zpl_templates`. Sent as bytes to the
-    Zebra via :func:`printer_service.send_raw_zpl`.
+    A raw ZPL label rendered by :mod:`zpl_templates`. Written as bytes to
+    the Zebra through one :class:`printer_service.RawPrinterSession` held
+    open for the whole run; adjacent separators are joined into a single
+    spool document. With ``settings.stored_separator_format`` on, the
+    separator layout is downloaded once per run (``^DF``) and each separator
+    sends only its two fields (``^XF``).
+
+``kind == "job_separator"``
+    The banner on top of each job's stack in a multi-job batch
+    (:func:`print_sequencer.build_batch_print_sequence`). Raw ZPL, sent
+    and paced exactly like a separator.
 
 After each LABEL we sleep ``settings.print_delay_seconds`` to pace
-submissions into the handler; after each SEPARATOR we sleep
+submissions into the handler; after each SEPARATOR (or run of adjacent
+separators, which reach the printer as one document) we sleep
 ``settings.separator_delay_seconds`` to let the Zebra's small internal
 buffer drain. Both sleeps run on the worker thread in interruptible slices,
-so the GUI never blocks and Cancel takes effect within ~100 ms.
+so the GUI never blocks and Cancel takes effect within ~100 ms. With
+``settings.adaptive_pacing`` on, the label delay is replaced by
+:class:`print_pacing.AdaptivePacer`, which lets the next label go as soon as
+the previous one is in the spool queue and the queue is short, and falls
+back to the fixed delay whenever the queue cannot be read.
+
+With a :class:`print_run_record.PrintRunRecord` the worker records how many
+items have reached the spooler after every submit, and forgets the run once
+it completes; ``start_index`` continues a recorded run part-way through
+(Print > Resume Print).
+
+Every run is timed per item (build, submit, queue wait, sleep) by
+:class:`print_profile.PrintProfiler`; the report is saved under the log
+folder and a one-line summary is emitted as ``timingSummary``.
 
 If ``printto`` fails (some handlers reject the verb, or mis-parse printer
 names containing parentheses), the run falls back ONCE: it saves the user's
 default printer, makes the Zebra the system default for the REST of the run,
 prints via the plain ``print`` verb, and restores the saved default when the
 run ends — success, failure, or cancel. A marker file lets the next launch
-restore the default even if the process dies mid-run.
+restore the default even if the process dies mid-run. Runs that share the
+machine with other print runs (the multi-printer farm) pass
+``allow_default_swap=False``: the default printer is global, so there a
+``printto`` failure fails the run instead.
 """
 
 from __future__ import annotations
 
 import logging
 from pathlib import Path
+from typing import Sequence
 
 from PyQt5.QtCore import QThread, pyqtSignal
 
+import print_profile
 import printer_service
 import zpl_templates
-from print_sequencer import LABEL_KIND, SEPARATOR_LABEL_KIND, PrintItem
+from print_pacing import AdaptivePacer
+from print_run_record import PrintRunRecord
+from print_sequencer import (
+    JOB_SEPARATOR_KIND,
+    LABEL_KIND,
+    SEPARATOR_LABEL_KIND,
+    PrintItem,
+    PrintSequence,
+)
 from settings import AppSettings
 
 logger = logging.getLogger(__name__)
@@ -60,24 +96,49 @@ class LabelPrinterThread(QThread):
     finished : (bool success, str message)
         Emitted exactly once when the sequence is exhausted or on error. On
         success, ``message`` reports total labels + separators printed.
+
+    timingSummary : (str summary)
+        Emitted just before ``finished`` by every run that started
+        printing, with the one-line timing summary.
+
+    itemSent : (int count)
+        The first ``count`` items of the sequence have reached the spooler.
+        Buffered raw items only count once their document is flushed.
     """
 
     progress = pyqtSignal(int, int, str)
     finished = pyqtSignal(bool, str)
+    timingSummary = pyqtSignal(str)
+    itemSent = pyqtSignal(int)
 
     def __init__(
         self,
-        sequence: list[PrintItem],
+        sequence: Sequence[PrintItem],
         settings: AppSettings,
         zebra_printer: str,
+        allow_default_swap: bool = True,
+        run_record: PrintRunRecord | None = None,
+        start_index: int = 0,
     ) -> None:
         super().__init__()
-        self._sequence = list(sequence)
+        # A PrintSequence is immutable and makes its items as the run
+        # reaches them, so it is used as is; anything else is copied.
+        self._sequence: Sequence[PrintItem] = (
+            sequence if isinstance(sequence, PrintSequence) else list(sequence)
+        )
         self._settings = settings
         self._zebra_printer = zebra_printer
+        self._allow_default_swap = allow_default_swap
+        self._run_record = run_record
+        # Items before this (0-based) index were sent by an earlier run.
+        self._start_index = max(0, min(int(start_index), len(self._sequence)))
+        self._confirmed = self._start_index
         # Run-level default-printer swap state (see module docstring).
         self._swapped = False
         self._original_default: str | None = None
+        # Whether this run has downloaded the stored separator format yet.
+        self._format_sent = False
+        self._profiler: print_profile.PrintProfiler | None = None
 
     # ------------------------------------------------------------------
     # Description helper (kept separate so it's easy to test / tweak)
@@ -95,6 +156,8 @@ class LabelPrinterThread(QThread):
             if item.job_name:
                 return f"Separator: {item.job_name} / {item.material}"
             return f"Separator: {item.material}"
+        if item.kind == JOB_SEPARATOR_KIND:
+            return f"Job start: {item.job_name}"
         return f"<unknown item kind: {item.kind}>"
 
     # ------------------------------------------------------------------
@@ -136,6 +199,13 @@ class LabelPrinterThread(QThread):
                 self._zebra_printer, item.file_path
             )
         except Exception as exc:  # noqa: BLE001 - any printto failure
+            if not self._allow_default_swap:
+                raise RuntimeError(
+                    f"{self._zebra_printer} rejected "
+                    f"{Path(item.file_path).name} ({exc}); the default "
+                    "printer cannot be swapped while other printers are "
+                    "printing"
+                ) from exc
             logger.warning(
                 "printto failed for %s (%s); swapping default printer to %r "
                 "for the rest of the run",
@@ -189,10 +259,59 @@ class LabelPrinterThread(QThread):
                 "automatically the next time Job Manager starts."
             )
 
+    def _raw_zpl(self, item: PrintItem | None) -> bytes | None:
+        """ZPL to send raw for *item*, or None if it goes via the handler."""
+        if item is None:
+            return None
+        if item.kind == SEPARATOR_LABEL_KIND:
+            if self._settings.stored_separator_format:
+                return zpl_templates.build_separator_recall(
+                    item.job_name, item.material
+                )
+            return zpl_templates.cached_job_separator(
+                item.job_name, item.material
+            )
+        if item.kind == JOB_SEPARATOR_KIND:
+            return zpl_templates.build_job_banner(item.job_name)
+        return None
+
     @staticmethod
     def _with_warning(message: str, warning: str | None) -> str:
         return f"{message}\n\nWARNING: {warning}" if warning else message
 
+    def _confirm_sent(self, count: int) -> None:
+        """Report (and record) that the first *count* items were sent."""
+        if count <= self._confirmed:
+            return
+        self._confirmed = count
+        self.itemSent.emit(count)
+        self._record_call("mark_sent", count)
+
+    def _record_call(self, action: str, *args) -> None:
+        """Update the run record; trouble only loses the ability to resume."""
+        if self._run_record is None:
+            return
+        try:
+            getattr(self._run_record, action)(*args)
+        except OSError:
+            logger.exception(
+                "Print run record unavailable; this run cannot be resumed"
+            )
+            self._run_record = None
+
+    def _measure(self, stage: str):
+        return self._profiler.measure(stage)
+
+    def _finish_run(self, success: bool, message: str, outcome: str) -> None:
+        """Save the timing report, emit its summary, then ``finished``."""
+        report = self._profiler.report(outcome)
+        path = print_profile.write_report(report)
+        if path:
+            logger.info("Print timing report written to %s", path)
+        summary = print_profile.summary_line(report)
+        self.timingSummary.emit(summary)
+        self.finished.emit(success, message)
+
     # ------------------------------------------------------------------
     # Thread entry point
     # ------------------------------------------------------------------
@@ -209,104 +328,204 @@ class LabelPrinterThread(QThread):
         total = len(self._sequence)
         label_count = 0
         separator_count = 0
+        banner_count = 0
         label_delay = max(0.0, float(self._settings.print_delay_seconds))
         separator_delay = max(
             0.0, float(self._settings.separator_delay_seconds)
         )
 
+        self._profiler = print_profile.PrintProfiler(
+            printer=self._zebra_printer,
+            label_delay=label_delay,
+            separator_delay=separator_delay,
+            adaptive=bool(self._settings.adaptive_pacing),
+        )
+
+        pacer: AdaptivePacer | None = None
+        if self._settings.adaptive_pacing:
+            zebra = self._zebra_printer
+            pacer = AdaptivePacer(
+                lambda: printer_service.get_queued_job_ids(zebra)
+            )
+
         logger.info(
             "Printing sequence of %d items to %r "
-            "(label delay=%.2fs, separator delay=%.2fs)",
+            "(label delay=%.2fs%s, separator delay=%.2fs)",
             total,
             self._zebra_printer,
             label_delay,
+            " max, adaptive" if pacer is not None else "",
             separator_delay,
         )
 
+        def breakdown() -> str:
+            parts = f"{label_count} labels + {separator_count} separators"
+            if banner_count:
+                parts += f" + {banner_count} job banners"
+            return f"({parts})"
+
         def cancel_message(sent: int) -> str:
             return (
-                f"Cancelled — sent {sent} of {total} items "
-                f"({label_count} labels + {separator_count} separators). "
+                f"Cancelled — sent {sent} of {total} items {breakdown()}. "
                 "Remove any unwanted labels from the printer."
             )
 
-        try:
-            for index, item in enumerate(self._sequence, start=1):
-                if self.isInterruptionRequested():
-                    self.finished.emit(
-                        False,
-                        self._with_warning(
-                            cancel_message(index - 1),
-                            self._restore_default_printer(),
-                        ),
-                    )
-                    return
+        # (index, raw ZPL) of the next item, built one step early when the
+        # current item is raw: whether the next one is raw too decides
+        # whether the spool document is flushed, and its ZPL is then reused
+        # instead of being built a second time.
+        ahead: tuple[int, bytes | None] | None = None
 
-                description = self._describe_item(item)
-                self.progress.emit(index, total, description)
+        try:
+            with printer_service.RawPrinterSession(
+                self._zebra_printer, coalesce=True
+            ) as session:
+                for index, item in enumerate(self._sequence, start=1):
+                    if index <= self._start_index:
+                        continue
+                    if self.isInterruptionRequested():
+                        session.close()
+                        self._confirm_sent(index - 1)
+                        self._finish_run(
+                            False,
+                            self._with_warning(
+                                cancel_message(index - 1),
+                                self._restore_default_printer(),
+                            ),
+                            "cancelled",
+                        )
+                        return
 
-                if item.kind == LABEL_KIND:
-                    self._print_label(item)
-                    label_count += 1
-                    logger.debug(
-                        "Sent label %d/%d: %s", index, total, description
-                    )
-                elif item.kind == SEPARATOR_LABEL_KIND:
-                    zpl = zpl_templates.build_job_separator(
-                        item.job_name, item.material
-                    )
-                    printer_service.send_raw_zpl(
-                        self._zebra_printer,
-                        zpl,
-                        doc_name=f"JobManagerCK Separator {index}/{total}",
-                    )
-                    separator_count += 1
-                    logger.debug(
-                        "Sent separator %d/%d: %s", index, total, description
-                    )
-                else:
-                    # Should never happen — PrintItem.kind is built by our
-                    # own sequencer. Log loudly and keep going.
-                    logger.warning(
-                        "Skipping unknown print item kind at %d: %r",
-                        index,
-                        item.kind,
+                    description = self._describe_item(item)
+                    self.progress.emit(index, total, description)
+                    next_item = (
+                        self._sequence[index] if index < total else None
                     )
 
-                if index < total:
-                    # Separators guard batch boundaries and the printer's
-                    # small buffer — they keep their own (conservative)
-                    # delay independent of the label pacing.
-                    delay = (
-                        separator_delay
-                        if item.kind == SEPARATOR_LABEL_KIND
-                        else label_delay
+                    timing = self._profiler.start_item(
+                        index, item.kind, description
                     )
-                    if not self._interruptible_sleep(delay):
-                        self.finished.emit(
+                    with self._measure("build"):
+                        if ahead is not None and ahead[0] == index:
+                            raw = ahead[1]
+                        else:
+                            raw = self._raw_zpl(item)
+                        ahead = None
+                        next_raw = None
+                        if raw is not None and next_item is not None:
+                            next_raw = self._raw_zpl(next_item)
+                            ahead = (index + 1, next_raw)
+                    timing.raw = raw is not None
+                    if (
+                        item.kind == SEPARATOR_LABEL_KIND
+                        and self._settings.stored_separator_format
+                        and not self._format_sent
+                    ):
+                        # Joins the first separator's document (coalesced).
+                        with self._measure("submit"):
+                            session.write_document(
+                                zpl_templates.build_separator_format(),
+                                doc_name="JobManagerCK Separator format",
+                            )
+                        self._format_sent = True
+                    if raw is not None:
+                        noun = (
+                            "Job banner"
+                            if item.kind == JOB_SEPARATOR_KIND
+                            else "Separator"
+                        )
+                        doc_name = f"JobManagerCK {noun} {index}/{total}"
+                        with self._measure("submit"):
+                            session.write_document(raw, doc_name=doc_name)
+                            flushed = next_raw is None
+                            if flushed:
+                                # Anything else must not overtake buffered
+                                # ZPL.
+                                session.flush()
+                        if flushed:
+                            self._confirm_sent(index)
+                        if item.kind == JOB_SEPARATOR_KIND:
+                            banner_count += 1
+                        else:
+                            separator_count += 1
+                        logger.debug(
+                            "Sent raw %s %d/%d: %s",
+                            noun.lower(),
+                            index,
+                            total,
+                            description,
+                        )
+                    elif item.kind == LABEL_KIND:
+                        if pacer is not None:
+                            with self._measure("queue_wait"):
+                                pacer.before_submit()
+                        with self._measure("submit"):
+                            self._print_label(item)
+                        self._confirm_sent(index)
+                        label_count += 1
+                        logger.debug(
+                            "Sent label %d/%d: %s", index, total, description
+                        )
+                    else:
+                        # Should never happen — PrintItem.kind is built by
+                        # our own sequencer. Log loudly and keep going.
+                        logger.warning(
+                            "Skipping unknown print item kind at %d: %r",
+                            index,
+                            item.kind,
+                        )
+                        self._confirm_sent(index)
+
+                    if next_item is None:
+                        continue
+                    if raw is not None and next_raw is not None:
+                        # Coalesced into one document with the next item —
+                        # nothing has reached the printer yet to wait on.
+                        continue
+                    # Raw ZPL fills the printer's small buffer directly, so
+                    # a raw group keeps the (conservative) separator delay;
+                    # only handler-printed labels use the label pacing.
+                    if raw is not None:
+                        with self._measure("sleep"):
+                            waited = self._interruptible_sleep(separator_delay)
+                    elif pacer is not None and item.kind == LABEL_KIND:
+                        # Time spent polling the spool queue (including
+                        # any fallback delay) is reported as queue wait.
+                        with self._measure("queue_wait"):
+                            waited = pacer.wait_after_submit(
+                                label_delay, self._interruptible_sleep
+                            )
+                    else:
+                        with self._measure("sleep"):
+                            waited = self._interruptible_sleep(label_delay)
+                    if not waited:
+                        session.close()
+                        self._confirm_sent(index)
+                        self._finish_run(
                             False,
                             self._with_warning(
                                 cancel_message(index),
                                 self._restore_default_printer(),
                             ),
+                            "cancelled",
                         )
                         return
 
+            self._record_call("finish")
             restore_warning = self._restore_default_printer()
-            summary = (
-                f"Printed {total} items "
-                f"({label_count} labels + {separator_count} separators)"
-            )
-            self.finished.emit(
-                True, self._with_warning(summary, restore_warning)
+            printed = total - self._start_index
+            summary = f"Printed {printed} items {breakdown()}"
+            self._finish_run(
+                True, self._with_warning(summary, restore_warning), "completed"
             )
 
         except Exception as exc:  # noqa: BLE001 - surface any failure to UI
             logger.exception("Label printing failed")
             restore_warning = self._restore_default_printer()
-            self.finished.emit(
+            self._finish_run(
                 False,
                 self._with_warning(f"Printing failed: {exc}", restore_warning),
+                "failed",
             )
         finally:
             # Backstop for any path that slipped past the explicit restores
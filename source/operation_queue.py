@@ -0,0 +1,278 @@
+"""Queue of long operations (transfer, USB copy, print, move) across jobs.
+
+The main window still allows one *interactive* operation at a time, with the
+whole UI busy while it runs. Operators preparing a morning batch instead
+add operations to this queue and let it run them back-to-back: each entry
+names the resources it occupies (the CADCode folder, a USB drive, a printer,
+the job folder itself), and the scheduler starts an entry as soon as none of
+its resources are held by a running entry or by an EARLIER entry still
+waiting. Independent work overlaps — the USB copy for job A runs while job
+B's labels print — and conflicting work keeps the order it was queued in.
+
+Entries run on the same ``QThread`` workers as the interactive buttons. The
+queue only needs the contract they already share: a ``finished(bool, str)``
+signal, an optional ``progress`` signal, and ``requestInterruption``.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from itertools import count
+from typing import Callable, Optional
+
+from PyQt5.QtCore import QObject, QThread, pyqtSignal
+
+logger = logging.getLogger(__name__)
+
+TRANSFER_OPERATION = "transfer"
+USB_OPERATION = "usb"
+PRINT_OPERATION = "print"
+MOVE_OPERATION = "move"
+
+_OPERATION_TITLES = {
+    TRANSFER_OPERATION: "Transfer",
+    USB_OPERATION: "Copy NC to USB",
+    PRINT_OPERATION: "Print labels",
+    MOVE_OPERATION: "Move to Printed",
+}
+
+#: Upper bound on entries running at once, whatever their resources.
+DEFAULT_MAX_CONCURRENT = 3
+
+#: Resource every CADCode transfer occupies — ``Label Data`` holds one job.
+CADCODE_RESOURCE = "cadcode"
+
+#: Resource every print occupies, whichever printer it targets: the label
+#: printer's ``printto`` fallback swaps the global Windows default printer
+#: for the rest of its run.
+DEFAULT_PRINTER_RESOURCE = "default-printer"
+
+
+def job_resource(job_path: str) -> str:
+    """Resource naming a job folder; operations on one job never overlap."""
+    return f"job:{job_path.lower()}"
+
+
+def usb_resource(drive: str) -> str:
+    return f"usb:{drive.upper()}"
+
+
+def printer_resource(printer_name: str) -> str:
+    return f"printer:{printer_name.lower()}"
+
+
+@dataclass
+class QueuedOperation:
+    """One queued entry. ``make_thread`` is called when the entry starts."""
+
+    op_id: int
+    kind: str
+    job_name: str
+    resources: frozenset[str]
+    make_thread: Callable[[], QThread]
+    on_finished: Optional[Callable[[bool, str], None]] = None
+    thread: Optional[QThread] = field(default=None, repr=False)
+
+    @property
+    def title(self) -> str:
+        return f"{_OPERATION_TITLES.get(self.kind, self.kind)} — {self.job_name}"
+
+
+class OperationQueue(QObject):
+    """FIFO scheduler that runs non-conflicting operations concurrently.
+
+    Signals
+    -------
+    itemAdded(op_id, title)
+    itemStarted(op_id)
+    itemProgress(op_id, text)
+    itemFinished(op_id, success, message)
+        Emitted once per entry, including entries cancelled before starting.
+    idle()
+        Emitted when the last running entry finishes and nothing is pending.
+    """
+
+    itemAdded = pyqtSignal(int, str)
+    itemStarted = pyqtSignal(int)
+    itemProgress = pyqtSignal(int, str)
+    itemFinished = pyqtSignal(int, bool, str)
+    idle = pyqtSignal()
+
+    def __init__(
+        self,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+        parent: Optional[QObject] = None,
+    ) -> None:
+        super().__init__(parent)
+        self._max_concurrent = max(1, int(max_concurrent))
+        self._pending: list[QueuedOperation] = []
+        self._running: dict[int, QueuedOperation] = {}
+        self._ids = count(1)
+        self._paused = False
+        # True once idle() has been emitted for the current drain, so an
+        # entry that fails to start inside _schedule and the thread finish
+        # that called _schedule do not both announce it.
+        self._drained = True
+
+    # -- public API --------------------------------------------------
+
+    def enqueue(
+        self,
+        kind: str,
+        job_name: str,
+        resources: frozenset[str] | set[str],
+        make_thread: Callable[[], QThread],
+        on_finished: Optional[Callable[[bool, str], None]] = None,
+    ) -> int:
+        """Add an operation and start it now if its resources are free."""
+        op = QueuedOperation(
+            op_id=next(self._ids),
+            kind=kind,
+            job_name=job_name,
+            resources=frozenset(resources),
+            make_thread=make_thread,
+            on_finished=on_finished,
+        )
+        self._pending.append(op)
+        self._drained = False
+        self.itemAdded.emit(op.op_id, op.title)
+        self._schedule()
+        return op.op_id
+
+    def cancel(self, op_id: int) -> None:
+        """Drop a waiting entry, or ask a running one to stop."""
+        for op in self._pending:
+            if op.op_id == op_id:
+                self._pending.remove(op)
+                self.itemFinished.emit(op_id, False, "Removed from the queue")
+                self._schedule()
+                return
+        running = self._running.get(op_id)
+        if running is not None and running.thread is not None:
+            running.thread.requestInterruption()
+
+    def cancel_all(self) -> None:
+        """Drop every waiting entry and interrupt the running ones."""
+        for op in list(self._pending):
+            self.cancel(op.op_id)
+        for op in list(self._running.values()):
+            if op.thread is not None:
+                op.thread.requestInterruption()
+
+    def set_paused(self, paused: bool) -> None:
+        """Hold back new starts (running entries carry on).
+
+        The main window pauses the queue while an interactive operation has
+        the UI busy, so the two never fight over the same resource.
+        """
+        self._paused = paused
+        if not paused:
+            self._schedule()
+
+    def is_running(self) -> bool:
+        return bool(self._running)
+
+    def is_active(self) -> bool:
+        """True while anything is running or waiting."""
+        return bool(self._running or self._pending)
+
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def wait_for_running(self, timeout_ms: int) -> bool:
+        """Block until running threads exit. Returns False on timeout."""
+        ok = True
+        for op in list(self._running.values()):
+            if op.thread is not None and not op.thread.wait(timeout_ms):
+                ok = False
+        return ok
+
+    # -- scheduling --------------------------------------------------
+
+    def _schedule(self) -> None:
+        """Start every waiting entry whose resources are free, in order.
+
+        An entry also may not overtake an EARLIER waiting entry it conflicts
+        with — otherwise "print A, then move A" could run the move first.
+        """
+        if self._paused:
+            return
+        held: set[str] = set()
+        for op in self._running.values():
+            held |= op.resources
+        claimed_by_earlier: set[str] = set()
+        for op in list(self._pending):
+            if len(self._running) >= self._max_concurrent:
+                break
+            blocked = op.resources & (held | claimed_by_earlier)
+            claimed_by_earlier |= op.resources
+            if blocked:
+                continue
+            self._pending.remove(op)
+            self._start(op)
+            held |= op.resources
+
+    def _start(self, op: QueuedOperation) -> None:
+        try:
+            thread = op.make_thread()
+        except Exception as exc:  # noqa: BLE001 - report, keep the queue alive
+            logger.exception("Could not start queued %s", op.title)
+            self._finish(op, False, f"Could not start: {exc}")
+            self._emit_idle_if_drained()
+            return
+
+        op.thread = thread
+        self._running[op.op_id] = op
+        progress = getattr(thread, "progress", None)
+        if progress is not None:
+            progress.connect(
+                lambda *args, op_id=op.op_id: self._on_progress(op_id, args)
+            )
+        thread.finished.connect(
+            lambda ok, msg, op_id=op.op_id: self._on_thread_finished(
+                op_id, ok, msg
+            )
+        )
+        logger.info("Queue starting %s", op.title)
+        self.itemStarted.emit(op.op_id)
+        thread.start()
+
+    def _on_progress(self, op_id: int, args: tuple) -> None:
+        # The label printer reports (current, total, description); the copy
+        # workers report a single line of text.
+        if len(args) == 3:
+            text = f"{args[0]}/{args[1]}: {args[2]}"
+        else:
+            text = str(args[-1]) if args else ""
+        self.itemProgress.emit(op_id, text)
+
+    def _on_thread_finished(self, op_id: int, success: bool, message: str) -> None:
+        op = self._running.pop(op_id, None)
+        if op is None:
+            return
+        thread = op.thread
+        if thread is not None:
+            # finished(bool, str) is emitted as the last act of run(), so
+            # this returns almost at once; it guarantees the QThread has
+            # really stopped before its last reference goes away.
+            thread.wait(2000)
+            thread.deleteLater()
+            op.thread = None
+        self._finish(op, success, message)
+        self._schedule()
+        self._emit_idle_if_drained()
+
+    def _emit_idle_if_drained(self) -> None:
+        if self._drained or self._running or self._pending:
+            return
+        self._drained = True
+        self.idle.emit()
+
+    def _finish(self, op: QueuedOperation, success: bool, message: str) -> None:
+        if op.on_finished is not None:
+            try:
+                op.on_finished(success, message)
+            except Exception:  # noqa: BLE001 - a callback must not jam the queue
+                logger.exception("Queue callback failed for %s", op.title)
+        self.itemFinished.emit(op.op_id, success, message)
@@ -0,0 +1,262 @@
+"""Spread one print sequence over several Zebras running at the same time.
+
+A sequence from :func:`print_sequencer.build_print_sequence` is a run of
+material groups: each material's labels followed by its separator (print
+order, so the separator ends up on top of its stack). A group is the unit
+the operator peels as one stack, so it is never split — each printer
+receives whole groups, in their original relative order, with each group's
+internal order and separator untouched.
+
+Groups are assigned longest-first to whichever printer has the least
+estimated work so far (the LPT rule), using the configured label and
+separator delays as the cost of an item. For the handful of materials a
+job has this lands within one group of the best possible split, so the
+printers finish at about the same time.
+
+:class:`PrintFarmController` runs one :class:`label_printer.LabelPrinterThread`
+per printer and reports progress per printer. It exposes the same contract
+as a worker thread (``progress``, ``finished(bool, str)``, ``start``,
+``requestInterruption``, ``isRunning``, ``wait``), so the main window and the
+operation queue drive it exactly like a single print run.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Callable, Optional
+
+from PyQt5.QtCore import QObject, QThread, pyqtSignal
+
+from label_printer import LabelPrinterThread
+from print_sequencer import JOB_SEPARATOR_KIND, LABEL_KIND, PrintItem
+from settings import AppSettings
+
+logger = logging.getLogger(__name__)
+
+#: Creates the worker for one printer: ``(sequence, settings, printer)``.
+ThreadFactory = Callable[[list[PrintItem], AppSettings, str], QThread]
+
+
+def split_material_groups(sequence: list[PrintItem]) -> list[list[PrintItem]]:
+    """Split *sequence* into its consecutive same-material runs.
+
+    A batch's job banner tops the stack printed just before it, so it
+    closes the preceding group instead of starting one.
+    """
+    groups: list[list[PrintItem]] = []
+    closed = True
+    for item in sequence:
+        if item.kind == JOB_SEPARATOR_KIND and groups:
+            groups[-1].append(item)
+            closed = True
+        elif not closed and groups[-1][0].material == item.material:
+            groups[-1].append(item)
+        else:
+            groups.append([item])
+            closed = False
+    return groups
+
+
+def estimate_seconds(
+    items: list[PrintItem], label_delay: float, separator_delay: float
+) -> float:
+    """Rough print time of *items*: the pacing delay each item incurs."""
+    return sum(
+        label_delay if item.kind == LABEL_KIND else separator_delay
+        for item in items
+    )
+
+
+def assign_groups(
+    sequence: list[PrintItem],
+    printers: list[str],
+    label_delay: float,
+    separator_delay: float,
+) -> dict[str, list[PrintItem]]:
+    """Split *sequence* over *printers* so they finish at about the same time.
+
+    Returns ``{printer: items}`` for every printer that received work,
+    keyed in the order of *printers*. Each printer's items keep the
+    sequence's order. Ties go to the earlier printer, so with one group
+    (or one printer) everything lands on ``printers[0]``.
+    """
+    if not printers:
+        raise ValueError("assign_groups needs at least one printer")
+    groups = split_material_groups(sequence)
+    costs = [
+        estimate_seconds(group, label_delay, separator_delay)
+        for group in groups
+    ]
+    load = {printer: 0.0 for printer in printers}
+    chosen: dict[int, str] = {}
+    for index in sorted(range(len(groups)), key=lambda i: (-costs[i], i)):
+        printer = min(printers, key=lambda p: load[p])
+        chosen[index] = printer
+        load[printer] += costs[index]
+
+    assignments: dict[str, list[PrintItem]] = {}
+    for printer in printers:
+        items = [
+            item
+            for index, group in enumerate(groups)
+            if chosen[index] == printer
+            for item in group
+        ]
+        if items:
+            assignments[printer] = items
+    return assignments
+
+
+def _default_thread_factory(
+    sequence: list[PrintItem], settings: AppSettings, printer: str
+) -> QThread:
+    # Every printer's run shares one Windows default printer, so none of
+    # them may swap it.
+    return LabelPrinterThread(
+        sequence=sequence,
+        settings=settings,
+        zebra_printer=printer,
+        allow_default_swap=False,
+    )
+
+
+class PrintFarmController(QObject):
+    """Runs one print worker per printer and merges their results.
+
+    Signals
+    -------
+    printerProgress : (str printer, int current, int total, str description)
+        Forwarded from each printer's worker.
+    progress : (int current, int total, str description)
+        Items started across all printers; the description names the
+        printer.
+    finished : (bool success, str message)
+        Emitted once, after every printer has finished. Success only if
+        every printer succeeded; the message has one block per printer.
+    timingSummary : (str summary)
+        Emitted just before ``finished`` with each printer's timing
+        summary, when any printer reported one.
+    """
+
+    printerProgress = pyqtSignal(str, int, int, str)
+    progress = pyqtSignal(int, int, str)
+    finished = pyqtSignal(bool, str)
+    timingSummary = pyqtSignal(str)
+
+    def __init__(
+        self,
+        assignments: dict[str, list[PrintItem]],
+        settings: AppSettings,
+        thread_factory: Optional[ThreadFactory] = None,
+        parent: Optional[QObject] = None,
+    ) -> None:
+        super().__init__(parent)
+        self._assignments = {p: list(s) for p, s in assignments.items() if s}
+        self._settings = settings
+        self._thread_factory = thread_factory or _default_thread_factory
+        self._threads: dict[str, QThread] = {}
+        self._current: dict[str, int] = {}
+        self._results: dict[str, tuple[bool, str]] = {}
+        self._summaries: dict[str, str] = {}
+        self._total = sum(len(s) for s in self._assignments.values())
+        self._started = False
+        self._done = False
+
+    @property
+    def printers(self) -> list[str]:
+        return list(self._assignments)
+
+    # -- worker-thread contract --------------------------------------
+
+    def start(self) -> None:
+        if self._started:
+            return
+        self._started = True
+        if not self._assignments:
+            self._done = True
+            self.finished.emit(False, "No labels to print")
+            return
+        logger.info(
+            "Print farm: %s",
+            ", ".join(
+                f"{p} ({len(s)} items)" for p, s in self._assignments.items()
+            ),
+        )
+        for printer, sequence in self._assignments.items():
+            thread = self._thread_factory(sequence, self._settings, printer)
+            thread.progress.connect(
+                lambda cur, tot, desc, p=printer: self._on_progress(
+                    p, cur, tot, desc
+                )
+            )
+            summary = getattr(thread, "timingSummary", None)
+            if summary is not None:
+                summary.connect(
+                    lambda text, p=printer: self._summaries.__setitem__(p, text)
+                )
+            thread.finished.connect(
+                lambda ok, msg, p=printer: self._on_printer_finished(p, ok, msg)
+            )
+            self._threads[printer] = thread
+            self._current[printer] = 0
+        for thread in self._threads.values():
+            thread.start()
+
+    def requestInterruption(self) -> None:  # noqa: N802 - QThread contract
+        for thread in self._threads.values():
+            thread.requestInterruption()
+
+    def isRunning(self) -> bool:  # noqa: N802 - QThread contract
+        return self._started and not self._done
+
+    def wait(self, timeout_ms: int) -> bool:
+        """Block until every printer's worker has exited."""
+        return all(t.wait(timeout_ms) for t in self._threads.values())
+
+    # -- per-printer signals ----------------------------------------
+
+    def _on_progress(
+        self, printer: str, current: int, total: int, description: str
+    ) -> None:
+        self._current[printer] = current
+        self.printerProgress.emit(printer, current, total, description)
+        self.progress.emit(
+            sum(self._current.values()),
+            self._total,
+            f"{printer}: {description}",
+        )
+
+    def _on_printer_finished(
+        self, printer: str, success: bool, message: str
+    ) -> None:
+        if printer in self._results:
+            return
+        self._results[printer] = (success, message)
+        if len(self._results) < len(self._threads):
+            return
+        for thread in self._threads.values():
+            thread.wait(2000)
+        self._done = True
+        if self._summaries:
+            self.timingSummary.emit(
+                "  |  ".join(
+                    f"{p}: {self._summaries[p]}"
+                    for p in self._threads
+                    if p in self._summaries
+                )
+            )
+        self.finished.emit(*self._merged_result())
+
+    def _merged_result(self) -> tuple[bool, str]:
+        failed = [p for p, (ok, _msg) in self._results.items() if not ok]
+        count = len(self._results)
+        if failed:
+            headline = f"Printing failed on {len(failed)} of {count} printers"
+        else:
+            headline = f"Printed {self._total} items on {count} printers"
+        blocks = [headline]
+        for printer in self._threads:
+            _ok, message = self._results[printer]
+            body = "\n".join(f"    {line}" for line in message.splitlines())
+            blocks.append(f"{printer}:\n{body}")
+        return not failed, "\n\n".join(blocks)
@@ -0,0 +1,116 @@
+"""Queue-depth pacing for label print runs.
+
+A fixed ``print_delay_seconds`` after every label keeps the spool order
+intact, but a 120-label job then spends four minutes asleep even while the
+Zebra sits idle. :class:`AdaptivePacer` watches the printer's spool queue
+instead and lets the next label go as soon as it is safe:
+
+1. **Ordering** — the label just handed to the ``.ljd`` handler must have
+   reached the spool queue (a JobId not there before submission) before the
+   next one is submitted. The handler spools asynchronously; submitting
+   early is exactly what reorders labels.
+2. **Depth** — the queue must then hold fewer than ``target_depth`` jobs,
+   so the printer is kept busy without a backlog building up.
+
+Whenever the queue cannot be read the pacer falls back to the fixed delay,
+and it never waits longer for a job to appear than that delay would have —
+a label that printed and left the queue before a poll saw it costs exactly
+what it did before. Time and sleeping are injected so the pacing is tested
+against a simulated spooler.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+#: Jobs allowed in the spool queue before the next label is submitted: the
+#: one printing plus one waiting keeps the printer fed.
+DEFAULT_TARGET_DEPTH = 2
+
+#: Queue poll interval while waiting.
+POLL_SECONDS = 0.1
+
+#: Longest wait for the queue to drain below the target depth. A paused or
+#: jammed printer should not hang the run silently; past this the label is
+#: submitted as the fixed delay would have.
+MAX_DEPTH_WAIT_SECONDS = 30.0
+
+ReadJobIds = Callable[[], Optional[list[int]]]
+Sleep = Callable[[float], bool]
+
+
+class AdaptivePacer:
+    """Decides how long to wait after each submitted label.
+
+    ``read_job_ids`` returns the queue's JobIds, or None when unreadable.
+    ``sleep(seconds)`` must return False if the run was cancelled meanwhile
+    (the label printer's interruptible sleep).
+    """
+
+    def __init__(
+        self,
+        read_job_ids: ReadJobIds,
+        target_depth: int = DEFAULT_TARGET_DEPTH,
+        poll_seconds: float = POLL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._read = read_job_ids
+        self._target_depth = max(1, int(target_depth))
+        self._poll = poll_seconds
+        self._clock = clock
+        self._snapshot: Optional[set[int]] = None
+        self.fallbacks = 0
+
+    def before_submit(self) -> None:
+        """Record the queue's JobIds just before a label is submitted."""
+        ids = self._read()
+        self._snapshot = None if ids is None else set(ids)
+
+    def wait_after_submit(self, fallback_delay: float, sleep: Sleep) -> bool:
+        """Wait until the next label may be submitted. False if cancelled."""
+        start = self._clock()
+        deadline = start + max(0.0, fallback_delay)
+        snapshot, self._snapshot = self._snapshot, None
+        if snapshot is None:
+            return self._fall_back(deadline, sleep)
+
+        # 1. Ordering: the submitted job must be in the queue.
+        while True:
+            ids = self._read()
+            if ids is None:
+                return self._fall_back(deadline, sleep)
+            if set(ids) - snapshot:
+                break
+            remaining = deadline - self._clock()
+            if remaining <= 0:
+                # Never seen: it printed between polls, or the handler is
+                # slow. Either way the fixed delay has now elapsed.
+                return True
+            if not sleep(min(self._poll, remaining)):
+                return False
+
+        # 2. Depth: keep the printer fed without building a backlog.
+        depth_deadline = self._clock() + MAX_DEPTH_WAIT_SECONDS
+        while len(ids) >= self._target_depth:
+            if self._clock() >= depth_deadline:
+                logger.warning(
+                    "Spool queue still holds %d jobs after %.0f s; "
+                    "submitting anyway",
+                    len(ids),
+                    MAX_DEPTH_WAIT_SECONDS,
+                )
+                return True
+            if not sleep(self._poll):
+                return False
+            ids = self._read()
+            if ids is None:
+                return self._fall_back(deadline, sleep)
+        return True
+
+    def _fall_back(self, deadline: float, sleep: Sleep) -> bool:
+        self.fallbacks += 1
+        return sleep(max(0.0, deadline - self._clock()))
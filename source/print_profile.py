@@ -0,0 +1,217 @@
+"""Per-item timing for label print runs, and a tool to compare runs.
+
+When a run is slow it is otherwise impossible to tell whether the time goes
+to ShellExecute starting the ``.ljd`` handler, to the spooler, to the pacing
+sleeps or to the printer itself. :class:`PrintProfiler` records, for every
+item of a run:
+
+``build``       building ZPL (raw items only)
+``submit``      handing the item over — ShellExecute, or the spooler write
+``queue_wait``  adaptive pacing: polling the spool queue until it is safe
+``sleep``       fixed delays (label, separator, or pacing fallback)
+
+At the end of the run the label printer writes the report as JSON next to
+the app log (``~/.jobmanager/logs/print_profile_*.json``) and shows a
+one-line summary. ``python -m print_profile`` lists the saved runs side by
+side, so the effect of lowering a delay can be checked against earlier runs
+before it becomes the default.
+"""
+
+from __future__ import annotations
+
+import argparse
+import glob
+import json
+import logging
+import os
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Iterator, Optional
+
+from app_logging import LOG_DIR
+
+logger = logging.getLogger(__name__)
+
+#: Where reports are written; tests point this at a temp dir.
+REPORT_DIR = LOG_DIR
+
+REPORT_PREFIX = "print_profile_"
+
+#: Older reports beyond this many are deleted when a new one is written.
+MAX_REPORTS = 100
+
+STAGES = ("build", "submit", "queue_wait", "sleep")
+
+
+@dataclass
+class ItemTiming:
+    index: int
+    kind: str
+    description: str
+    raw: bool = False
+    build: float = 0.0
+    submit: float = 0.0
+    queue_wait: float = 0.0
+    sleep: float = 0.0
+
+
+@dataclass
+class PrintProfiler:
+    """Collects stage timings for one print run."""
+
+    printer: str
+    label_delay: float
+    separator_delay: float
+    adaptive: bool
+    items: list[ItemTiming] = field(default_factory=list)
+    started_at: float = field(default_factory=time.time)
+    _t0: float = field(default_factory=time.perf_counter, repr=False)
+
+    def start_item(
+        self, index: int, kind: str, description: str
+    ) -> ItemTiming:
+        item = ItemTiming(index=index, kind=kind, description=description)
+        self.items.append(item)
+        return item
+
+    @contextmanager
+    def measure(self, stage: str) -> Iterator[None]:
+        """Add the time spent in the ``with`` block to the current item."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            if self.items:
+                item = self.items[-1]
+                setattr(
+                    item, stage,
+                    getattr(item, stage) + time.perf_counter() - start,
+                )
+
+    def report(self, outcome: str) -> dict:
+        totals = {
+            stage: round(sum(getattr(i, stage) for i in self.items), 4)
+            for stage in STAGES
+        }
+        return {
+            "started": datetime.fromtimestamp(self.started_at).isoformat(
+                timespec="seconds"
+            ),
+            "printer": self.printer,
+            "outcome": outcome,
+            "label_delay": self.label_delay,
+            "separator_delay": self.separator_delay,
+            "adaptive_pacing": self.adaptive,
+            "wall_seconds": round(time.perf_counter() - self._t0, 4),
+            "items": len(self.items),
+            "labels": sum(1 for i in self.items if i.kind == "label"),
+            "raw_items": sum(1 for i in self.items if i.raw),
+            "totals": totals,
+            "timings": [asdict(i) for i in self.items],
+        }
+
+
+def summary_line(report: dict) -> str:
+    """One line for the UI: wall time and where it went."""
+    totals = report["totals"]
+    return (
+        f"Timing: {report['wall_seconds']:.1f} s "
+        f"for {report['items']} items — "
+        f"submit {totals['submit']:.1f} s, "
+        f"queue wait {totals['queue_wait']:.1f} s, "
+        f"sleeps {totals['sleep']:.1f} s, "
+        f"build {totals['build']:.1f} s"
+    )
+
+
+def write_report(
+    report: dict, report_dir: Optional[str] = None
+) -> Optional[str]:
+    """Save *report* as JSON. Returns the path, or None if it failed.
+
+    A failed write is logged and otherwise ignored — profiling must never
+    turn a good print run into a failed one.
+    """
+    target_dir = report_dir or REPORT_DIR
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    path = os.path.join(target_dir, f"{REPORT_PREFIX}{stamp}.json")
+    try:
+        os.makedirs(target_dir, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2)
+        for old in list_reports(target_dir)[:-MAX_REPORTS]:
+            os.remove(old)
+    except OSError:
+        logger.exception("Could not write print profile to %s", path)
+        return None
+    return path
+
+
+def list_reports(report_dir: Optional[str] = None) -> list[str]:
+    """Saved report paths, oldest first."""
+    pattern = os.path.join(report_dir or REPORT_DIR, f"{REPORT_PREFIX}*.json")
+    return sorted(glob.glob(pattern))
+
+
+def load_reports(paths: list[str]) -> list[dict]:
+    reports = []
+    for path in paths:
+        try:
+            with open(path, "r", encoding="utf-8") as fh:
+                reports.append(json.load(fh))
+        except (OSError, json.JSONDecodeError):
+            logger.warning("Skipping unreadable print profile %s", path)
+    return reports
+
+
+def format_comparison(reports: list[dict]) -> str:
+    """Table of runs, one per line, with per-label averages."""
+    header = (
+        f"{'started':<20} {'outcome':<9} {'items':>5} {'delay':>6} "
+        f"{'adapt':>5} {'wall s':>8} {'s/item':>7} {'submit':>7} "
+        f"{'q-wait':>7} {'sleep':>7}"
+    )
+    lines = [header, "-" * len(header)]
+    for rep in reports:
+        items = max(1, int(rep.get("items", 0)))
+        totals = rep.get("totals", {})
+        lines.append(
+            f"{rep.get('started', '?'):<20} {rep.get('outcome', '?'):<9} "
+            f"{rep.get('items', 0):>5} {rep.get('label_delay', 0):>6.1f} "
+            f"{'yes' if rep.get('adaptive_pacing') else 'no':>5} "
+            f"{rep.get('wall_seconds', 0):>8.1f} "
+            f"{rep.get('wall_seconds', 0) / items:>7.2f} "
+            f"{totals.get('submit', 0) / items:>7.2f} "
+            f"{totals.get('queue_wait', 0) / items:>7.2f} "
+            f"{totals.get('sleep', 0) / items:>7.2f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m print_profile",
+        description="Compare saved label print run timings.",
+    )
+    parser.add_argument(
+        "--dir", default=REPORT_DIR, help="report folder (default: app logs)"
+    )
+    parser.add_argument(
+        "--last", type=int, default=20, help="show the N most recent runs"
+    )
+    args = parser.parse_args(argv)
+
+    paths = list_reports(args.dir)[-max(1, args.last):]
+    reports = load_reports(paths)
+    if not reports:
+        print(f"No print profiles found in {args.dir}")
+        return 1
+    print(format_comparison(reports))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
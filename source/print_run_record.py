@@ -0,0 +1,157 @@
+"""Persistent record of the current print run, so it can be resumed.
+
+A cancelled or failed run used to leave only a "sent N of M items" message:
+the operator had to reprint the whole job or pick labels by hand. The print
+worker now keeps a record of its run — the exact sequence, the printer, the
+jobs it covers and how many items have reached the spooler — and the
+Print > Resume Print action continues from the next item (or any item the
+operator picks) with the very same sequence, even after a restart.
+
+State lives next to the history file in ``~/.jobmanager``:
+
+``print_run.json``
+    The run itself, written once when the run starts.
+``print_run.progress``
+    The number of items confirmed sent, rewritten (atomically) after each
+    submit. Kept separate so a run of thousands of labels does not rewrite
+    the whole sequence per label.
+
+Both files are removed when a run completes. Only one run is recorded —
+the interactive one; a new run replaces any earlier unfinished record.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+from dataclasses import asdict, dataclass, fields
+from datetime import datetime
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    # Only needed to resume a run: the window checks for an unfinished
+    # run at startup, long before anything is printed.
+    from print_sequencer import PrintItem
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RECORD_DIR = os.path.join(os.path.expanduser("~"), ".jobmanager")
+
+_RUN_FILE = "print_run.json"
+_PROGRESS_FILE = "print_run.progress"
+
+
+@dataclass(frozen=True)
+class SavedRun:
+    """An unfinished run as loaded from disk."""
+
+    printer: str
+    #: ``(job_name, job_type_name)`` of every job the run prints.
+    jobs: tuple[tuple[str, str], ...]
+    sequence: tuple[PrintItem, ...]
+    #: Items confirmed sent; the run continues at ``sequence[sent]``.
+    sent: int
+    started: str
+
+    @property
+    def total(self) -> int:
+        return len(self.sequence)
+
+
+class PrintRunRecord:
+    """Reads and writes the resumable print-run record."""
+
+    def __init__(self, record_dir: str | None = None) -> None:
+        self._dir = record_dir or DEFAULT_RECORD_DIR
+        os.makedirs(self._dir, exist_ok=True)
+        self._run_path = os.path.join(self._dir, _RUN_FILE)
+        self._progress_path = os.path.join(self._dir, _PROGRESS_FILE)
+
+    # -- public API --------------------------------------------------
+
+    def start(
+        self,
+        printer: str,
+        jobs: list[tuple[str, str]],
+        sequence: list[PrintItem],
+    ) -> None:
+        """Record a new run (replacing any earlier one) with nothing sent."""
+        data = {
+            "printer": printer,
+            "jobs": [list(job) for job in jobs],
+            "started": datetime.now().isoformat(timespec="seconds"),
+            "sequence": [asdict(item) for item in sequence],
+        }
+        self._write(self._run_path, json.dumps(data, ensure_ascii=False))
+        self.mark_sent(0)
+
+    def mark_sent(self, count: int) -> None:
+        """Record that the first *count* items have reached the spooler."""
+        self._write(self._progress_path, str(int(count)))
+
+    def finish(self) -> None:
+        """Forget the run — it completed."""
+        for path in (self._progress_path, self._run_path):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def has_unfinished(self) -> bool:
+        """Cheap check (no parsing) for a run that can be resumed."""
+        return os.path.exists(self._run_path)
+
+    def load(self) -> Optional[SavedRun]:
+        """Return the unfinished run, or None if there is none (or it is
+        unreadable — a damaged record is logged and ignored)."""
+        try:
+            with open(self._run_path, "r", encoding="utf-8") as fh:
+                data = json.load(fh)
+            sequence = tuple(_item_from_dict(d) for d in data["sequence"])
+            jobs = tuple((str(n), str(t)) for n, t in data.get("jobs", []))
+            printer = str(data["printer"])
+            started = str(data.get("started", ""))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            logger.warning("Ignoring unreadable print run record: %s", exc)
+            return None
+        return SavedRun(
+            printer=printer,
+            jobs=jobs,
+            sequence=sequence,
+            sent=min(self._read_sent(), len(sequence)),
+            started=started,
+        )
+
+    # -- internal helpers --------------------------------------------
+
+    def _read_sent(self) -> int:
+        try:
+            with open(self._progress_path, "r", encoding="utf-8") as fh:
+                return max(0, int(fh.read().strip() or 0))
+        except (OSError, ValueError):
+            return 0
+
+    def _write(self, path: str, text: str) -> None:
+        """Atomically replace *path* with *text*."""
+        fd, tmp_path = tempfile.mkstemp(
+            dir=self._dir, suffix=".tmp", prefix="print_run_"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                fh.write(text)
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+
+def _item_from_dict(data: dict) -> PrintItem:
+    from print_sequencer import PrintItem
+
+    known = {f.name for f in fields(PrintItem)}
+    return PrintItem(**{k: v for k, v in data.items() if k in known})
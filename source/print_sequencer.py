@@ -1,29 +1,55 @@
 """Pure logic for building Zebra label print sequences.
 
 The Zebra GC420D emits a stack of labels. First printed = bottom of stack =
-last peeled. Last printed = top of stack = first peeled. All public functions
-in this module are pure: no I/O, no globals, no side effects.
+last peeled. Last printed = top of stack = first peeled. The sequence
+builders do no I/O and have no side effects. The one piece of module state is
+:func:`separator_item`'s ``lru_cache``, which only hands out shared,
+immutable items.
+
+Needs Python 3.10 or later: :class:`PrintItem` is a ``slots=True`` dataclass.
 """
 
 from __future__ import annotations
 
 import os
+import re
+import sys
+from bisect import bisect_right
+from collections import Counter
+from collections.abc import Sequence as SequenceABC
 from dataclasses import dataclass
-from typing import Iterable
+from functools import lru_cache
+from itertools import accumulate
+from typing import Callable, Iterable, Iterator, Mapping, NamedTuple, Sequence
+
+try:  # NumPy is optional; large batches sort faster with it.
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:  # pragma: no cover - depends on environment
+    np = None
+    HAS_NUMPY = False
 
 LABEL_KIND = "label"
 SEPARATOR_LABEL_KIND = "separator"
+#: Banner on top of each job's stack in a multi-job batch.
+JOB_SEPARATOR_KIND = "job_separator"
 
 UNKNOWN_MATERIAL = "UNKNOWN"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PrintItem:
     """A single item in a print sequence.
 
     Separators carry ``job_name`` so every printed separator reads
     ``JOB NAME / MATERIAL`` — the operator can always see which job a stack
     belongs to while peeling.
+
+    Slotted (``slots=True``, Python 3.10+), so a label item is a handful of
+    references with no per-item ``__dict__``; its material string is shared
+    with every other label of the same material (see
+    :func:`parse_ljd_filenames`).
     """
 
     kind: str
@@ -33,6 +59,126 @@ class PrintItem:
     job_name: str = ""
 
 
+@lru_cache(maxsize=1024)
+def separator_item(kind: str, material: str, job_name: str) -> PrintItem:
+    """The one shared :class:`PrintItem` for a separator or job banner.
+
+    Items are immutable, so every sequence naming the same separator —
+    rebuilt plans, batches, reprints — can hold the same instance.
+    """
+    return PrintItem(
+        kind=kind,
+        file_path="",
+        material=material,
+        board_number=None,
+        job_name=job_name,
+    )
+
+
+class _LabelRun:
+    """One material's labels in print order, made on demand from its entries.
+
+    ``entries`` are ``(board, path)`` sorted ascending by board; with
+    ``descending`` the run prints them from the last entry back.
+    """
+
+    __slots__ = ("material", "entries", "descending")
+
+    def __init__(
+        self,
+        material: str,
+        entries: Sequence[tuple[int, str]],
+        descending: bool,
+    ) -> None:
+        self.material = material
+        self.entries = entries
+        self.descending = descending
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __getitem__(self, index: int) -> PrintItem:
+        if self.descending:
+            index = len(self.entries) - 1 - index
+        board, path = self.entries[index]
+        return PrintItem(LABEL_KIND, path, self.material, board)
+
+    def __iter__(self) -> Iterator[PrintItem]:
+        entries = self.entries
+        source = reversed(entries) if self.descending else iter(entries)
+        material = self.material
+        for board, path in source:
+            yield PrintItem(LABEL_KIND, path, material, board)
+
+    def __reversed__(self) -> Iterator[PrintItem]:
+        return iter(
+            _LabelRun(self.material, self.entries, not self.descending)
+        )
+
+
+class PrintSequence(SequenceABC):
+    """Read-only print sequence that makes its :class:`PrintItem` s on demand.
+
+    Built from segments — runs of one material's labels over the grouped
+    ``(board, path)`` entries, and short tuples of ready items such as
+    separators — so a sequence costs a few objects per material rather
+    than one per label, however large the job. Supports ``len()``, random
+    access (for progress and resume), iteration in both directions and
+    comparison with any list or tuple of items. Slicing returns a list.
+    """
+
+    __slots__ = ("_segments", "_starts", "_length")
+
+    def __init__(self, segments: Iterable = ()) -> None:
+        flat: list = []
+        for segment in segments:
+            if isinstance(segment, PrintSequence):
+                flat.extend(segment._segments)
+            elif isinstance(segment, _LabelRun):
+                if len(segment):
+                    flat.append(segment)
+            else:
+                items = tuple(segment)
+                if items:
+                    flat.append(items)
+        self._segments: tuple = tuple(flat)
+        self._starts = [0, *accumulate(len(s) for s in flat)]
+        self._length = self._starts.pop()
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("print sequence index out of range")
+        segment = bisect_right(self._starts, index) - 1
+        return self._segments[segment][index - self._starts[segment]]
+
+    def __iter__(self) -> Iterator[PrintItem]:
+        for segment in self._segments:
+            yield from segment
+
+    def __reversed__(self) -> Iterator[PrintItem]:
+        for segment in reversed(self._segments):
+            yield from reversed(segment)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (PrintSequence, list, tuple)):
+            return NotImplemented
+        return len(other) == self._length and all(
+            a == b for a, b in zip(self, other)
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"PrintSequence({list(self)!r})"
+
+
 def extract_material_from_filename(
     filename: str,
 ) -> tuple[str, str, int] | None:
@@ -71,28 +217,157 @@ def extract_material_from_filename(
     return job_name, material, board_number
 
 
+class FilenameColumns(NamedTuple):
+    """Parsed label filenames as parallel columns, one row per input name.
+
+    Rows that do not parse hold ``None`` in all three columns.
+    """
+
+    jobs: list[str | None]
+    materials: list[str | None]
+    boards: list[int | None]
+
+
+def _filename_batch_pattern() -> re.Pattern[str]:
+    """One line of a newline-joined batch, parsed or matched whole.
+
+    Mirrors :func:`extract_material_from_filename` on this platform's path
+    separators. Like ``os.path.splitext`` the stem ends at the basename's
+    last dot, unless that dot only leads the name: the first branch parses
+    a name with an extension, the second one without, and the last one
+    consumes a line that does not parse.
+    """
+    seps = re.escape(os.sep + (os.altsep or ""))
+    if os.name == "nt":
+        seps += ":"  # basename also strips a drive ("C:JOB_...")
+    return re.compile(
+        rf"(?:[^\n]*[{seps}])?(?:"
+        rf"(?P<job>[^\n{seps}]+?)_(?P<material>[^_\n{seps}]+)_(?P<board>\d+)"
+        rf"\.[^.\n{seps}]*"
+        rf"|(?P<bare_job>\.+[^.\n{seps}]*?|[^.\n{seps}]+?)"
+        rf"_(?P<bare_material>[^._\n{seps}]+)_(?P<bare_board>\d+)"
+        rf"|[^\n]*)\n"
+    )
+
+
+_FILENAME_BATCH_RE = _filename_batch_pattern()
+
+#: Above this many files the grouping sort goes through NumPy when present.
+_NUMPY_MIN_FILES = 5000
+
+
+def parse_ljd_filenames(names: Sequence[str]) -> FilenameColumns:
+    """Parse many label filenames at once into job/material/board columns.
+
+    Equivalent to calling :func:`extract_material_from_filename` on each
+    name, but the names are joined and scanned by a single compiled regex,
+    so the per-name string work stays in C. Job and material strings are
+    interned: a job's thousands of labels share one string per material.
+    A name containing a newline cannot be scanned that way and sends the
+    batch down the per-name path.
+    """
+    if not names:
+        return FilenameColumns([], [], [])
+    text = "\n".join(names) + "\n"
+    if text.count("\n") != len(names):
+        parsed = [extract_material_from_filename(name) for name in names]
+        return FilenameColumns(
+            [p[0] if p else None for p in parsed],
+            [p[1] if p else None for p in parsed],
+            [p[2] if p else None for p in parsed],
+        )
+    jobs, materials, boards, bare_jobs, bare_materials, bare_boards = (
+        list(column) for column in zip(*_FILENAME_BATCH_RE.findall(text))
+    )
+    if boards.count(""):
+        # Some names have no extension or do not parse: patch those rows.
+        for index, board in enumerate(boards):
+            if board:
+                continue
+            if bare_boards[index]:
+                jobs[index] = bare_jobs[index]
+                materials[index] = bare_materials[index]
+                boards[index] = bare_boards[index]
+            else:
+                jobs[index] = materials[index] = boards[index] = None
+    return FilenameColumns(
+        [None if job is None else sys.intern(job) for job in jobs],
+        [None if m is None else sys.intern(m) for m in materials],
+        [None if board is None else int(board) for board in boards],
+    )
+
+
 def group_ljd_files_by_material(
     ljd_files: Iterable[str],
 ) -> dict[str, list[tuple[int, str]]]:
-    """Group files by material, preserving original paths.
+    """Group ``.ljd`` files by material extracted from the filename.
 
     Each value is a list of ``(board_number, file_path)`` tuples sorted
     ascending by board number. Files that fail to parse are collected in the
     ``UNKNOWN`` bucket with ``board_number=-1`` so nothing is silently dropped.
     """
+    paths = list(ljd_files)
+    columns = parse_ljd_filenames(paths)
+
+    # Materials are coded in first-seen order, so one stable sort on
+    # (code, board, path) leaves every bucket contiguous and sorted, with
+    # the buckets in the order a per-file loop would have created them.
+    codes: dict[str | None, int] = {}
+    keys = [codes.setdefault(m, len(codes)) for m in columns.materials]
+    boards = columns.boards
+    if None in codes:
+        boards = [
+            -1 - index if board is None else board
+            for index, board in enumerate(boards)
+        ]
+        if UNKNOWN_MATERIAL in codes:
+            # A file really named ..._UNKNOWN_... shares the bucket, which
+            # sorts where the first of the two was seen.
+            pair = (codes[None], codes[UNKNOWN_MATERIAL])
+            keys = [min(pair) if k in pair else k for k in keys]
+
+    order = _argsort_rows(keys, boards, paths)
+    rows = list(
+        zip(map(boards.__getitem__, order), map(paths.__getitem__, order))
+    )
+    counts = Counter(keys)
     grouped: dict[str, list[tuple[int, str]]] = {}
-    for index, path in enumerate(ljd_files):
-        parsed = extract_material_from_filename(path)
-        if parsed is None:
-            grouped.setdefault(UNKNOWN_MATERIAL, []).append((-1 - index, path))
+    start = 0
+    for material, code in codes.items():
+        name = UNKNOWN_MATERIAL if material is None else material
+        if name in grouped:
             continue
-        _job, material, board = parsed
-        grouped.setdefault(material, []).append((board, path))
+        grouped[name] = rows[start:start + counts[code]]
+        start += counts[code]
+    return grouped
 
-    for material in grouped:
-        grouped[material].sort(key=lambda entry: (entry[0], entry[1]))
 
-    return grouped
+def _argsort_rows(
+    keys: list[int], boards: list[int], paths: list[str]
+) -> list[int]:
+    """Row order of one stable ascending sort on ``(key, board, path)``.
+
+    Key and board fold into one integer per row, so the sort compares
+    ints; the path only breaks ties, which need the same board number of
+    the same material twice and so are rare enough to sort as tuples.
+    """
+    if not paths:
+        return []
+    low = min(boards)
+    span = max(boards) - low + 1
+    composite = [key * span + board - low for key, board in zip(keys, boards)]
+    if len(set(composite)) != len(composite):
+        return sorted(
+            range(len(paths)), key=lambda i: (composite[i], paths[i])
+        )
+    if HAS_NUMPY and len(paths) >= _NUMPY_MIN_FILES:
+        try:
+            return np.argsort(
+                np.array(composite, dtype=np.int64), kind="stable"
+            ).tolist()
+        except OverflowError:  # board numbers beyond 64 bits
+            pass
+    return sorted(range(len(paths)), key=composite.__getitem__)
 
 
 def detect_materials_in_job(
@@ -117,8 +392,16 @@ def detect_materials_in_job(
 
     An empty or all-invalid ``ljd_files`` input returns an empty list.
     """
-    files_list = list(ljd_files)
-    grouped = group_ljd_files_by_material(files_list)
+    return detect_materials_in_groups(
+        group_ljd_files_by_material(ljd_files), default_priority
+    )
+
+
+def detect_materials_in_groups(
+    grouped: Mapping[str, Sequence[tuple[int, str]]],
+    default_priority: tuple[str, ...],
+) -> list[tuple[str, int]]:
+    """:func:`detect_materials_in_job` for already-grouped files."""
     if not grouped:
         return []
 
@@ -161,66 +444,202 @@ def compute_peel_order(
     return listed + unlisted
 
 
-def _within_material_peel_order(
-    entries: list[tuple[int, str]],
-    reverse_within: bool,
-) -> list[tuple[int, str]]:
-    """Return per-material peel order.
+def build_print_sequence(
+    job_name: str,
+    ljd_files: Iterable[str],
+    material_priority: tuple[str, ...] = (),
+    reverse_within: bool = True,
+    include_separators: bool = True,
+) -> PrintSequence:
+    """Build the full print sequence for a job.
 
-    ``entries`` is sorted ascending by board number. When ``reverse_within``
-    is True, peel order is ascending (board 1 first) so the printer will emit
-    descending and board 1 ends up on top. When False, peel order is
-    descending, which flips the printer output.
+    Returns a :class:`PrintSequence` of :class:`PrintItem` in the exact order
+    the printer will emit them. First item = first printed = bottom of
+    stack = last peeled.
     """
-    if reverse_within:
-        return list(entries)
-    return list(reversed(entries))
+    return build_print_sequence_from_groups(
+        job_name,
+        group_ljd_files_by_material(ljd_files),
+        material_priority=material_priority,
+        reverse_within=reverse_within,
+        include_separators=include_separators,
+    )
 
 
-def build_print_sequence(
+def build_print_sequence_from_groups(
     job_name: str,
-    ljd_files: Iterable[str],
+    grouped: Mapping[str, Sequence[tuple[int, str]]],
     material_priority: tuple[str, ...] = (),
     reverse_within: bool = True,
     include_separators: bool = True,
-) -> list[PrintItem]:
-    """Build the full print sequence for a job.
+) -> PrintSequence:
+    """:func:`build_print_sequence` for already-grouped files.
 
-    Returns a list of :class:`PrintItem` in the exact order the printer will
-    emit them. First item = first printed = bottom of stack = last peeled.
+    Lets a caller that parsed the filenames once (see
+    :mod:`sequence_plan`) build sequences without parsing them again.
     """
-    files_list = list(ljd_files)
-    grouped = group_ljd_files_by_material(files_list)
     if not grouped:
-        return []
+        return PrintSequence()
 
     materials_present = list(grouped.keys())
     counts = {m: len(entries) for m, entries in grouped.items()}
     peel_materials = compute_peel_order(materials_present, material_priority, counts)
 
-    peel_items: list[PrintItem] = []
-    for material in peel_materials:
-        entries = _within_material_peel_order(grouped[material], reverse_within)
+    # Print order is the reverse of peel order: the last item peeled is the
+    # first one printed (bottom of the stack). Each material prints its
+    # labels, then its separator on top.
+    segments: list = []
+    for material in reversed(peel_materials):
+        # Peel order within a material is ascending with reverse_within,
+        # so the printer emits the labels descending.
+        entries = grouped[material]
+        if not isinstance(entries, tuple):
+            entries = tuple(entries)  # the view must not see later edits
+        segments.append(_LabelRun(material, entries, reverse_within))
         if include_separators:
-            peel_items.append(
-                PrintItem(
-                    kind=SEPARATOR_LABEL_KIND,
-                    file_path="",
-                    material=material,
-                    board_number=None,
-                    job_name=job_name,
-                )
-            )
-        for board, path in entries:
-            peel_items.append(
-                PrintItem(
-                    kind=LABEL_KIND,
-                    file_path=path,
-                    material=material,
-                    board_number=board,
-                )
+            segments.append(
+                (separator_item(SEPARATOR_LABEL_KIND, material, job_name),)
             )
+    return PrintSequence(segments)
 
-    # Print order is the reverse of peel order: the last item peeled is the
-    # first one printed (bottom of the stack).
-    return list(reversed(peel_items))
+
+@dataclass(frozen=True)
+class BatchJob:
+    """One job of a batch print, with its confirmed material order."""
+
+    job_name: str
+    ljd_files: tuple[str, ...]
+    material_priority: tuple[str, ...] = ()
+
+
+def build_batch_print_sequence(
+    jobs: Iterable[BatchJob],
+    reverse_within: bool = True,
+    include_separators: bool = True,
+    build: Callable[..., Sequence[PrintItem]] | None = None,
+) -> PrintSequence:
+    """Build one print sequence covering several jobs.
+
+    ``jobs`` is in peel order: the first job ends up on top of the stack.
+    Each job's part is exactly its :func:`build_print_sequence` output,
+    topped by a ``JOB_SEPARATOR_KIND`` banner so the operator can see where
+    one job ends while peeling.
+    Jobs with no printable labels are skipped. ``build`` replaces
+    :func:`build_print_sequence` for each job (same signature), e.g. with
+    a cached equivalent.
+    """
+    build = build or build_print_sequence
+    parts: list[PrintSequence] = []
+    for job in jobs:
+        sequence = build(
+            job.job_name,
+            job.ljd_files,
+            material_priority=job.material_priority,
+            reverse_within=reverse_within,
+            include_separators=include_separators,
+        )
+        if not sequence:
+            continue
+        banner = separator_item(JOB_SEPARATOR_KIND, "", job.job_name)
+        parts.append(PrintSequence([sequence, (banner,)]))
+
+    # The first job is peeled first, so it is printed last.
+    return PrintSequence(reversed(parts))
+
+
+@dataclass(frozen=True)
+class BoardSelection:
+    """Boards picked for a reprint (see :func:`parse_board_selection`).
+
+    Each term is ``(material, first, last)``: ``material`` None matches any
+    material, and ``first``/``last`` None matches every board.
+    """
+
+    terms: tuple[tuple[str | None, int | None, int | None], ...]
+
+    def matches(self, material: str, board: int) -> bool:
+        material = material.upper()
+        return any(
+            (want is None or want == material)
+            and (first is None or first <= board <= last)
+            for want, first, last in self.terms
+        )
+
+
+def _parse_board_range(text: str, token: str) -> tuple[int, int]:
+    first, sep, last = text.partition("-")
+    if not first.strip().isdigit() or (sep and not last.strip().isdigit()):
+        raise ValueError(f"Not a board number or range: {token!r}")
+    low = int(first)
+    high = int(last) if sep else low
+    if high < low:
+        raise ValueError(f"Range runs backwards: {token!r}")
+    return low, high
+
+
+def parse_board_selection(text: str) -> BoardSelection:
+    """Parse a reprint selection such as ``"7, 12-15, WHMR, OAK:3-5"``.
+
+    Terms are separated by commas or whitespace:
+
+    ``7`` / ``12-15``
+        Board numbers (any material).
+    ``WHMR``
+        Every board of a material (case-insensitive).
+    ``OAK:3-5``
+        Boards of one material only.
+
+    Raises ``ValueError`` naming the first term it cannot read, or when
+    nothing was selected.
+    """
+    terms: list[tuple[str | None, int | None, int | None]] = []
+    for token in text.replace(",", " ").split():
+        material, colon, boards = token.partition(":")
+        if colon:
+            if not material:
+                raise ValueError(f"Missing material before ':' in {token!r}")
+            first, last = _parse_board_range(boards, token)
+            terms.append((material.upper(), first, last))
+        elif token[0].isdigit():
+            terms.append((None, *_parse_board_range(token, token)))
+        else:
+            terms.append((token.upper(), None, None))
+    if not terms:
+        raise ValueError("Nothing selected")
+    return BoardSelection(tuple(terms))
+
+
+def build_reprint_sequence(
+    job_name: str,
+    ljd_files: Iterable[str],
+    selection: BoardSelection,
+    material_priority: tuple[str, ...] = (),
+    reverse_within: bool = True,
+    include_separators: bool = True,
+) -> PrintSequence:
+    """Build the print sequence for just the selected boards of a job.
+
+    The selected files go through :func:`build_print_sequence`, so the
+    reprint follows the same material order, within-material order and
+    separator rules as a full print — only materials with a selected board
+    get a separator. Files whose names cannot be parsed are only included
+    when ``UNKNOWN`` is selected. Returns an empty sequence if nothing
+    matches.
+    """
+    chosen = []
+    for path in ljd_files:
+        parsed = extract_material_from_filename(path)
+        if parsed is None:
+            if selection.matches(UNKNOWN_MATERIAL, -1):
+                chosen.append(path)
+            continue
+        _job, material, board = parsed
+        if selection.matches(material, board):
+            chosen.append(path)
+    return build_print_sequence(
+        job_name,
+        chosen,
+        material_priority=material_priority,
+        reverse_within=reverse_within,
+        include_separators=include_separators,
+    )
@@ -0,0 +1,248 @@
+"""Event-driven printer monitor built on spooler change notifications.
+
+The status pill used to start a fresh poll thread every
+``status_poll_interval_ms`` to run ``EnumPrinters`` — seconds of blocking
+against a slow print server, repeated forever even when nothing changes.
+:class:`PrinterMonitorThread` instead runs one long-lived thread that sleeps
+in the spooler's own change notification
+(``FindFirstPrinterChangeNotification`` on the local print server) and only
+enumerates printers when the spooler reports that the printer list
+changed. While idle it makes no spooler calls and uses no CPU.
+
+What the thread waits on is a *backend*:
+
+:class:`SpoolerChangeBackend`
+    The Windows spooler notification (needs pywin32).
+:class:`PollingBackend`
+    A plain timer, the fallback when the notification cannot be opened or
+    fails — the old polling behaviour, on the same interval.
+:class:`FakeChangeBackend`
+    Changes are injected by calling :meth:`FakeChangeBackend.notify`; used
+    by the tests and on machines without pywin32, where there is no spooler
+    to watch.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Callable, Optional
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+import printer_service
+
+logger = logging.getLogger(__name__)
+
+try:
+    import win32event  # type: ignore[import-not-found]
+    import win32print  # type: ignore[import-not-found]
+
+    HAS_WIN32 = True
+except ImportError:  # pragma: no cover - exercised via the fake backend
+    win32event = None  # type: ignore[assignment]
+    win32print = None  # type: ignore[assignment]
+    HAS_WIN32 = False
+
+#: ``PRINTER_CHANGE_PRINTER``: a printer was added, deleted or changed.
+PRINTER_CHANGE_PRINTER = 0x000000FF
+#: ``PRINTER_CHANGE_JOB``: a job was added, deleted or changed.
+PRINTER_CHANGE_JOB = 0x0000FF00
+
+_WAIT_OBJECT_0 = 0
+
+
+class SpoolerChangeBackend:
+    """Waits on the local print server's change notification."""
+
+    def __init__(self) -> None:
+        self._server = None
+        self._change = None
+        self._wake = win32event.CreateEvent(None, True, False, None)
+
+    def open(self) -> None:
+        self._server = win32print.OpenPrinter(None)
+        self._change = win32print.FindFirstPrinterChangeNotification(
+            self._server, PRINTER_CHANGE_PRINTER | PRINTER_CHANGE_JOB, 0, None
+        )
+
+    def wait(self) -> int:
+        """Block until the spooler reports a change; return its flags.
+
+        Returns 0 when woken by :meth:`wake` instead.
+        """
+        result = win32event.WaitForMultipleObjects(
+            [self._change, self._wake], False, win32event.INFINITE
+        )
+        if result != _WAIT_OBJECT_0:
+            return 0
+        # Re-arms the notification for the next change.
+        flags, _info = win32print.FindNextPrinterChangeNotification(
+            self._change, 0
+        )
+        return int(flags)
+
+    def wake(self) -> None:
+        win32event.SetEvent(self._wake)
+
+    def close(self) -> None:
+        if self._change is not None:
+            win32print.FindClosePrinterChangeNotification(self._change)
+            self._change = None
+        if self._server is not None:
+            win32print.ClosePrinter(self._server)
+            self._server = None
+
+
+class PollingBackend:
+    """Reports a printer-list change every *interval_ms* (the old polling)."""
+
+    def __init__(self, interval_ms: int) -> None:
+        self._interval = max(1, int(interval_ms)) / 1000.0
+        self._woken = threading.Event()
+
+    def open(self) -> None:
+        pass
+
+    def wait(self) -> int:
+        if self._woken.wait(self._interval):
+            return 0
+        return PRINTER_CHANGE_PRINTER
+
+    def wake(self) -> None:
+        self._woken.set()
+
+    def close(self) -> None:
+        pass
+
+
+class FakeChangeBackend:
+    """A backend whose changes are injected with :meth:`notify`."""
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self._pending = 0
+        self._woken = False
+        self.open_error: Optional[BaseException] = None
+
+    def notify(self, flags: int = PRINTER_CHANGE_PRINTER) -> None:
+        with self._cond:
+            self._pending |= flags
+            self._cond.notify_all()
+
+    def open(self) -> None:
+        if self.open_error is not None:
+            raise self.open_error
+
+    def wait(self) -> int:
+        with self._cond:
+            self._cond.wait_for(lambda: self._pending or self._woken)
+            flags, self._pending = self._pending, 0
+            return flags
+
+    def wake(self) -> None:
+        with self._cond:
+            self._woken = True
+            self._cond.notify_all()
+
+    def close(self) -> None:
+        pass
+
+
+def default_backend():
+    """The spooler notification where pywin32 is present, else an idle fake."""
+    if HAS_WIN32:
+        try:
+            return SpoolerChangeBackend()
+        except Exception:  # noqa: BLE001 - the monitor falls back to polling
+            logger.exception("Cannot create spooler change event")
+    return FakeChangeBackend()
+
+
+class PrinterMonitorThread(QThread):
+    """Long-lived thread turning spooler changes into Qt signals.
+
+    Signals
+    -------
+    printersListed : (list names)
+        The installed printers, after the initial enumeration and after
+        every printer-list change. Connects and disconnects show up as
+        names appearing in or leaving the list.
+    queueChanged : ()
+        A job was added to, removed from or changed in a queue.
+    """
+
+    printersListed = pyqtSignal(list)
+    queueChanged = pyqtSignal()
+
+    def __init__(
+        self,
+        backend=None,
+        list_printers: Optional[Callable[[], list[str]]] = None,
+        fallback_interval_ms: int = 10000,
+        parent=None,
+    ) -> None:
+        super().__init__(parent)
+        self._backend = backend if backend is not None else default_backend()
+        self._list_printers = list_printers or printer_service.list_printers
+        self._fallback_interval_ms = fallback_interval_ms
+
+    def stop(self, timeout_ms: int = 5000) -> bool:
+        """Ask the thread to exit, wake its wait, and join it."""
+        self.requestInterruption()
+        try:
+            self._backend.wake()
+        except Exception:  # noqa: BLE001 - the wait still ends on interrupt
+            logger.exception("Printer monitor wake failed")
+        return self.wait(timeout_ms)
+
+    def run(self) -> None:  # noqa: D102 - QThread override
+        try:
+            self._backend.open()
+        except Exception:  # noqa: BLE001 - fall back, never give up
+            logger.warning(
+                "Spooler change notifications unavailable; polling instead",
+                exc_info=True,
+            )
+            self._fall_back_to_polling()
+
+        self._enumerate()
+        while not self.isInterruptionRequested():
+            try:
+                flags = self._backend.wait()
+            except Exception:  # noqa: BLE001 - fall back, never give up
+                logger.warning(
+                    "Spooler change notification failed; polling instead",
+                    exc_info=True,
+                )
+                self._close_backend()
+                self._fall_back_to_polling()
+                continue
+            if self.isInterruptionRequested():
+                break
+            if flags & PRINTER_CHANGE_PRINTER:
+                self._enumerate()
+            if flags & PRINTER_CHANGE_JOB:
+                self.queueChanged.emit()
+        self._close_backend()
+
+    # -- internal helpers --------------------------------------------
+
+    def _fall_back_to_polling(self) -> None:
+        self._backend = PollingBackend(self._fallback_interval_ms)
+        if self.isInterruptionRequested():
+            self._backend.wake()
+
+    def _close_backend(self) -> None:
+        try:
+            self._backend.close()
+        except Exception:  # noqa: BLE001 - closing is best effort
+            logger.exception("Printer monitor backend close failed")
+
+    def _enumerate(self) -> None:
+        try:
+            names = list(self._list_printers())
+        except Exception:  # noqa: BLE001 - contract: the monitor never raises
+            logger.exception("Printer enumeration failed")
+            names = []
+        self.printersListed.emit(names)
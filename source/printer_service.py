@@ -100,6 +100,11 @@ def find_zebra_printer() -> Optional[str]:
     return match_zebra_printer(list_printers())
 
 
+def find_zebra_printers() -> list[str]:
+    """Return every installed printer matching a known Zebra driver hint."""
+    return [name for name in list_printers() if is_zebra_name(name)]
+
+
 def get_default_printer() -> Optional[str]:
     """Return the Windows default printer name, or None on error/unavailable."""
     if not HAS_WIN32:
@@ -111,6 +116,18 @@ def get_default_printer() -> Optional[str]:
         return None
 
 
+def _write_raw_document(hPrinter, data: bytes, doc_name: str) -> int:
+    """Spool *data* as one RAW document on an open handle. Returns the JobId."""
+    job_id = win32print.StartDocPrinter(hPrinter, 1, (doc_name, None, "RAW"))
+    try:
+        win32print.StartPagePrinter(hPrinter)
+        win32print.WritePrinter(hPrinter, data)
+        win32print.EndPagePrinter(hPrinter)
+    finally:
+        win32print.EndDocPrinter(hPrinter)
+    return job_id
+
+
 def send_raw_zpl(
     printer_name: str,
     zpl_bytes: bytes,
@@ -118,6 +135,10 @@ def send_raw_zpl(
 ) -> None:
     """Send raw ZPL bytes directly to the named printer.
 
+    Opens and closes the printer for this one document — right for a single
+    test label. A print run sending many should hold a
+    :class:`RawPrinterSession` instead.
+
     Raises :class:`PrinterServiceUnavailable` if pywin32 is unavailable. All
     other errors propagate unchanged so the caller can surface them to the user.
     """
@@ -128,17 +149,88 @@ def send_raw_zpl(
 
     hPrinter = win32print.OpenPrinter(printer_name)
     try:
-        win32print.StartDocPrinter(hPrinter, 1, (doc_name, None, "RAW"))
-        try:
-            win32print.StartPagePrinter(hPrinter)
-            win32print.WritePrinter(hPrinter, zpl_bytes)
-            win32print.EndPagePrinter(hPrinter)
-        finally:
-            win32print.EndDocPrinter(hPrinter)
+        _write_raw_document(hPrinter, zpl_bytes, doc_name)
     finally:
         win32print.ClosePrinter(hPrinter)
 
 
+class RawPrinterSession:
+    """One printer handle held open for a whole print run.
+
+    ``OpenPrinter``/``ClosePrinter`` cost tens of milliseconds each through
+    the spooler; a run with a separator per material group paid that for
+    every separator. A session opens the handle on the first document and
+    keeps it until :meth:`close` (or the end of a ``with`` block).
+
+    With ``coalesce`` True, documents are buffered and adjacent ones go out
+    as ONE spool job on the next :meth:`flush` — the caller flushes before
+    anything else reaches the printer (a ShellExecute'd label), so the
+    printed order is unchanged.
+
+    Raises :class:`PrinterServiceUnavailable` on first use if pywin32 is
+    unavailable; spooler errors propagate unchanged.
+    """
+
+    def __init__(self, printer_name: str, coalesce: bool = False) -> None:
+        self._printer_name = printer_name
+        self._coalesce = coalesce
+        self._handle = None
+        self._pending: list[bytes] = []
+        self._pending_name = ""
+
+    def __enter__(self) -> "RawPrinterSession":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            # Don't spool buffered ZPL on top of a failed run.
+            self._pending.clear()
+        self.close()
+
+    def write_document(self, data: bytes, doc_name: str) -> Optional[int]:
+        """Send (or, coalescing, buffer) one raw document.
+
+        Returns the spooler JobId of the document written, or None while
+        it is buffered.
+        """
+        if self._coalesce:
+            if not self._pending:
+                self._pending_name = doc_name
+            self._pending.append(data)
+            return None
+        return _write_raw_document(self._open(), data, doc_name)
+
+    def flush(self) -> Optional[int]:
+        """Spool buffered documents as one job. Returns its JobId, if any."""
+        if not self._pending:
+            return None
+        data = b"".join(self._pending)
+        count = len(self._pending)
+        name = self._pending_name
+        self._pending = []
+        if count > 1:
+            name = f"{name} (+{count - 1})"
+        return _write_raw_document(self._open(), data, name)
+
+    def close(self) -> None:
+        """Flush anything buffered, then release the handle. Idempotent."""
+        try:
+            self.flush()
+        finally:
+            if self._handle is not None:
+                handle, self._handle = self._handle, None
+                win32print.ClosePrinter(handle)
+
+    def _open(self):
+        if self._handle is None:
+            if not HAS_WIN32:
+                raise PrinterServiceUnavailable(
+                    "pywin32 is not installed; cannot send raw ZPL"
+                )
+            self._handle = win32print.OpenPrinter(self._printer_name)
+        return self._handle
+
+
 def print_via_shellexecute(printer_name: str, file_path: str) -> None:
     """Print ``file_path`` to ``printer_name`` via the Windows ``printto`` verb.
 
@@ -256,6 +348,32 @@ def restore_default_printer_if_marked() -> Optional[str]:
     return restored
 
 
+def get_queued_job_ids(printer_name: str) -> Optional[list[int]]:
+    """Return the JobIds currently in ``printer_name``'s spool queue.
+
+    Returns None when the queue cannot be read — pywin32 unavailable, the
+    printer gone, access denied — so a caller pacing on queue depth knows to
+    fall back to fixed delays rather than treat the queue as empty.
+    """
+    if not HAS_WIN32:
+        return None
+    try:
+        hPrinter = win32print.OpenPrinter(printer_name)
+    except Exception:  # noqa: BLE001 - unreadable queue is reported as None
+        logger.debug("OpenPrinter failed reading queue of %r", printer_name)
+        return None
+    try:
+        jobs = win32print.EnumJobs(hPrinter, 0, 999, 1)
+        return [
+            job["JobId"] if isinstance(job, dict) else job[0] for job in jobs
+        ]
+    except Exception:  # noqa: BLE001
+        logger.debug("EnumJobs failed for %r", printer_name, exc_info=True)
+        return None
+    finally:
+        win32print.ClosePrinter(hPrinter)
+
+
 def _is_access_denied(exc: BaseException) -> bool:
     """Return True if *exc* is a win32 access-denied error.
 
@@ -1,9 +1,13 @@
 """Live printer status widget for JobManagerCK v2.1.
 
 Small pill-shaped widget with a coloured dot and a text label that polls
-``printer_service`` every ``poll_interval_ms`` milliseconds. Emits
+``printer_service`` every ``poll_interval_ms`` milliseconds — or, with
+``event_driven`` on, follows a :class:`printer_monitor.PrinterMonitorThread`
+that only enumerates printers when the spooler reports a change. Emits
 ``statusChanged(bool)`` only on transitions so consumers can react to
-connect/disconnect events without thrashing.
+connect/disconnect events without thrashing. In event-driven mode the
+label also shows how many jobs are waiting in the Zebra's spool queue,
+re-read whenever the monitor reports a queue change.
 
 The widget never raises from a poll — any exception from the underlying
 printer service is caught, the widget is marked offline, and a debug log
@@ -14,10 +18,16 @@ from __future__ import annotations
 
 import logging
 
-from PyQt5.QtCore import QThread, QTimer, Qt, pyqtSignal
+from PyQt5.QtCore import QTimer, Qt, pyqtSignal
 from PyQt5.QtWidgets import QHBoxLayout, QLabel, QWidget
 
-from printer_service import list_printers, match_zebra_printer
+from printer_monitor import PrinterMonitorThread
+from printer_service import (
+    get_queued_job_ids,
+    list_printers,
+    match_zebra_printer,
+)
+from task_executor import Task, TaskExecutor, TaskHandle, shared_executor
 
 logger = logging.getLogger(__name__)
 
@@ -27,8 +37,8 @@ _DOT_STYLE_ONLINE = "color: green; font-size: 16px;"
 _DOT_STYLE_OFFLINE = "color: red; font-size: 16px;"
 
 
-class _PollThread(QThread):
-    """Runs one printer query off the GUI thread.
+class _PollTask(Task):
+    """Runs one printer query on a pooled worker, off the GUI thread.
 
     ``EnumPrinters`` with ``PRINTER_ENUM_CONNECTIONS`` enumerates network
     printer connections and has no bounded latency \u2014 against a slow or
@@ -36,15 +46,25 @@ class _PollThread(QThread):
     a visible freeze, repeated on every poll.
     """
 
-    polled = pyqtSignal(bool, str)
+    name = "printer poll"
 
-    def __init__(self, query, parent=None) -> None:
-        super().__init__(parent)
+    def __init__(self, query) -> None:
         self._query = query
 
-    def run(self) -> None:  # noqa: D102 - QThread override
-        available, name = self._query()
-        self.polled.emit(available, name)
+    def run(self, token, progress) -> tuple[bool, str]:
+        return self._query()
+
+
+class _QueueTask(Task):
+    """Reads one printer's spool queue on a pooled worker."""
+
+    name = "printer queue"
+
+    def __init__(self, printer_name: str) -> None:
+        self._printer_name = printer_name
+
+    def run(self, token, progress) -> list[int] | None:
+        return get_queued_job_ids(self._printer_name)
 
 
 class PrinterStatusWidget(QWidget):
@@ -60,6 +80,15 @@ class PrinterStatusWidget(QWidget):
         pinned a specific printer in settings.
     parent:
         Optional parent widget for ownership.
+    event_driven:
+        Follow spooler change notifications instead of polling. The poll
+        interval then only applies if the monitor has to fall back to
+        polling.
+    monitor_factory:
+        Builds the monitor thread in event-driven mode, given the poll
+        interval; injectable for tests.
+    executor:
+        Runs the polls; defaults to the application's shared executor.
     """
 
     statusChanged = pyqtSignal(bool)
@@ -69,6 +98,9 @@ class PrinterStatusWidget(QWidget):
         poll_interval_ms: int,
         printer_name: str = "",
         parent: QWidget | None = None,
+        event_driven: bool = False,
+        monitor_factory=None,
+        executor: TaskExecutor | None = None,
     ) -> None:
         super().__init__(parent)
 
@@ -78,7 +110,21 @@ class PrinterStatusWidget(QWidget):
         # Name the last poll actually resolved. With auto-detect this is the
         # discovered Zebra; consumers read it instead of re-enumerating.
         self._resolved_name: str = ""
-        self._poll_thread: _PollThread | None = None
+        self._executor = executor or shared_executor()
+        self._poll_handle: TaskHandle | None = None
+        self._queue_handle: TaskHandle | None = None
+        # Jobs in the resolved printer's queue; None while unknown.
+        self._queued: int | None = None
+        self._event_driven = bool(event_driven)
+        self._monitor_factory = monitor_factory or (
+            lambda interval_ms: PrinterMonitorThread(
+                fallback_interval_ms=interval_ms
+            )
+        )
+        self._monitor: PrinterMonitorThread | None = None
+        # Printers the monitor last listed, so a changed target printer can
+        # be re-resolved without another spooler call.
+        self._last_names: list[str] | None = None
 
         # Build layout: [dot] [text]
         layout = QHBoxLayout(self)
@@ -114,7 +160,13 @@ class PrinterStatusWidget(QWidget):
         restore, not just at startup — a synchronous seed would run
         ``EnumPrinters`` on the GUI thread at each of those moments, and
         with a slow spooler that is a multi-second freeze.
+
+        In event-driven mode this starts the monitor thread instead, whose
+        first act is the seeding enumeration.
         """
+        if self._event_driven:
+            self._start_monitor()
+            return
         self._poll_async()
         self._timer.start(self._poll_interval_ms)
 
@@ -123,17 +175,24 @@ class PrinterStatusWidget(QWidget):
         if self._timer.isActive():
             self._timer.stop()
 
-        # Let an in-flight poll finish before the widget can be torn down,
-        # so its result slot never runs against a deleted widget.
-        thread = self._poll_thread
-        if thread is not None:
+        monitor = self._monitor
+        if monitor is not None:
             try:
-                thread.polled.disconnect(self._apply_status)
+                monitor.printersListed.disconnect(self._apply_names)
+                monitor.queueChanged.disconnect(self._refresh_queue)
             except TypeError:
                 pass  # already disconnected
-            if thread.isRunning():
-                thread.wait(5000)
-            self._poll_thread = None
+            monitor.stop()
+            monitor.deleteLater()
+            self._monitor = None
+
+        # Let an in-flight poll finish before the widget can be torn down,
+        # so its result callback never runs against a deleted widget.
+        for handle in (self._poll_handle, self._queue_handle):
+            if handle is not None:
+                handle.discard()
+                handle.wait(5000)
+        self._poll_handle = self._queue_handle = None
 
     def resolved_printer_name(self) -> str:
         """Return the printer name the most recent poll resolved.
@@ -148,6 +207,10 @@ class PrinterStatusWidget(QWidget):
     def set_printer_name(self, name: str) -> None:
         """Update the target printer and re-check immediately (async)."""
         self._printer_name = name or ""
+        if self._event_driven:
+            if self._last_names is not None:
+                self._apply_names(self._last_names)
+            return
         self._poll_async()
 
     def set_poll_interval(self, ms: int) -> None:
@@ -155,10 +218,26 @@ class PrinterStatusWidget(QWidget):
         self._poll_interval_ms = max(1, int(ms))
         self._timer.setInterval(self._poll_interval_ms)
 
+    def set_event_driven(self, enabled: bool) -> None:
+        """Switch between polling and the spooler monitor, keeping the
+        widget running if it was."""
+        enabled = bool(enabled)
+        if enabled == self._event_driven:
+            return
+        running = self._timer.isActive() or self._monitor is not None
+        self.stop()
+        self._event_driven = enabled
+        if running:
+            self.start()
+
     def is_online(self) -> bool:
         """Return the widget's current view of printer availability."""
         return self._available
 
+    def queued_jobs(self) -> int | None:
+        """Jobs in the printer's spool queue, or None if not known."""
+        return self._queued
+
     # -- polling -----------------------------------------------------------
 
     def _query(self) -> tuple[bool, str]:
@@ -174,18 +253,31 @@ class PrinterStatusWidget(QWidget):
         widget — the worst case is a transient "offline" flicker.
         """
         try:
-            names = list_printers()
-            target = self._printer_name
-            if not target:
-                # Shared matcher so the pill agrees with preflight and the
-                # Print click about what counts as a Zebra — the stock driver
-                # installs as "ZDesigner GC420d", with no "zebra" in the name.
-                target = match_zebra_printer(names) or ""
-            return (bool(target) and target in names), target
+            return self._resolve(list_printers())
         except Exception:  # noqa: BLE001 — contract: poll never raises
             logger.exception("PrinterStatusWidget poll failed")
             return False, ""
 
+    def _resolve(self, names: list[str]) -> tuple[bool, str]:
+        """(available, printer_name) of the target among *names*."""
+        target = self._printer_name
+        if not target:
+            # Shared matcher so the pill agrees with preflight and the
+            # Print click about what counts as a Zebra — the stock driver
+            # installs as "ZDesigner GC420d", with no "zebra" in the name.
+            target = match_zebra_printer(names) or ""
+        return (bool(target) and target in names), target
+
+    def _apply_names(self, names: list) -> None:
+        """Apply a printer list pushed by the monitor thread."""
+        self._last_names = list(names)
+        try:
+            available, name = self._resolve(self._last_names)
+        except Exception:  # noqa: BLE001 — contract: updates never raise
+            logger.exception("PrinterStatusWidget update failed")
+            available, name = False, ""
+        self._apply_status(available, name)
+
     def _apply_status(self, new_state: bool, resolved_name: str) -> None:
         """Record a poll result and update the UI on transition."""
         self._resolved_name = resolved_name
@@ -194,8 +286,11 @@ class PrinterStatusWidget(QWidget):
             return
 
         self._available = new_state
+        self._queued = None
         self._update_appearance(new_state)
         self.statusChanged.emit(new_state)
+        if new_state and self._monitor is not None:
+            self._refresh_queue()
 
     def _check_status(self) -> None:
         """Poll synchronously and apply the result.
@@ -207,35 +302,61 @@ class PrinterStatusWidget(QWidget):
         available, name = self._query()
         self._apply_status(available, name)
 
+    def _start_monitor(self) -> None:
+        """Start the monitor thread unless it is already running."""
+        if self._monitor is not None and self._monitor.isRunning():
+            return
+        monitor = self._monitor_factory(self._poll_interval_ms)
+        monitor.printersListed.connect(self._apply_names)
+        monitor.queueChanged.connect(self._refresh_queue)
+        self._monitor = monitor
+        monitor.start()
+
     def _poll_async(self) -> None:
-        """Run the periodic poll on a worker thread.
+        """Run the periodic poll on a pooled worker thread.
 
         Skips this tick if the previous poll is still running, which is what
         happens when the spooler is slow — queueing more would pile work onto
         an already-struggling print server.
         """
-        if self._poll_thread is not None and self._poll_thread.isRunning():
+        if self._poll_handle is not None and not self._poll_handle.done():
             return
 
-        thread = _PollThread(self._query, parent=self)
-        thread.polled.connect(self._apply_status)
-        # Retire on completion — the thread is parented to this widget, so
-        # otherwise one QThread child would pile up per poll, forever.
-        thread.finished.connect(lambda t=thread: self._retire_poll_thread(t))
-        self._poll_thread = thread
-        thread.start()
+        self._poll_handle = self._executor.submit(
+            _PollTask(self._query),
+            on_result=lambda result: self._apply_status(*result),
+        )
+
+    def _refresh_queue(self) -> None:
+        """Re-read the queue length after the monitor saw a job change.
 
-    def _retire_poll_thread(self, thread: _PollThread) -> None:
-        """Drop and delete a finished poll thread."""
-        if self._poll_thread is thread:
-            self._poll_thread = None
-        thread.deleteLater()
+        Skipped while the printer is offline, and while the previous read
+        is still running — a print run changes the queue with every label.
+        """
+        if not self._available or not self._resolved_name:
+            return
+        if self._queue_handle is not None and not self._queue_handle.done():
+            return
+        name = self._resolved_name
+        self._queue_handle = self._executor.submit(
+            _QueueTask(name),
+            on_result=lambda ids: self._apply_queue(name, ids),
+        )
+
+    def _apply_queue(self, printer_name: str, ids: list[int] | None) -> None:
+        if not self._available or printer_name != self._resolved_name:
+            return
+        self._queued = None if ids is None else len(ids)
+        self._update_appearance(True)
 
     def _update_appearance(self, available: bool) -> None:
         """Refresh dot colour, label text, and tooltip for the new state."""
         if available:
             self._dot_label.setStyleSheet(_DOT_STYLE_ONLINE)
-            self._text_label.setText("Zebra: Connected")
+            text = "Zebra: Connected"
+            if self._queued:
+                text += f" \u2014 {self._queued} queued"
+            self._text_label.setText(text)
             self.setToolTip("Zebra printer is connected and ready")
         else:
             self._dot_label.setStyleSheet(_DOT_STYLE_OFFLINE)
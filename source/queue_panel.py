@@ -0,0 +1,124 @@
+"""Panel listing the operation queue with per-entry progress.
+
+One row per queued operation: waiting, running (with the worker's latest
+progress line), done or failed. Lives in a dock on the main window and only
+talks to :class:`operation_queue.OperationQueue` through its signals and its
+``cancel`` method.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QBrush, QColor
+from PyQt5.QtWidgets import (
+    QHBoxLayout,
+    QListWidget,
+    QListWidgetItem,
+    QPushButton,
+    QVBoxLayout,
+    QWidget,
+)
+
+from operation_queue import OperationQueue
+
+_COLOR_WAITING = QColor(90, 90, 90)
+_COLOR_RUNNING = QColor(0, 0, 200)
+_COLOR_DONE = QColor(0, 128, 0)
+_COLOR_FAILED = QColor(200, 0, 0)
+
+
+class OperationQueuePanel(QWidget):
+    """List of queue entries plus Cancel / Clear Finished buttons."""
+
+    def __init__(
+        self, queue: OperationQueue, parent: Optional[QWidget] = None
+    ) -> None:
+        super().__init__(parent)
+        self._queue = queue
+        self._rows: dict[int, QListWidgetItem] = {}
+        self._titles: dict[int, str] = {}
+        self._done: set[int] = set()
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(4, 4, 4, 4)
+
+        self._list = QListWidget(self)
+        self._list.setSelectionMode(QListWidget.SingleSelection)
+        layout.addWidget(self._list, stretch=1)
+
+        buttons = QHBoxLayout()
+        self._cancel_button = QPushButton("Cancel Selected", self)
+        self._cancel_button.clicked.connect(self._cancel_selected)
+        self._clear_button = QPushButton("Clear Finished", self)
+        self._clear_button.clicked.connect(self.clear_finished)
+        buttons.addWidget(self._cancel_button)
+        buttons.addWidget(self._clear_button)
+        buttons.addStretch(1)
+        layout.addLayout(buttons)
+
+        queue.itemAdded.connect(self._on_added)
+        queue.itemStarted.connect(self._on_started)
+        queue.itemProgress.connect(self._on_progress)
+        queue.itemFinished.connect(self._on_finished)
+
+    # -- public API --------------------------------------------------
+
+    def row_text(self, op_id: int) -> str:
+        """Return the text currently shown for *op_id* (empty if unknown)."""
+        item = self._rows.get(op_id)
+        return item.text() if item is not None else ""
+
+    def clear_finished(self) -> None:
+        """Remove the rows of entries that are done or failed."""
+        for op_id in list(self._done):
+            item = self._rows.pop(op_id, None)
+            if item is not None:
+                self._list.takeItem(self._list.row(item))
+            self._titles.pop(op_id, None)
+        self._done.clear()
+
+    # -- queue signal handlers ---------------------------------------
+
+    def _set_row(self, op_id: int, status: str, color: QColor) -> None:
+        item = self._rows.get(op_id)
+        if item is None:
+            return
+        item.setText(f"{self._titles.get(op_id, '')}  —  {status}")
+        item.setForeground(QBrush(color))
+
+    def _on_added(self, op_id: int, title: str) -> None:
+        item = QListWidgetItem()
+        item.setData(Qt.UserRole, op_id)
+        self._list.addItem(item)
+        self._rows[op_id] = item
+        self._titles[op_id] = title
+        self._set_row(op_id, "Waiting", _COLOR_WAITING)
+
+    def _on_started(self, op_id: int) -> None:
+        self._set_row(op_id, "Running", _COLOR_RUNNING)
+
+    def _on_progress(self, op_id: int, text: str) -> None:
+        self._set_row(op_id, text, _COLOR_RUNNING)
+
+    def _on_finished(self, op_id: int, success: bool, message: str) -> None:
+        self._done.add(op_id)
+        # First line only — failure messages list every file on later lines;
+        # the full text is in the row's tooltip.
+        first_line = message.splitlines()[0] if message else ""
+        if success:
+            self._set_row(op_id, f"Done: {first_line}", _COLOR_DONE)
+        else:
+            self._set_row(op_id, f"Failed: {first_line}", _COLOR_FAILED)
+        item = self._rows.get(op_id)
+        if item is not None:
+            item.setToolTip(message)
+
+    def _cancel_selected(self) -> None:
+        item = self._list.currentItem()
+        if item is None:
+            return
+        op_id = item.data(Qt.UserRole)
+        if op_id is not None and op_id not in self._done:
+            self._queue.cancel(int(op_id))
@@ -0,0 +1,138 @@
+"""Adaptive interval for the job list's background refresh.
+
+The refresh used to scan ``S:\\Jobs`` every ``AUTO_REFRESH_MS`` (5 s) for
+as long as the window was open and not minimised — some 17,000 scans a
+day on an unattended PC, nearly all of them returning exactly what the
+previous one did. :class:`RefreshScheduler` picks the delay before the
+next scan from what has happened lately:
+
+* right after user activity, or a scan that found a change, it refreshes
+  quickly (``fast_ms``);
+* every scan that finds nothing new doubles the delay, from ``base_ms``
+  up to ``idle_cap_ms``;
+* while scans fail (the share is down) it backs off exponentially up to
+  ``failure_cap_ms``, with random jitter so several PCs do not retry in
+  lockstep;
+* a scan that took a long time is never repeated sooner than
+  ``cost_factor`` times its (smoothed) duration, so a slow share is
+  polled less often.
+
+The scheduler is plain state with no timer of its own: the window reports
+activity and scan outcomes and asks :meth:`RefreshScheduler.next_delay_ms`
+when re-arming its ``QTimer``. The clock and random source are injectable
+for the tests.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+# Backoff exponents stop growing here; the delay is long capped by then,
+# and an unbounded power would overflow during a day-long outage.
+_MAX_EXPONENT = 32
+
+
+@dataclass(frozen=True)
+class RefreshPolicy:
+    """Tuning for :class:`RefreshScheduler`; all times in milliseconds."""
+
+    #: Delay while the user is active or right after a detected change.
+    fast_ms: int = 2000
+    #: First delay once scans stop finding changes.
+    base_ms: int = 5000
+    #: Longest delay while idle.
+    idle_cap_ms: int = 60000
+    #: Longest delay while scans keep failing.
+    failure_cap_ms: int = 120000
+    #: Growth factor per unchanged (or failed) scan.
+    backoff: float = 2.0
+    #: Failure delays vary by up to this fraction either way.
+    jitter: float = 0.25
+    #: User activity keeps the fast interval for this long.
+    activity_window_ms: int = 30000
+    #: Never scan again sooner than this many times the smoothed scan cost.
+    cost_factor: float = 4.0
+    #: Weight of the newest scan in the smoothed cost.
+    cost_smoothing: float = 0.3
+
+
+class RefreshScheduler:
+    """Tracks recent activity and scan outcomes to choose the next delay."""
+
+    def __init__(
+        self,
+        policy: Optional[RefreshPolicy] = None,
+        clock: Callable[[], float] = time.monotonic,
+        rng: Callable[[], float] = random.random,
+    ) -> None:
+        self.policy = policy or RefreshPolicy()
+        self._clock = clock
+        self._rng = rng
+        self._last_activity: Optional[float] = None
+        #: Consecutive successful scans that found nothing new.
+        self.unchanged_streak = 0
+        #: Consecutive failed scans.
+        self.failure_streak = 0
+        #: Smoothed scan duration in seconds, None before the first scan.
+        self.scan_cost_s: Optional[float] = None
+
+    def note_activity(self) -> None:
+        """The user did something: refresh quickly for a while."""
+        self._last_activity = self._clock()
+        self.unchanged_streak = 0
+
+    def note_scan(self, changed: bool, cost_s: float) -> None:
+        """A scan succeeded; *changed* says whether it found anything new."""
+        self.failure_streak = 0
+        self.unchanged_streak = 0 if changed else self.unchanged_streak + 1
+        self._note_cost(cost_s)
+
+    def note_failure(self, cost_s: float) -> None:
+        """A scan failed (e.g. the share is unreachable)."""
+        self.failure_streak += 1
+        self._note_cost(cost_s)
+
+    def next_delay_ms(self) -> int:
+        """Milliseconds to wait before the next scan."""
+        p = self.policy
+        if self.failure_streak:
+            delay = min(
+                p.base_ms * p.backoff ** min(self.failure_streak, _MAX_EXPONENT),
+                p.failure_cap_ms,
+            )
+            delay *= 1.0 + p.jitter * (2.0 * self._rng() - 1.0)
+            delay = min(delay, p.failure_cap_ms)
+            cap = p.failure_cap_ms
+        elif self._recently_active() or self.unchanged_streak == 0:
+            delay = p.fast_ms
+            cap = p.idle_cap_ms
+        else:
+            delay = min(
+                p.base_ms
+                * p.backoff ** min(self.unchanged_streak - 1, _MAX_EXPONENT),
+                p.idle_cap_ms,
+            )
+            cap = p.idle_cap_ms
+        if self.scan_cost_s is not None:
+            floor = self.scan_cost_s * 1000 * p.cost_factor
+            delay = max(delay, min(floor, cap))
+        return max(1, int(delay))
+
+    # -- internal helpers --------------------------------------------
+
+    def _recently_active(self) -> bool:
+        if self._last_activity is None:
+            return False
+        elapsed_ms = (self._clock() - self._last_activity) * 1000
+        return elapsed_ms < self.policy.activity_window_ms
+
+    def _note_cost(self, cost_s: float) -> None:
+        cost = max(0.0, float(cost_s))
+        if self.scan_cost_s is None:
+            self.scan_cost_s = cost
+        else:
+            weight = self.policy.cost_smoothing
+            self.scan_cost_s = weight * cost + (1 - weight) * self.scan_cost_s
@@ -0,0 +1,244 @@
+"""Job scans in a long-lived helper process, guarded by a deadline.
+
+A hung SMB call inside :func:`job_types.scan_folder_files` blocks its
+thread for as long as the redirector cares to wait, and Python cannot
+cancel it. In-process, that holds a pool worker and the scan key forever:
+every later refresh tick is skipped and the job list silently stops
+updating.
+
+:class:`ScanProcess` runs the scans in a separate process instead and
+talks to it over a pipe. Each :meth:`ScanProcess.scan` sends one request
+and waits at most ``deadline`` seconds for the answer. A helper that
+misses the deadline (or dies) is killed and a fresh one is started at
+once, so the next refresh has a working scanner again. The caller gets a
+:class:`ScanTimeout` and keeps showing :attr:`ScanProcess.last_good`.
+
+The helper also does the scan's CPU work — sorting, pickling, and hashing
+the result — on its own interpreter. When the result hashes the same as
+the one the app already holds, only the digest crosses the pipe and the
+app reuses its copy, so an unchanged share costs the GUI process
+nothing.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import multiprocessing
+import pickle
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from job_scan_worker import scan_all_jobs
+from task_executor import Task
+
+logger = logging.getLogger(__name__)
+
+#: Seconds a scan may take before the helper is presumed hung and replaced.
+DEFAULT_SCAN_DEADLINE_S = 45.0
+
+#: ``scan(concurrent) -> (active_jobs, printed_jobs)``, run in the helper.
+ScanFn = Callable[[bool], tuple[list, list]]
+
+
+class ScanHelperError(Exception):
+    """The helper failed to scan, or exited without answering."""
+
+
+class ScanTimeout(ScanHelperError):
+    """The helper missed its deadline and was restarted."""
+
+
+def _serve(conn, scan: ScanFn) -> None:
+    """Helper process main loop: answer scan requests until told to stop.
+
+    A request is ``(known_digest, concurrent)``; ``None`` stops the loop.
+    The reply is ``("ok", digest, payload)`` — ``payload`` is the pickled
+    result, or None when it hashes to *known_digest* — or
+    ``("error", message)``.
+    """
+    while True:
+        try:
+            request = conn.recv()
+        except (EOFError, OSError):
+            return
+        if request is None:
+            return
+        known_digest, concurrent = request
+        try:
+            payload = pickle.dumps(
+                scan(concurrent), protocol=pickle.HIGHEST_PROTOCOL
+            )
+            digest = hashlib.blake2b(payload, digest_size=16).digest()
+            reply = ("ok", digest, None if digest == known_digest else payload)
+        except Exception as exc:  # noqa: BLE001 - reported to the app
+            reply = ("error", f"{type(exc).__name__}: {exc}")
+        try:
+            conn.send(reply)
+        except (EOFError, OSError):
+            return
+
+
+class ScanProcess:
+    """Client for one helper process; safe to call from any thread.
+
+    Requests are serialised: a second caller waits for the first. The
+    helper starts on the first scan and is replaced whenever it misses a
+    deadline or dies.
+    """
+
+    def __init__(
+        self,
+        scan: ScanFn = scan_all_jobs,
+        deadline_s: float = DEFAULT_SCAN_DEADLINE_S,
+    ) -> None:
+        self._scan = scan
+        self._deadline_s = float(deadline_s)
+        # spawn everywhere, as on Windows: the helper must not inherit the
+        # GUI process's threads or Qt state.
+        self._context = multiprocessing.get_context("spawn")
+        self._process = None
+        self._conn = None
+        self._lock = threading.Lock()
+        self._closed = False
+        self._digest: Optional[bytes] = None
+        self.last_good: Optional[tuple[list, list]] = None
+        #: ``time.time()`` of the scan :attr:`last_good` came from.
+        self.last_good_at: Optional[float] = None
+        self.restarts = 0
+
+    @property
+    def pid(self) -> Optional[int]:
+        """The current helper's process id, or None if none is running."""
+        process = self._process
+        return process.pid if process is not None else None
+
+    def scan(
+        self, concurrent: bool = False, deadline_s: Optional[float] = None
+    ) -> tuple[list, list]:
+        """Run one scan in the helper and return ``(active, printed)``.
+
+        Raises :class:`ScanTimeout` if the helper does not answer within
+        the deadline and :class:`ScanHelperError` if the scan fails or the
+        helper dies; :attr:`last_good` is left untouched either way.
+        """
+        deadline = self._deadline_s if deadline_s is None else deadline_s
+        with self._lock:
+            if self._closed:
+                raise ScanHelperError("scan helper has been shut down")
+            if self._process is None or not self._process.is_alive():
+                self._start()
+            try:
+                self._conn.send((self._digest, bool(concurrent)))
+                answered = self._conn.poll(deadline)
+                reply = self._conn.recv() if answered else None
+            except (EOFError, OSError) as exc:
+                self._replace(f"helper exited ({exc})")
+                raise ScanHelperError("scan helper exited") from exc
+            if reply is None:
+                self._replace(f"no answer within {deadline:g}s")
+                raise ScanTimeout(
+                    f"job scan did not finish within {deadline:g}s"
+                )
+            return self._accept(reply)
+
+    def shutdown(self, wait_ms: int = 2000) -> None:
+        """Stop the helper. Safe to call more than once."""
+        with self._lock:
+            self._closed = True
+            self._stop(wait_ms)
+
+    # -- internal helpers --------------------------------------------
+
+    def _accept(self, reply: tuple) -> tuple[list, list]:
+        if reply[0] == "error":
+            raise ScanHelperError(reply[1])
+        _kind, digest, payload = reply
+        # No payload means the result hashed to self._digest: it is the
+        # one already held in last_good.
+        if payload is not None:
+            self.last_good = pickle.loads(payload)
+            self._digest = digest
+        self.last_good_at = time.time()
+        return self.last_good
+
+    def _start(self) -> None:
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_serve,
+            args=(child_conn, self._scan),
+            name="JobScanHelper",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        self._process, self._conn = process, parent_conn
+        logger.info("Started job scan helper (pid %s)", process.pid)
+
+    def _replace(self, reason: str) -> None:
+        """Kill a hung or dead helper and start its successor straight away,
+        so the spawn cost is paid before the next refresh, not during it."""
+        logger.warning(
+            "Job scan helper (pid %s) replaced: %s", self.pid, reason
+        )
+        self._stop(0)
+        self.restarts += 1
+        self._start()
+
+    def _stop(self, wait_ms: int) -> None:
+        process, conn = self._process, self._conn
+        self._process = self._conn = None
+        if conn is not None:
+            if wait_ms > 0 and process is not None and process.is_alive():
+                try:
+                    conn.send(None)
+                except (EOFError, OSError):
+                    pass
+            conn.close()
+        if process is not None:
+            if wait_ms > 0:
+                process.join(wait_ms / 1000.0)
+            if process.is_alive():
+                process.kill()
+                process.join(1.0)
+
+
+class HelperScanTask(Task):
+    """Executor task scanning through a :class:`ScanProcess`.
+
+    Returns ``(active_jobs, printed_jobs)`` like
+    :class:`job_scan_worker.ScanJobsTask`; a hung helper surfaces as a
+    :class:`ScanTimeout` after the deadline instead of holding the worker.
+    """
+
+    name = "job scan (helper)"
+
+    def __init__(self, process: ScanProcess, concurrent: bool = False) -> None:
+        self._process = process
+        self._concurrent = concurrent
+
+    def run(self, token, progress) -> Any:
+        return self._process.scan(concurrent=self._concurrent)
+
+
+_shared: Optional[ScanProcess] = None
+_shared_lock = threading.Lock()
+
+
+def shared_scan_process() -> ScanProcess:
+    """The application's scan helper client, created on first use."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = ScanProcess()
+        return _shared
+
+
+def shutdown_shared_scan_process(wait_ms: int = 2000) -> None:
+    """Stop the application's scan helper, if it was ever started."""
+    global _shared
+    with _shared_lock:
+        process, _shared = _shared, None
+    if process is not None:
+        process.shutdown(wait_ms)
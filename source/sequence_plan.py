@@ -0,0 +1,173 @@
+"""Per-job print plans, computed once and shared by the dialog and the run.
+
+Printing a CD job parses every ``.ljd`` filename twice: once in
+:func:`print_sequencer.detect_materials_in_job` to seed the
+:class:`print_order_dialog.PrintOrderDialog`, and again in
+:func:`print_sequencer.build_print_sequence` once the order is confirmed.
+For a job with thousands of labels that is a noticeable pause before the
+dialog opens.
+
+:class:`SequencePlanCache` keeps the parsed material groups per job, keyed
+by the job's tuple of label files (so any added, removed or renamed label
+makes a new plan), and memoises the material lists and sequences derived
+from them per priority/order settings. :class:`PlanPrefetchThread` fills
+the cache in the background when a CD job is selected, so by the time the
+operator clicks Print the parse has already happened.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Hashable, Iterable
+
+from PyQt5.QtCore import QThread
+
+from print_sequencer import (
+    PrintSequence,
+    build_print_sequence_from_groups,
+    detect_materials_in_groups,
+    group_ljd_files_by_material,
+)
+
+logger = logging.getLogger(__name__)
+
+#: ``{material: ((board, path), ...)}`` sorted as the sequencer sorts them.
+MaterialGroups = dict[str, tuple[tuple[int, str], ...]]
+
+
+class _JobPlan:
+    """Parsed groups of one file tuple, plus results derived from them."""
+
+    __slots__ = ("groups", "derived")
+
+    def __init__(self, groups: MaterialGroups) -> None:
+        self.groups = groups
+        self.derived: dict[Hashable, object] = {}
+
+
+class SequencePlanCache:
+    """Thread-safe LRU of job plans, keyed by the job's label file tuple."""
+
+    def __init__(self, maxsize: int = 16) -> None:
+        self._maxsize = max(1, int(maxsize))
+        self._plans: OrderedDict[tuple[str, ...], _JobPlan] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def groups(self, ljd_files: Iterable[str]) -> MaterialGroups:
+        """Material groups for *ljd_files*, parsed at most once."""
+        return self._plan(tuple(ljd_files)).groups
+
+    def materials(
+        self, ljd_files: Iterable[str], default_priority: tuple[str, ...]
+    ) -> list[tuple[str, int]]:
+        """Cached :func:`print_sequencer.detect_materials_in_job`."""
+        plan = self._plan(tuple(ljd_files))
+        result = self._derived(
+            plan,
+            ("materials", tuple(default_priority)),
+            lambda: tuple(
+                detect_materials_in_groups(plan.groups, default_priority)
+            ),
+        )
+        return list(result)
+
+    def sequence(
+        self,
+        job_name: str,
+        ljd_files: Iterable[str],
+        material_priority: tuple[str, ...] = (),
+        reverse_within: bool = True,
+        include_separators: bool = True,
+    ) -> PrintSequence:
+        """Cached :func:`print_sequencer.build_print_sequence`.
+
+        The sequence is an immutable view, so every caller shares one.
+        """
+        plan = self._plan(tuple(ljd_files))
+        key = (
+            "sequence",
+            job_name,
+            tuple(material_priority),
+            reverse_within,
+            include_separators,
+        )
+        return self._derived(
+            plan,
+            key,
+            lambda: build_print_sequence_from_groups(
+                job_name,
+                plan.groups,
+                material_priority=material_priority,
+                reverse_within=reverse_within,
+                include_separators=include_separators,
+            ),
+        )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._plans.clear()
+
+    # -- internal helpers --------------------------------------------
+
+    def _plan(self, files: tuple[str, ...]) -> _JobPlan:
+        with self._lock:
+            plan = self._plans.get(files)
+            if plan is not None:
+                self._plans.move_to_end(files)
+                self.hits += 1
+                return plan
+            self.misses += 1
+        # Parse outside the lock: a prefetch of one job must not stall the
+        # GUI thread asking about another. Two racing parses of the same
+        # files produce equal plans, so the later store is harmless.
+        groups = {
+            material: tuple(entries)
+            for material, entries in group_ljd_files_by_material(files).items()
+        }
+        plan = _JobPlan(groups)
+        with self._lock:
+            self._plans[files] = plan
+            self._plans.move_to_end(files)
+            while len(self._plans) > self._maxsize:
+                self._plans.popitem(last=False)
+        return plan
+
+    def _derived(self, plan: _JobPlan, key: Hashable, build):
+        """Memoise *build*'s result on *plan*; it must be immutable."""
+        with self._lock:
+            cached = plan.derived.get(key)
+        if cached is not None:
+            return cached
+        value = build()
+        with self._lock:
+            plan.derived[key] = value
+        return value
+
+
+#: Process-wide cache shared by the main window's dialog and print paths.
+SEQUENCE_PLANS = SequencePlanCache()
+
+
+class PlanPrefetchThread(QThread):
+    """Parse a job's labels into :data:`SEQUENCE_PLANS` off the GUI thread."""
+
+    def __init__(
+        self,
+        ljd_files: Iterable[str],
+        default_priority: tuple[str, ...],
+        cache: SequencePlanCache = SEQUENCE_PLANS,
+    ) -> None:
+        super().__init__()
+        self._files = tuple(ljd_files)
+        self._priority = tuple(default_priority)
+        self._cache = cache
+
+    def run(self) -> None:
+        try:
+            self._cache.materials(self._files, self._priority)
+        except Exception:  # noqa: BLE001 - a prefetch is only a hint
+            logger.exception("Print plan prefetch failed")
@@ -35,6 +35,18 @@ class AppSettings:
     # straight into the printer's small internal buffer, and a misplaced
     # separator silently mis-batches boards — keep this conservative.
     separator_delay_seconds: float = 2.0
+    # Pace labels on the printer's spool queue instead of always sleeping
+    # print_delay_seconds: the next label goes once the previous one has
+    # spooled and the queue is short. print_delay_seconds stays the upper
+    # bound and the fallback when the queue cannot be read.
+    adaptive_pacing: bool = False
+    # Download the separator layout to the Zebra once per run and send each
+    # separator as field data only (ZPL stored format ^DF/^XF).
+    stored_separator_format: bool = False
+    # Spread a job's material groups over every installed Zebra at once
+    # (see print_farm). Off, or with only one Zebra installed, everything
+    # goes to zebra_printer_name as before.
+    print_farm_enabled: bool = False
     # Sticky per-job material order. Starts with WHMR as the built-in
     # fallback — the PrintOrderDialog grows this tuple over time as the
     # user confirms per-job orders, reflecting their last-used preference.
@@ -42,10 +54,38 @@ class AppSettings:
     print_separators: bool = True
     auto_mark_printed: bool = False
     status_poll_interval_ms: int = 10000
+    # Follow the print spooler's change notifications for the status pill
+    # instead of enumerating printers every status_poll_interval_ms (which
+    # remains the fallback if notifications are unavailable).
+    printer_change_notifications: bool = False
+    # Scan the S: job folders several at a time on the async I/O core
+    # instead of one after another on a pooled worker.
+    concurrent_job_scan: bool = False
+    # Run job scans in a helper process that is killed and restarted when
+    # a scan hangs on the share (see scan_process).
+    isolated_job_scan: bool = False
+    # Refresh the job list quickly after activity or a change and back off
+    # while nothing changes or the share fails (see refresh_scheduler),
+    # instead of every 5 seconds.
+    adaptive_refresh: bool = False
+    # Share one scan of S:\Jobs between the workshop PCs: the PC holding
+    # the lease publishes S:\Jobs\.jobindex, the others read it (see
+    # job_index).
+    shared_job_index: bool = False
     zebra_printer_name: str = ""
     # Application-wide text size in points; 0 means "system default".
     # Accessibility knob — the workshop PC is read at arm's length.
     ui_font_size: int = 0
+    # Read every NC file back from the USB stick after copying and compare
+    # it with the source. Costs a read of the stick, overlapped with the
+    # next file's write.
+    verify_usb_copy: bool = False
+    # Skip NC files the USB stick already holds unchanged (same size and
+    # content hash); re-copying a job after a small edit then only writes
+    # what changed. usb_remove_stale_nc additionally deletes other jobs'
+    # .nc files from the stick root during a sync.
+    usb_sync_mode: bool = False
+    usb_remove_stale_nc: bool = False
 
 
 def _clamp_delay(value: Any) -> float:
@@ -103,6 +143,17 @@ def _from_dict(data: dict[str, Any]) -> AppSettings:
                 "separator_delay_seconds", defaults.separator_delay_seconds
             )
         ),
+        adaptive_pacing=bool(
+            data.get("adaptive_pacing", defaults.adaptive_pacing)
+        ),
+        stored_separator_format=bool(
+            data.get(
+                "stored_separator_format", defaults.stored_separator_format
+            )
+        ),
+        print_farm_enabled=bool(
+            data.get("print_farm_enabled", defaults.print_farm_enabled)
+        ),
         material_priority=_coerce_material_priority(
             data.get("material_priority", defaults.material_priority)
         ),
@@ -115,12 +166,37 @@ def _from_dict(data: dict[str, Any]) -> AppSettings:
         status_poll_interval_ms=_clamp_poll_interval(
             data.get("status_poll_interval_ms", defaults.status_poll_interval_ms)
         ),
+        printer_change_notifications=bool(
+            data.get(
+                "printer_change_notifications",
+                defaults.printer_change_notifications,
+            )
+        ),
+        concurrent_job_scan=bool(
+            data.get("concurrent_job_scan", defaults.concurrent_job_scan)
+        ),
+        isolated_job_scan=bool(
+            data.get("isolated_job_scan", defaults.isolated_job_scan)
+        ),
+        adaptive_refresh=bool(
+            data.get("adaptive_refresh", defaults.adaptive_refresh)
+        ),
+        shared_job_index=bool(
+            data.get("shared_job_index", defaults.shared_job_index)
+        ),
         zebra_printer_name=str(
             data.get("zebra_printer_name", defaults.zebra_printer_name)
         ),
         ui_font_size=_clamp_font_size(
             data.get("ui_font_size", defaults.ui_font_size)
         ),
+        verify_usb_copy=bool(
+            data.get("verify_usb_copy", defaults.verify_usb_copy)
+        ),
+        usb_sync_mode=bool(data.get("usb_sync_mode", defaults.usb_sync_mode)),
+        usb_remove_stale_nc=bool(
+            data.get("usb_remove_stale_nc", defaults.usb_remove_stale_nc)
+        ),
     )
 
 
@@ -142,6 +142,19 @@ class SettingsDialog(QDialog):
         )
         form.addRow("Delay between labels:", self.print_delay_spinbox)
 
+        self.adaptive_pacing_checkbox = QCheckBox(
+            "Send the next label as soon as the printer queue allows"
+        )
+        self.adaptive_pacing_checkbox.setChecked(
+            self._initial_settings.adaptive_pacing
+        )
+        self.adaptive_pacing_checkbox.setToolTip(
+            "Watches the Windows print queue and only waits while the "
+            "Zebra is still busy. The delay above becomes the longest wait, "
+            "and is used as-is if the queue can't be read."
+        )
+        form.addRow(self.adaptive_pacing_checkbox)
+
         self.separator_delay_spinbox = QDoubleSpinBox()
         self.separator_delay_spinbox.setRange(0.5, 30.0)
         self.separator_delay_spinbox.setSingleStep(0.5)
@@ -164,6 +177,92 @@ class SettingsDialog(QDialog):
         )
         form.addRow(self.print_separators_checkbox)
 
+        self.stored_format_checkbox = QCheckBox(
+            "Store the separator layout on the printer"
+        )
+        self.stored_format_checkbox.setChecked(
+            self._initial_settings.stored_separator_format
+        )
+        self.stored_format_checkbox.setToolTip(
+            "Sends the separator layout to the Zebra once per print run; "
+            "each separator then only sends its job and material text."
+        )
+        form.addRow(self.stored_format_checkbox)
+
+        self.print_farm_checkbox = QCheckBox(
+            "Share print runs across all connected Zebras"
+        )
+        self.print_farm_checkbox.setChecked(
+            self._initial_settings.print_farm_enabled
+        )
+        self.print_farm_checkbox.setToolTip(
+            "Each Zebra prints whole materials (with their separators), "
+            "split so the printers finish at about the same time."
+        )
+        form.addRow(self.print_farm_checkbox)
+
+        self.printer_notifications_checkbox = QCheckBox(
+            "Watch the print spooler for printer changes"
+        )
+        self.printer_notifications_checkbox.setChecked(
+            self._initial_settings.printer_change_notifications
+        )
+        self.printer_notifications_checkbox.setToolTip(
+            "The printer status updates as soon as Windows reports a change, "
+            "instead of checking every few seconds."
+        )
+        form.addRow(self.printer_notifications_checkbox)
+
+        self.concurrent_scan_checkbox = QCheckBox(
+            "Scan job folders concurrently"
+        )
+        self.concurrent_scan_checkbox.setChecked(
+            self._initial_settings.concurrent_job_scan
+        )
+        self.concurrent_scan_checkbox.setToolTip(
+            "Reads several job folders on the S: drive at once, so the job "
+            "list refreshes faster over a slow network."
+        )
+        form.addRow(self.concurrent_scan_checkbox)
+
+        self.isolated_scan_checkbox = QCheckBox(
+            "Scan job folders in a separate process"
+        )
+        self.isolated_scan_checkbox.setChecked(
+            self._initial_settings.isolated_job_scan
+        )
+        self.isolated_scan_checkbox.setToolTip(
+            "A scan stuck on an unresponsive S: drive is stopped and retried "
+            "instead of freezing the job list; the last jobs read stay shown."
+        )
+        form.addRow(self.isolated_scan_checkbox)
+
+        self.adaptive_refresh_checkbox = QCheckBox(
+            "Refresh the job list less often while nothing changes"
+        )
+        self.adaptive_refresh_checkbox.setChecked(
+            self._initial_settings.adaptive_refresh
+        )
+        self.adaptive_refresh_checkbox.setToolTip(
+            "Refreshes quickly while you work and when jobs change, slows "
+            "down on an idle PC or while the S: drive is unreachable, and "
+            "refreshes at once when the window is brought to the front."
+        )
+        form.addRow(self.adaptive_refresh_checkbox)
+
+        self.shared_index_checkbox = QCheckBox(
+            "Share job scans with the other PCs"
+        )
+        self.shared_index_checkbox.setChecked(
+            self._initial_settings.shared_job_index
+        )
+        self.shared_index_checkbox.setToolTip(
+            "One PC scans the S: drive and saves the job list there; PCs "
+            "with this option on read that list instead of scanning. If "
+            "that PC stops, another one takes over."
+        )
+        form.addRow(self.shared_index_checkbox)
+
         return group
 
     def _build_workflow_group(self) -> QGroupBox:
@@ -178,6 +277,42 @@ class SettingsDialog(QDialog):
         )
         layout.addWidget(self.auto_mark_printed_checkbox)
 
+        self.verify_usb_copy_checkbox = QCheckBox(
+            "Verify NC files after copying to USB"
+        )
+        self.verify_usb_copy_checkbox.setChecked(
+            self._initial_settings.verify_usb_copy
+        )
+        self.verify_usb_copy_checkbox.setToolTip(
+            "Reads each NC file back from the USB drive and checks it "
+            "matches the original. Bad copies are deleted and listed."
+        )
+        layout.addWidget(self.verify_usb_copy_checkbox)
+
+        self.usb_sync_checkbox = QCheckBox(
+            "Skip NC files already on the USB drive (sync)"
+        )
+        self.usb_sync_checkbox.setChecked(self._initial_settings.usb_sync_mode)
+        self.usb_sync_checkbox.setToolTip(
+            "Only writes NC files that are new or changed. Files already on "
+            "the USB drive with identical contents are left as they are."
+        )
+        layout.addWidget(self.usb_sync_checkbox)
+
+        self.usb_remove_stale_checkbox = QCheckBox(
+            "Remove other jobs' NC files from the USB drive when syncing"
+        )
+        self.usb_remove_stale_checkbox.setChecked(
+            self._initial_settings.usb_remove_stale_nc
+        )
+        self.usb_remove_stale_checkbox.setEnabled(
+            self._initial_settings.usb_sync_mode
+        )
+        self.usb_sync_checkbox.toggled.connect(
+            self.usb_remove_stale_checkbox.setEnabled
+        )
+        layout.addWidget(self.usb_remove_stale_checkbox)
+
         return group
 
     def _build_troubleshooting_group(self) -> QGroupBox:
@@ -205,11 +340,24 @@ class SettingsDialog(QDialog):
             self._initial_settings,
             reverse_order=self.reverse_order_checkbox.isChecked(),
             print_delay_seconds=float(self.print_delay_spinbox.value()),
+            adaptive_pacing=self.adaptive_pacing_checkbox.isChecked(),
             separator_delay_seconds=float(
                 self.separator_delay_spinbox.value()
             ),
             print_separators=self.print_separators_checkbox.isChecked(),
+            stored_separator_format=self.stored_format_checkbox.isChecked(),
+            print_farm_enabled=self.print_farm_checkbox.isChecked(),
+            printer_change_notifications=(
+                self.printer_notifications_checkbox.isChecked()
+            ),
+            concurrent_job_scan=self.concurrent_scan_checkbox.isChecked(),
+            isolated_job_scan=self.isolated_scan_checkbox.isChecked(),
+            adaptive_refresh=self.adaptive_refresh_checkbox.isChecked(),
+            shared_job_index=self.shared_index_checkbox.isChecked(),
             auto_mark_printed=self.auto_mark_printed_checkbox.isChecked(),
+            verify_usb_copy=self.verify_usb_copy_checkbox.isChecked(),
+            usb_sync_mode=self.usb_sync_checkbox.isChecked(),
+            usb_remove_stale_nc=self.usb_remove_stale_checkbox.isChecked(),
             ui_font_size=int(self.font_size_combo.currentData()),
         )
 
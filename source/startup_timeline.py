@@ -0,0 +1,87 @@
+"""Startup timeline: where the time goes before the window is usable.
+
+:data:`STARTUP` starts its clock when this module is first imported — the
+first thing ``job_manager`` does — and records named milestones:
+
+``imports``
+    ``job_manager`` and everything it imports at module level are loaded.
+``ui``
+    The main window's widgets exist (compiled UI or ``uic.loadUi``).
+``first paint``
+    The main window received its first paint event.
+``first scan``
+    The first job scan has been applied to the tree (or has failed).
+
+Once both ``first paint`` and ``first scan`` are in, the timeline is logged
+as one line, and a warning is added when the first paint missed
+:data:`FIRST_PAINT_BUDGET_MS`. Time spent by the frozen exe's bootloader
+before Python starts is not included.
+
+The module imports nothing from Qt, so it can be imported first and its
+clock covers the Qt imports too.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+#: Target for the first paint, in milliseconds from the start of the clock.
+FIRST_PAINT_BUDGET_MS = 300.0
+
+#: Milestones that must all be marked before the timeline is logged.
+_REPORT_AFTER = ("first paint", "first scan")
+
+
+class StartupTimeline:
+    """Named milestones in milliseconds since the timeline was created."""
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        self._clock = clock
+        self._start = clock()
+        self._marks: dict[str, float] = {}
+        self.reported = False
+
+    def mark(self, name: str) -> None:
+        """Record *name* now; only its first mark counts."""
+        if name in self._marks:
+            return
+        self._marks[name] = (self._clock() - self._start) * 1000.0
+        if not self.reported and all(m in self._marks for m in _REPORT_AFTER):
+            self.reported = True
+            self._report()
+
+    def elapsed_ms(self, name: str) -> Optional[float]:
+        """When *name* was marked, or None if it has not been."""
+        return self._marks.get(name)
+
+    def summary(self) -> str:
+        """``"imports 120 ms, ui +35 ms, ..."`` in the order marked."""
+        parts = []
+        previous = 0.0
+        for name, at in sorted(self._marks.items(), key=lambda kv: kv[1]):
+            if parts:
+                parts.append(f"{name} +{at - previous:.0f} ms")
+            else:
+                parts.append(f"{name} {at:.0f} ms")
+            previous = at
+        return ", ".join(parts)
+
+    # -- internal helpers --------------------------------------------
+
+    def _report(self) -> None:
+        logger.info("Startup: %s", self.summary())
+        paint = self._marks["first paint"]
+        if paint > FIRST_PAINT_BUDGET_MS:
+            logger.warning(
+                "First paint took %.0f ms (budget %.0f ms)",
+                paint,
+                FIRST_PAINT_BUDGET_MS,
+            )
+
+
+#: The application's timeline; its clock starts at first import.
+STARTUP = StartupTimeline()
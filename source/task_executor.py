@@ -0,0 +1,307 @@
+"""Shared pool of persistent worker threads for short background tasks.
+
+The periodic job scan and the printer-status poll each used to start a
+fresh ``QThread`` per run and ``deleteLater`` it afterwards — a thread
+created and torn down every five seconds for the life of the process.
+:class:`TaskExecutor` keeps a small pool of worker threads alive instead
+and hands them typed :class:`Task` objects.
+
+Each submission returns a :class:`TaskHandle` carrying a
+:class:`CancelToken`. Progress, results and errors travel from the workers
+to the GUI thread through one signal bridge and are delivered to the
+callbacks given to :meth:`TaskExecutor.submit`, always on the thread that
+created the executor. A ``key`` makes a task exclusive: while a task with
+that key is queued or running, another submission with the same key is
+refused, which is how a refresh tick skips when the previous scan is still
+out on a slow share.
+
+Long operations the user starts explicitly (transfers, print runs, moves)
+keep their own ``QThread``: they run once per click, not in a hot loop.
+The pool size is set in one place, :data:`DEFAULT_MAX_WORKERS`.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+from typing import Any, Callable, Hashable, Optional
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+logger = logging.getLogger(__name__)
+
+#: Worker threads in the shared executor. Scans and polls are I/O bound
+#: and mostly exclusive per key, so a few workers cover every caller.
+DEFAULT_MAX_WORKERS = 4
+
+#: Reports progress from inside a task: ``(current, total, message)``.
+ProgressFn = Callable[[int, int, str], None]
+
+
+class TaskCancelled(Exception):
+    """Raised inside a task by :meth:`CancelToken.raise_if_cancelled`."""
+
+
+class CancelToken:
+    """Cooperative cancellation flag shared by a handle and its task."""
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        if self._event.is_set():
+            raise TaskCancelled()
+
+
+class Task:
+    """A unit of background work. Subclasses implement :meth:`run`."""
+
+    #: Short name used in log messages.
+    name = "task"
+
+    def run(self, token: CancelToken, progress: ProgressFn) -> Any:
+        """Do the work on a pool thread and return the result.
+
+        Check ``token`` at convenient points and stop early (returning or
+        raising :class:`TaskCancelled`) once it is cancelled.
+        """
+        raise NotImplementedError
+
+
+class CallableTask(Task):
+    """A :class:`Task` running a plain callable with no arguments."""
+
+    def __init__(self, func: Callable[[], Any], name: str = "task") -> None:
+        self._func = func
+        self.name = name
+
+    def run(self, token: CancelToken, progress: ProgressFn) -> Any:
+        return self._func()
+
+
+class TaskHandle:
+    """The caller's view of one submitted task."""
+
+    def __init__(
+        self,
+        task: Task,
+        key: Optional[Hashable],
+        on_result: Optional[Callable[[Any], None]],
+        on_error: Optional[Callable[[BaseException], None]],
+        on_progress: Optional[Callable[[int, int, str], None]],
+    ) -> None:
+        self.task = task
+        self.key = key
+        self.token = CancelToken()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self._on_result = on_result
+        self._on_error = on_error
+        self._on_progress = on_progress
+        self._done = threading.Event()
+
+    def cancel(self) -> None:
+        """Ask the task to stop; a cancelled task delivers nothing."""
+        self.token.cancel()
+
+    def discard(self) -> None:
+        """Drop the callbacks, e.g. before their receiver is destroyed."""
+        self._on_result = self._on_error = self._on_progress = None
+
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def wait(self, timeout_ms: int) -> bool:
+        """Block until the task has finished (or been skipped)."""
+        return self._done.wait(max(0, timeout_ms) / 1000.0)
+
+
+class _SignalBridge(QObject):
+    """Carries worker-thread events onto the executor's thread."""
+
+    delivered = pyqtSignal(object, str, object)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.delivered.connect(self._dispatch)
+
+    @staticmethod
+    def _dispatch(handle: TaskHandle, kind: str, payload: object) -> None:
+        if handle.token.cancelled:
+            return
+        try:
+            if kind == "progress" and handle._on_progress is not None:
+                handle._on_progress(*payload)
+            elif kind == "result" and handle._on_result is not None:
+                handle._on_result(payload)
+            elif kind == "error" and handle._on_error is not None:
+                handle._on_error(payload)
+        except Exception:  # noqa: BLE001 - one bad callback must not leak
+            logger.exception(
+                "Callback for background task %s failed", handle.task.name
+            )
+
+
+_STOP = object()
+
+
+class TaskExecutor:
+    """A fixed pool of persistent worker threads.
+
+    Workers start on first use and live until :meth:`shutdown`. Create the
+    executor on the GUI thread: callbacks run on the creating thread.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS) -> None:
+        self._max_workers = max(1, int(max_workers))
+        self._queue: queue.Queue = queue.Queue()
+        self._workers: list[threading.Thread] = []
+        self._keys: set[Hashable] = set()
+        self._lock = threading.Lock()
+        self._shutdown = False
+        self._bridge = _SignalBridge()
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    def submit(
+        self,
+        task: Task,
+        key: Optional[Hashable] = None,
+        on_result: Optional[Callable[[Any], None]] = None,
+        on_error: Optional[Callable[[BaseException], None]] = None,
+        on_progress: Optional[Callable[[int, int, str], None]] = None,
+    ) -> Optional[TaskHandle]:
+        """Queue *task*; return its handle, or None if *key* is in flight.
+
+        ``on_result`` receives the task's return value and ``on_error`` the
+        exception it raised; neither runs for a cancelled task.
+        """
+        handle = TaskHandle(task, key, on_result, on_error, on_progress)
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("TaskExecutor has been shut down")
+            if key is not None:
+                if key in self._keys:
+                    return None
+                self._keys.add(key)
+            if len(self._workers) < self._max_workers and (
+                self._queue.qsize() >= self._idle_workers()
+            ):
+                self._start_worker()
+        self._queue.put(handle)
+        return handle
+
+    def is_running(self, key: Hashable) -> bool:
+        """True while a task submitted with *key* is queued or running."""
+        with self._lock:
+            return key in self._keys
+
+    def shutdown(self, wait_ms: int = 5000) -> None:
+        """Stop the workers after their current task; queued tasks are
+        cancelled. Safe to call more than once."""
+        with self._lock:
+            if self._shutdown:
+                return
+            self._shutdown = True
+            workers = list(self._workers)
+        while True:
+            try:
+                handle = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if handle is not _STOP:
+                handle.cancel()
+                self._finish(handle)
+        for _worker in workers:
+            self._queue.put(_STOP)
+        for worker in workers:
+            worker.join(max(0, wait_ms) / 1000.0)
+
+    # -- internal helpers --------------------------------------------
+
+    def _idle_workers(self) -> int:
+        return sum(1 for w in self._workers if getattr(w, "idle", False))
+
+    def _start_worker(self) -> None:
+        worker = threading.Thread(
+            target=self._work,
+            name=f"TaskExecutor-{len(self._workers) + 1}",
+            daemon=True,
+        )
+        worker.idle = False  # type: ignore[attr-defined]
+        self._workers.append(worker)
+        worker.start()
+
+    def _work(self) -> None:
+        me = threading.current_thread()
+        while True:
+            me.idle = True  # type: ignore[attr-defined]
+            handle = self._queue.get()
+            me.idle = False  # type: ignore[attr-defined]
+            if handle is _STOP:
+                return
+            self._execute(handle)
+
+    def _execute(self, handle: TaskHandle) -> None:
+        if handle.token.cancelled:
+            self._finish(handle)
+            return
+
+        def progress(current: int, total: int, message: str = "") -> None:
+            self._bridge.delivered.emit(
+                handle, "progress", (int(current), int(total), str(message))
+            )
+
+        kind, payload = "result", None
+        try:
+            payload = handle.task.run(handle.token, progress)
+            handle.result = payload
+        except TaskCancelled:
+            kind = "cancelled"
+        except Exception as exc:  # noqa: BLE001 - delivered to the caller
+            logger.exception("Background task %s failed", handle.task.name)
+            handle.error = exc
+            kind, payload = "error", exc
+        # Release the key before delivering, so the result's receiver may
+        # submit the next task with the same key straight away.
+        self._finish(handle)
+        if kind != "cancelled":
+            self._bridge.delivered.emit(handle, kind, payload)
+
+    def _finish(self, handle: TaskHandle) -> None:
+        with self._lock:
+            if handle.key is not None:
+                self._keys.discard(handle.key)
+        handle._done.set()
+
+
+_shared: Optional[TaskExecutor] = None
+_shared_lock = threading.Lock()
+
+
+def shared_executor() -> TaskExecutor:
+    """The application's executor, created on first use (GUI thread)."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = TaskExecutor()
+        return _shared
+
+
+def shutdown_shared_executor(wait_ms: int = 5000) -> None:
+    """Stop the application's executor, if it was ever created."""
+    global _shared
+    with _shared_lock:
+        executor, _shared = _shared, None
+    if executor is not None:
+        executor.shutdown(wait_ms)
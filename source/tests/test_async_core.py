@@ -0,0 +1,134 @@
+"""Tests for ``source/async_core.py``."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("PyQt5.QtWidgets")
+pytest.importorskip("pytestqt")
+
+from async_core import AsyncCore, map_blocking  # noqa: E402
+
+
+@pytest.fixture
+def core(qtbot):
+    loop_core = AsyncCore(io_workers=4)
+    yield loop_core
+    loop_core.shutdown(2000)
+
+
+async def _answer() -> int:
+    await asyncio.sleep(0)
+    return threading.get_ident()
+
+
+def test_result_arrives_on_the_gui_thread(qtbot, core) -> None:
+    got: dict[str, list] = {"result": [], "thread": []}
+
+    def on_result(ident):
+        got["result"].append(ident)
+        got["thread"].append(threading.get_ident())
+
+    handle = core.submit(_answer(), on_result=on_result)
+    qtbot.waitUntil(lambda: bool(got["result"]), timeout=2000)
+
+    assert handle.done()
+    assert got["result"][0] != threading.get_ident()  # ran on the loop
+    assert got["thread"] == [threading.get_ident()]  # delivered here
+
+
+def test_errors_and_timeouts_go_to_the_error_callback(qtbot, core) -> None:
+    errors: list[BaseException] = []
+
+    async def boom():
+        raise OSError("S: drive unplugged")
+
+    async def hang():
+        await asyncio.sleep(30)
+
+    core.submit(boom(), on_error=errors.append)
+    core.submit(hang(), timeout=0.05, on_error=errors.append)
+    qtbot.waitUntil(lambda: len(errors) == 2, timeout=2000)
+
+    assert {type(exc) for exc in errors} == {OSError, TimeoutError}
+
+
+def test_cancel_stops_the_coroutine_and_delivers_nothing(qtbot, core) -> None:
+    started = threading.Event()
+    stopped = threading.Event()
+    delivered: list = []
+
+    async def slow():
+        started.set()
+        try:
+            await asyncio.sleep(30)
+        finally:
+            stopped.set()
+
+    handle = core.submit(
+        slow(), key="scan", on_result=delivered.append,
+        on_error=delivered.append,
+    )
+    assert started.wait(2)
+    handle.cancel()
+
+    assert handle.wait(2000)
+    assert stopped.wait(2)
+    assert not core.is_running("scan")
+    qtbot.wait(50)
+    assert delivered == []
+
+
+def test_key_refuses_a_second_submission_while_in_flight(qtbot, core) -> None:
+    release = threading.Event()
+
+    async def held():
+        await asyncio.to_thread(release.wait, 2)
+
+    first = core.submit(held(), key="scan")
+    second = core.submit(_answer(), key="scan")
+    release.set()
+
+    assert first is not None
+    assert second is None
+    assert first.wait(2000)
+    assert core.submit(_answer(), key="scan") is not None
+
+
+def test_run_blocks_for_the_result_off_the_gui_thread(core) -> None:
+    assert core.run(_answer(), timeout=2) != threading.get_ident()
+
+
+def test_map_blocking_keeps_order_and_bounds_concurrency() -> None:
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def work(item: int) -> int:
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.01)
+        with lock:
+            in_flight -= 1
+        return item * 2
+
+    result = asyncio.run(map_blocking(work, range(12), limit=3))
+
+    assert result == [item * 2 for item in range(12)]
+    assert 1 < peak <= 3
+
+
+def test_map_blocking_propagates_the_first_error() -> None:
+    def work(item: int) -> int:
+        if item == 2:
+            raise OSError("folder vanished")
+        return item
+
+    with pytest.raises(OSError):
+        asyncio.run(map_blocking(work, range(5), limit=2))
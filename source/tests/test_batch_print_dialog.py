@@ -0,0 +1,42 @@
+"""Tests for :class:`batch_print_dialog.BatchPrintDialog`."""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("PyQt5.QtWidgets")
+
+from PyQt5.QtCore import Qt  # noqa: E402
+
+from batch_print_dialog import BatchPrintDialog  # noqa: E402
+
+_CANDIDATES = [
+    ("A", "Job A", [("WHMR", 3), ("OAK", 1)]),
+    ("B", "Job B", [("MDF", 2)]),
+    ("C", "Job C", [("OAK", 4)]),
+]
+
+
+def test_selected_jobs_follow_checks_and_row_order(qtbot) -> None:
+    dlg = BatchPrintDialog(_CANDIDATES, preselected=("A",))
+    qtbot.addWidget(dlg)
+    assert dlg.selected_jobs() == [("A", ("WHMR", "OAK"))]
+
+    jobs = dlg._jobs
+    jobs.item(2).setCheckState(Qt.Checked)
+    # Drag job C above job A.
+    jobs.insertItem(0, jobs.takeItem(2))
+    assert dlg.selected_jobs() == [("C", ("OAK",)), ("A", ("WHMR", "OAK"))]
+
+
+def test_material_order_is_per_job_and_ok_needs_a_job(qtbot) -> None:
+    dlg = BatchPrintDialog(_CANDIDATES)
+    qtbot.addWidget(dlg)
+    assert not dlg._ok_button.isEnabled()
+
+    stack = dlg._material_lists["A"]
+    stack.insertItem(0, stack.takeItem(1))
+    dlg._jobs.item(0).setCheckState(Qt.Checked)
+
+    assert dlg._ok_button.isEnabled()
+    assert dlg.selected_jobs() == [("A", ("OAK", "WHMR"))]
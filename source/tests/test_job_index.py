@@ -0,0 +1,196 @@
+"""Tests for ``source/job_index.py``.
+
+The cooperative mode is exercised with several real processes sharing a
+temp dir as the jobs root, plus in-process checks with a fake clock for
+the lease hand-over.
+"""
+
+from __future__ import annotations
+
+import functools
+import multiprocessing
+import os
+import time
+
+from job_index import JobIndex, IndexedScanTask
+from job_scanner import Job
+from job_types import JobFiles, JobType
+from task_executor import CancelToken
+
+
+def _job(name: str, printed: bool = False) -> Job:
+    return Job(
+        name=name,
+        path=os.path.join("S:", name),
+        job_type=JobType.CUSTOM_DESIGN,
+        files=JobFiles(
+            nc_files=(f"{name}.nc",),
+            mdb_files=(),
+            wmf_files=(),
+            ljd_files=(f"{name}_1_WHMR.ljd",),
+            emf_files=(),
+        ),
+        source_folder="Printed" if printed else "Custom Design",
+        display_name=f"{name} (#1)",
+        is_printed=printed,
+    )
+
+
+def _logged_scan(root: str, who: str) -> tuple[list, list]:
+    with open(os.path.join(root, "scans.log"), "a", encoding="utf-8") as fh:
+        fh.write(who + "\n")
+    return [_job("Smith Kitchen"), _job("Jones Bath")], [_job("Old", True)]
+
+
+def _pc(root: str, who: str, ticks: int, start, results) -> None:
+    index = JobIndex(
+        functools.partial(_logged_scan, root, who),
+        jobs_root=root,
+        holder_id=who,
+        lease_ttl_s=60,
+    )
+    start.wait()
+    roles = []
+    result = None
+    for _ in range(ticks):
+        result = index.refresh()
+        roles.append(index.role)
+        time.sleep(0.02)
+    results.put((who, roles, [job.name for job in result[0]], result))
+
+
+def test_one_process_scans_and_the_others_read_its_index(tmp_path) -> None:
+    ctx = multiprocessing.get_context("spawn")
+    start = ctx.Event()
+    results = ctx.Queue()
+    pcs = [
+        ctx.Process(target=_pc, args=(str(tmp_path), f"pc{n}", 15, start, results))
+        for n in range(4)
+    ]
+    for pc in pcs:
+        pc.start()
+    start.set()
+    reports = [results.get(timeout=60) for _ in pcs]
+    for pc in pcs:
+        pc.join(10)
+
+    writers = [who for who, roles, _n, _r in reports if "writer" in roles]
+    assert len(writers) == 1
+    for who, roles, names, result in reports:
+        if who != writers[0]:
+            assert set(roles) <= {"reader", "fallback"}
+            assert roles[-1] == "reader"
+        assert names == ["Smith Kitchen", "Jones Bath"]
+        assert result == reports[0][3]
+
+    scanners = (tmp_path / "scans.log").read_text().split()
+    # Readers scan only while no index exists yet; the writer every tick.
+    assert scanners.count(writers[0]) == 15
+    assert len(scanners) - 15 <= 3
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_stale_lease_is_taken_over(tmp_path) -> None:
+    scans = {"a": 0, "b": 0}
+
+    def scan(who):
+        scans[who] += 1
+        return [_job(f"by {who}")], []
+
+    clock = _Clock()
+    a = JobIndex(lambda: scan("a"), str(tmp_path), "a", 10, clock)
+    b = JobIndex(lambda: scan("b"), str(tmp_path), "b", 10, clock)
+
+    assert a.refresh()[0][0].name == "by a" and a.role == "writer"
+    assert b.refresh()[0][0].name == "by a" and b.role == "reader"
+
+    # a keeps renewing: b keeps reading however long it waits.
+    for _ in range(3):
+        clock.now += 8
+        a.refresh()
+        b.refresh()
+        assert b.role == "reader"
+
+    # a stops (crashed, PC off): b takes over once the lease is stale.
+    clock.now += 5
+    b.refresh()
+    assert b.role == "reader"
+    clock.now += 6
+    assert b.refresh()[0][0].name == "by b" and b.role == "writer"
+
+    assert a.refresh()[0][0].name == "by b" and a.role == "reader"
+    assert scans == {"a": 4, "b": 1}
+
+
+def test_reader_parses_the_index_only_when_it_changes(tmp_path, monkeypatch) -> None:
+    writer = JobIndex(lambda: ([_job("One")], []), str(tmp_path), "w")
+    reader = JobIndex(lambda: ([], []), str(tmp_path), "r")
+    writer.refresh()
+
+    loads = []
+    import job_index
+
+    original = job_index.json.load
+    monkeypatch.setattr(
+        job_index.json, "load", lambda fh: loads.append(fh.name) or original(fh)
+    )
+    first = reader.refresh()
+    second = reader.refresh()
+
+    index_loads = [name for name in loads if name.endswith(".jobindex")]
+    assert len(index_loads) == 1
+    assert second is first
+    assert first[0][0] == _job("One")
+
+
+def test_missing_or_foreign_index_falls_back_to_scanning(tmp_path) -> None:
+    (tmp_path / ".jobindex.lease").write_text(
+        '{"holder": "other", "seq": 1, "renewed": ""}'
+    )
+    (tmp_path / ".jobindex").write_text('{"format": 999}')
+    index = JobIndex(lambda: ([_job("Mine")], []), str(tmp_path), "me")
+
+    task = IndexedScanTask(index)
+    assert task.run(CancelToken(), lambda *a: None)[0][0].name == "Mine"
+    assert index.role == "fallback"
+
+
+def test_holder_whose_scans_fail_stops_renewing_and_is_replaced(
+    tmp_path,
+) -> None:
+    failing = {"on": False}
+
+    def scan_a():
+        if failing["on"]:
+            raise OSError("share half-reachable")
+        return [_job("by a")], []
+
+    clock = _Clock()
+    a = JobIndex(scan_a, str(tmp_path), "a", 10, clock)
+    b = JobIndex(lambda: ([_job("by b")], []), str(tmp_path), "b", 10, clock)
+    a.refresh()
+    assert b.refresh()[0][0].name == "by a" and b.role == "reader"
+
+    # a still holds the lease but every scan now fails: it must not renew.
+    failing["on"] = True
+    for _ in range(3):
+        clock.now += 4
+        try:
+            a.refresh()
+        except OSError:
+            pass
+        else:
+            raise AssertionError("a's scan should have failed")
+        result = b.refresh()
+    assert b.role == "writer"
+    assert result[0][0].name == "by b"
+
+    # a reads b's index from now on instead of retrying its own scan.
+    assert a.refresh()[0][0].name == "by b" and a.role == "reader"
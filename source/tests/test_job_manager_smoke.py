@@ -86,6 +86,9 @@ def job_manager_window(qtbot, monkeypatch, tmp_path):
     monkeypatch.setattr(
         "transfer_history.DEFAULT_HISTORY_DIR", str(tmp_path / "history")
     )
+    monkeypatch.setattr(
+        "print_run_record.DEFAULT_RECORD_DIR", str(tmp_path / "history")
+    )
 
     # Suppress the "check for updates" background thread and the deferred
     # Archive->Printed migration, both of which go through singleShot.
@@ -487,3 +490,198 @@ def test_minimised_restore_does_not_restart_polls_while_busy(
     assert window._refresh_timer.isActive() is False  # busy still wins
     window._set_ui_busy(False)
     assert window._refresh_timer.isActive() is True
+
+
+# -- operation queue --------------------------------------------------------
+
+
+def test_direct_operation_refused_while_queue_is_active(
+    job_manager_window, monkeypatch
+):
+    """An interactive transfer must not run alongside queued workers."""
+    window = job_manager_window
+    root = window.jobTreeWidget.topLevelItem(0)
+    for i in range(root.childCount()):
+        if root.child(i).data(0, Qt.UserRole).name == "Active CO Job":
+            window.jobTreeWidget.setCurrentItem(root.child(i))
+    monkeypatch.setattr(window._queue, "is_active", lambda: True)
+
+    window._transfer_files()
+
+    assert window._busy is False
+    assert window._active_thread is None
+    assert "queue" in window.statusbar.currentMessage()
+
+
+def test_busy_ui_pauses_the_queue(job_manager_window):
+    window = job_manager_window
+    window._set_ui_busy(True)
+    assert window._queue._paused is True
+    window._set_ui_busy(False)
+    assert window._queue._paused is False
+
+
+def test_queued_print_honours_auto_move(job_manager_window, monkeypatch):
+    """A queued print must follow the same auto-move rule as the button."""
+    from settings import AppSettings
+
+    window = job_manager_window
+    window._settings = AppSettings(auto_mark_printed=True)
+    moved: list[str] = []
+    monkeypatch.setattr(window, "_enqueue_move", lambda j: moved.append(j.name))
+    job = _make_job("Queued CD Job", job_type=JobType.CUSTOM_DESIGN, has_ljd=True)
+
+    window._on_queued_operation_finished(True, "Printed", "printed", job)
+
+    assert moved == ["Queued CD Job"]
+    assert window._history.get_status("Queued CD Job") == "In Progress"
+
+
+def test_adaptive_refresh_backs_off_while_nothing_changes(
+    qtbot, job_manager_window
+):
+    from settings import AppSettings
+
+    window = job_manager_window
+    window._settings = AppSettings(adaptive_refresh=True)
+
+    _refresh_and_wait(qtbot, window)
+    first = window._refresh_timer.interval()
+    _refresh_and_wait(qtbot, window)
+
+    assert window._refresh_timer.isActive()
+    assert window._refresh_timer.interval() > first >= 5000
+
+
+def test_compiled_ui_sets_the_same_widgets_as_load_ui(
+    qtbot, monkeypatch, tmp_path
+):
+    import importlib.util
+
+    from PyQt5 import uic
+    from PyQt5.QtWidgets import QMainWindow
+
+    import job_manager
+
+    compiled = tmp_path / "job_manager_ui.py"
+    with open(compiled, "w", encoding="utf-8") as fh:
+        uic.compileUi(job_manager._resource_path("job_manager.ui"), fh)
+    spec = importlib.util.spec_from_file_location("job_manager_ui", compiled)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    loaded = QMainWindow()
+    qtbot.addWidget(loaded)
+    monkeypatch.setattr(job_manager, "Ui_MainWindow", None)
+    job_manager._setup_main_window_ui(loaded)
+
+    built = QMainWindow()
+    qtbot.addWidget(built)
+    monkeypatch.setattr(job_manager, "Ui_MainWindow", module.Ui_MainWindow)
+    job_manager._setup_main_window_ui(built)
+
+    assert {"jobTreeWidget", "statusbar"} <= set(vars(built))
+    assert set(vars(loaded)) <= set(vars(built))
+    for name in vars(loaded):
+        assert type(getattr(built, name)) is type(getattr(loaded, name))
+
+
+def test_print_timing_summary_replaces_ready_in_status_bar(
+    job_manager_window, monkeypatch
+):
+    monkeypatch.setattr(
+        "job_manager.QMessageBox.critical", lambda *a, **k: None
+    )
+    window = job_manager_window
+    job = _make_job("Timed Job", job_type=JobType.CUSTOM_DESIGN, has_ljd=True)
+    window._on_timing_summary("Timing: 3 items in 1.2s")
+
+    window._on_operation_finished(False, "Printing failed", "printed", job)
+
+    assert window.statusbar.currentMessage() == "Timing: 3 items in 1.2s"
+    window._on_operation_finished(False, "Copy failed", "transferred", job)
+    assert window.statusbar.currentMessage() == "Ready"
+
+
+def test_reprint_keeps_the_interrupted_run_resumable(
+    job_manager_window, monkeypatch
+):
+    import label_printer
+    import print_sequencer
+    from PyQt5.QtCore import QObject, pyqtSignal
+
+    from settings import AppSettings
+
+    started: list[dict] = []
+
+    class FakePrintThread(QObject):
+        progress = pyqtSignal(int, int, str)
+        finished = pyqtSignal(bool, str)
+        timingSummary = pyqtSignal(str)
+        _describe_item = staticmethod(
+            label_printer.LabelPrinterThread._describe_item
+        )
+
+        def __init__(self, **kwargs) -> None:
+            super().__init__()
+            self.kwargs = kwargs
+            started.append(kwargs)
+
+        def start(self) -> None:
+            pass
+
+        def isRunning(self) -> bool:  # noqa: N802 - QThread contract
+            return False
+
+    def labels(count: int) -> list:
+        return [
+            print_sequencer.PrintItem(
+                kind=print_sequencer.LABEL_KIND,
+                file_path=f"/fake/JOB_WHMR_{n:04d}.ljd",
+                material="WHMR",
+                board_number=n,
+            )
+            for n in range(1, count + 1)
+        ]
+
+    monkeypatch.setattr(label_printer, "LabelPrinterThread", FakePrintThread)
+    monkeypatch.setattr(
+        "job_manager.QMessageBox.information", lambda *a, **k: None
+    )
+    monkeypatch.setattr(
+        "job_manager.QMessageBox.critical", lambda *a, **k: None
+    )
+    window = job_manager_window
+    window._settings = AppSettings()
+
+    # A 500-label run is cancelled after 120 labels.
+    window._start_print_worker(
+        labels(500), "Zebra", [("Big Job", "CUSTOM_DESIGN")],
+        lambda ok, msg: window._set_ui_busy(False),
+    )
+    started[-1]["run_record"].mark_sent(120)
+    window._active_thread.finished.emit(False, "Cancelled")
+
+    # One spoiled label is reprinted.
+    job = _make_job("Big Job", job_type=JobType.CUSTOM_DESIGN, has_ljd=True)
+    monkeypatch.setattr(window, "_selected_job", lambda: job)
+    monkeypatch.setattr(window, "_resolve_print_printer", lambda: "Zebra")
+    monkeypatch.setattr(
+        "job_manager.QInputDialog.getText", lambda *a, **k: ("7", True)
+    )
+    monkeypatch.setattr(
+        print_sequencer, "build_reprint_sequence", lambda *a, **k: labels(1)
+    )
+    window._reprint_labels()
+    assert started[-1]["run_record"] is None
+    window._active_thread.finished.emit(True, "Printed 1 items")
+
+    # Resume still continues the big run where it stopped.
+    monkeypatch.setattr(
+        "job_manager.QInputDialog.getItem",
+        lambda _p, _t, _l, choices, current, _e: (choices[current], True),
+    )
+    window._resume_print()
+    resumed = started[-1]
+    assert len(resumed["sequence"]) == 500
+    assert resumed["start_index"] == 120
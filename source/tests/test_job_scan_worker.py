@@ -11,7 +11,8 @@ import pytest
 
 pytest.importorskip("PyQt5.QtWidgets")
 
-from job_scan_worker import JobScanThread  # noqa: E402
+from job_scan_worker import JobScanThread, ScanJobsTask  # noqa: E402
+from task_executor import CancelToken  # noqa: E402
 
 
 @pytest.fixture()
@@ -56,3 +57,62 @@ def test_printed_scan_failure_degrades_to_empty_list(_qapp) -> None:
 
     assert got["scanned"] == [(["active1"], [])]
     assert got["failed"] == []
+
+
+def test_scan_task_matches_the_thread_semantics() -> None:
+    def boom():
+        raise OSError("printed folder unreadable")
+
+    task = ScanJobsTask(scan_active=lambda: ("a1",), scan_printed=boom)
+    assert task.run(CancelToken(), lambda *a: None) == (["a1"], [])
+
+    def unplugged():
+        raise OSError("S: drive unplugged")
+
+    with pytest.raises(OSError):
+        ScanJobsTask(unplugged, lambda: []).run(CancelToken(), lambda *a: None)
+
+
+def test_async_scan_matches_the_thread_semantics(monkeypatch) -> None:
+    import asyncio
+
+    import job_scan_worker
+
+    async def active(concurrency):
+        return ["a1"]
+
+    async def printed_fails(concurrency):
+        raise OSError("printed folder unreadable")
+
+    monkeypatch.setattr(job_scan_worker, "scan_jobs_async", active)
+    monkeypatch.setattr(
+        job_scan_worker, "scan_printed_jobs_async", printed_fails
+    )
+    assert asyncio.run(job_scan_worker.scan_all_jobs_async()) == (["a1"], [])
+
+    async def unplugged(concurrency):
+        raise OSError("S: drive unplugged")
+
+    monkeypatch.setattr(job_scan_worker, "scan_jobs_async", unplugged)
+    with pytest.raises(OSError):
+        asyncio.run(job_scan_worker.scan_all_jobs_async())
+
+
+def test_blocking_scan_matches_the_thread_semantics(monkeypatch) -> None:
+    import job_scan_worker
+
+    def printed_fails(*args, **kwargs):
+        raise OSError("printed folder unreadable")
+
+    async def active_async(concurrency):
+        return ["a2"]
+
+    monkeypatch.setattr(job_scan_worker, "scan_jobs", lambda: ("a1",))
+    monkeypatch.setattr(job_scan_worker, "scan_printed_jobs", printed_fails)
+    monkeypatch.setattr(job_scan_worker, "scan_jobs_async", active_async)
+    monkeypatch.setattr(
+        job_scan_worker, "scan_printed_jobs_async", printed_fails
+    )
+
+    assert job_scan_worker.scan_all_jobs() == (["a1"], [])
+    assert job_scan_worker.scan_all_jobs(concurrent=True) == (["a2"], [])
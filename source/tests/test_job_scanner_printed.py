@@ -175,3 +175,30 @@ def test_job_dataclass_defaults_is_printed_false() -> None:
 def test_printed_dir_constant_is_exported() -> None:
     assert isinstance(PRINTED_DIR, str)
     assert "Printed" in PRINTED_DIR
+
+
+# -- concurrent scans -------------------------------------------------------
+
+
+def test_concurrent_scans_match_sequential_scans(monkeypatch, tmp_path) -> None:
+    """scan_*_async return exactly what the sequential scans return."""
+    import asyncio
+
+    from job_scanner import scan_jobs, scan_jobs_async, scan_printed_jobs_async
+
+    printed = _make_printed_folder(tmp_path)
+    sources = {}
+    for source in ("Cabinetry Online", "Custom Design"):
+        root = tmp_path / source
+        root.mkdir()
+        for index in range(5):
+            job = root / f"{source[0]}{index} Job"
+            job.mkdir()
+            (job / "data.mdb").write_bytes(b"")
+        sources[source] = str(root)
+    monkeypatch.setattr("job_scanner.SOURCE_DIRS", sources)
+
+    assert asyncio.run(scan_jobs_async(concurrency=3)) == scan_jobs()
+    assert asyncio.run(
+        scan_printed_jobs_async(printed, concurrency=2)
+    ) == scan_printed_jobs(printed)
@@ -13,12 +13,15 @@ import pytest
 
 pytest.importorskip("PyQt5.QtWidgets")
 
+import print_profile  # noqa: E402
 import printer_service  # noqa: E402
+import zpl_templates  # noqa: E402
 from label_printer import LabelPrinterThread  # noqa: E402
 from print_sequencer import (  # noqa: E402
     LABEL_KIND,
     SEPARATOR_LABEL_KIND,
     PrintItem,
+    PrintSequence,
 )
 from settings import AppSettings  # noqa: E402
 
@@ -54,8 +57,9 @@ def _fast_settings() -> AppSettings:
 
 
 @pytest.fixture()
-def printer_stub(monkeypatch):
+def printer_stub(monkeypatch, tmp_path):
     """Record printer_service calls; individual tests adjust behaviour."""
+    monkeypatch.setattr(print_profile, "REPORT_DIR", str(tmp_path / "logs"))
     calls: dict[str, list] = {
         "printto": [],
         "print_verb": [],
@@ -63,6 +67,7 @@ def printer_stub(monkeypatch):
         "set_default": [],
         "marker_saved": [],
         "marker_cleared": [],
+        "sessions": [],
     }
     state = {"printto_fails": False, "default": "HP LaserJet"}
 
@@ -79,13 +84,40 @@ def printer_stub(monkeypatch):
         "print_via_print_verb",
         lambda path: calls["print_verb"].append(path),
     )
-    monkeypatch.setattr(
-        printer_service,
-        "send_raw_zpl",
-        lambda printer, zpl, doc_name="": calls["raw_zpl"].append(
-            (printer, zpl)
-        ),
-    )
+    class FakeSession:
+        """Stands in for RawPrinterSession: one raw_zpl entry per document."""
+
+        def __init__(self, printer, coalesce=False):
+            self.printer = printer
+            self.coalesce = coalesce
+            self.pending: list[bytes] = []
+            self.closed = False
+            calls["sessions"].append(self)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            if exc_type is not None:
+                self.pending.clear()
+            self.close()
+
+        def write_document(self, data, doc_name=""):
+            if self.coalesce:
+                self.pending.append(data)
+            else:
+                calls["raw_zpl"].append((self.printer, data))
+
+        def flush(self):
+            if self.pending:
+                calls["raw_zpl"].append((self.printer, b"".join(self.pending)))
+                self.pending = []
+
+        def close(self):
+            self.flush()
+            self.closed = True
+
+    monkeypatch.setattr(printer_service, "RawPrinterSession", FakeSession)
     monkeypatch.setattr(
         printer_service,
         "get_default_printer",
@@ -165,11 +197,27 @@ def test_run_prints_labels_and_separators(_qapp, printer_stub) -> None:
     assert len(printer_stub["calls"]["printto"]) == 2
     assert len(printer_stub["calls"]["raw_zpl"]) == 1
     assert len(progress) == 3
-    assert finished == [(True, "Printed 3 items (2 labels + 1 separators)")]
+    ((ok, message),) = finished
+    assert ok is True
+    assert message == "Printed 3 items (2 labels + 1 separators)"
     # No fallback fired: default printer untouched.
     assert printer_stub["calls"]["set_default"] == []
 
 
+def test_run_prints_a_print_sequence_without_copying_it(
+    _qapp, printer_stub
+) -> None:
+    sequence = PrintSequence(
+        [[_label(board=2), _label(board=1)], [_separator()]]
+    )
+
+    thread, progress, finished = _run_thread(sequence)
+
+    assert thread._sequence is sequence
+    assert len(progress) == 3
+    assert finished[0][0] is True
+
+
 def test_run_empty_sequence_fails_cleanly(_qapp, printer_stub) -> None:
     _, _, finished = _run_thread([])
     assert finished == [(False, "No labels to print")]
@@ -340,3 +388,258 @@ def test_separator_uses_its_own_delay(_qapp, printer_stub, monkeypatch) -> None:
     # Two inter-item gaps: after the separator (2.5s) and after label 1 (1.0s).
     assert sleeps == [2.5, 1.0]
     assert finished[0][0] is True
+
+
+# ---------------------------------------------------------------------------
+# run() — raw ZPL session
+# ---------------------------------------------------------------------------
+
+
+def test_run_uses_one_session_and_coalesces_adjacent_separators(
+    _qapp, printer_stub, monkeypatch
+) -> None:
+    sleeps: list[float] = []
+    thread = LabelPrinterThread(
+        sequence=[
+            _separator("JOB"),
+            _separator("WHMR"),
+            _label(board=2),
+            _separator("BLK"),
+            _label(board=1),
+        ],
+        settings=AppSettings(
+            print_delay_seconds=1.0, separator_delay_seconds=2.5
+        ),
+        zebra_printer="Zebra",
+    )
+    monkeypatch.setattr(
+        thread,
+        "_interruptible_sleep",
+        lambda seconds: sleeps.append(seconds) or True,
+    )
+    finished: list[tuple] = []
+    thread.finished.connect(lambda *a: finished.append(a))
+
+    thread.run()
+
+    calls = printer_stub["calls"]
+    assert finished[0][0] is True
+    assert "3 separators" in finished[0][1]
+    assert len(calls["sessions"]) == 1
+    assert calls["sessions"][0].closed
+    # The two leading separators went out as one document.
+    assert len(calls["raw_zpl"]) == 2
+    # No wait between the coalesced separators, one after each group.
+    assert sleeps == [2.5, 1.0, 2.5]
+
+
+def test_buffered_separators_are_flushed_before_the_next_label(
+    _qapp, printer_stub, monkeypatch
+) -> None:
+    order: list[str] = []
+    calls = printer_stub["calls"]
+    monkeypatch.setattr(
+        printer_service,
+        "print_via_shellexecute",
+        lambda printer, path: order.append(
+            f"label after {len(calls['raw_zpl'])} docs"
+        ),
+    )
+
+    _, _, finished = _run_thread([_separator("A"), _separator("B"), _label()])
+
+    assert finished[0][0] is True
+    assert order == ["label after 1 docs"]
+
+
+def test_each_raw_item_is_built_once(_qapp, printer_stub, monkeypatch) -> None:
+    built: list[str] = []
+    real = zpl_templates.cached_job_separator
+
+    def counting(job_name, material):
+        built.append(material)
+        return real(job_name, material)
+
+    monkeypatch.setattr(zpl_templates, "cached_job_separator", counting)
+
+    _, _, finished = _run_thread(
+        [_separator("A"), _separator("B"), _label(), _separator("C")]
+    )
+
+    assert finished[0][0] is True
+    assert built == ["A", "B", "C"]
+
+
+def test_adaptive_pacing_waits_only_until_the_label_spools(
+    _qapp, printer_stub, monkeypatch
+) -> None:
+    queue: list[int] = []
+    monkeypatch.setattr(
+        printer_service, "get_queued_job_ids", lambda name: list(queue)
+    )
+    monkeypatch.setattr(
+        printer_service,
+        "print_via_shellexecute",
+        lambda printer, path: queue.append(len(queue) + 1),
+    )
+    sleeps: list[float] = []
+    thread = LabelPrinterThread(
+        sequence=[_label(board=2), _label(board=1)],
+        settings=AppSettings(
+            print_delay_seconds=2.0,
+            separator_delay_seconds=2.0,
+            adaptive_pacing=True,
+        ),
+        zebra_printer="Zebra",
+    )
+    monkeypatch.setattr(
+        thread,
+        "_interruptible_sleep",
+        lambda seconds: sleeps.append(seconds) or True,
+    )
+    finished: list[tuple] = []
+    thread.finished.connect(lambda *a: finished.append(a))
+
+    thread.run()
+
+    assert finished[0][0] is True
+    # The first label was already in a one-deep queue: no sleep at all.
+    assert sleeps == []
+
+
+def test_stored_format_is_downloaded_once_per_run(_qapp, printer_stub) -> None:
+    _, _, finished = _run_thread(
+        [_separator("A"), _label(board=2), _separator("B"), _label(board=1)],
+        settings=AppSettings(
+            print_delay_seconds=0.0,
+            separator_delay_seconds=0.0,
+            stored_separator_format=True,
+        ),
+    )
+
+    docs = [zpl for _, zpl in printer_stub["calls"]["raw_zpl"]]
+    assert finished[0][0] is True
+    assert len(docs) == 2
+    assert docs[0].count(b"^DF") == 1 and b"^XF" in docs[0]
+    assert b"^DF" not in docs[1] and b"^XF" in docs[1]
+
+
+def test_run_writes_timing_report_and_summary(
+    _qapp, printer_stub, tmp_path
+) -> None:
+    thread = LabelPrinterThread(
+        sequence=[_separator(), _label(board=1), _label(board=2)],
+        settings=_fast_settings(),
+        zebra_printer="Zebra GC420D",
+    )
+    summaries: list[str] = []
+    finished: list[tuple] = []
+    thread.timingSummary.connect(summaries.append)
+    thread.finished.connect(lambda *a: finished.append(a))
+    thread.run()
+
+    assert finished[0][0] is True
+    # The summary has its own signal; the finished message is unchanged.
+    assert summaries[0].startswith("Timing:")
+    assert summaries[0] not in finished[0][1]
+    (path,) = print_profile.list_reports(str(tmp_path / "logs"))
+    (report,) = print_profile.load_reports([path])
+    assert report["outcome"] == "completed"
+    assert report["items"] == 3 and report["labels"] == 2
+    assert [t["kind"] for t in report["timings"]] == [
+        SEPARATOR_LABEL_KIND,
+        LABEL_KIND,
+        LABEL_KIND,
+    ]
+    assert report["timings"][0]["raw"] is True
+    assert report["timings"][1]["raw"] is False
+
+
+def test_printto_failure_fails_run_when_swap_not_allowed(
+    _qapp, printer_stub
+) -> None:
+    printer_stub["state"]["printto_fails"] = True
+    thread = LabelPrinterThread(
+        sequence=[_label()],
+        settings=_fast_settings(),
+        zebra_printer="Zebra GC420D",
+        allow_default_swap=False,
+    )
+    finished: list[tuple] = []
+    thread.finished.connect(lambda *a: finished.append(a))
+    thread.run()
+
+    assert finished[0][0] is False
+    assert "cannot be swapped" in finished[0][1]
+    assert printer_stub["calls"]["set_default"] == []
+    assert printer_stub["calls"]["marker_saved"] == []
+
+
+def test_job_banner_is_sent_raw_and_counted(_qapp, printer_stub) -> None:
+    from print_sequencer import JOB_SEPARATOR_KIND
+
+    banner = PrintItem(
+        kind=JOB_SEPARATOR_KIND,
+        file_path="",
+        material="",
+        board_number=None,
+        job_name="JOB",
+    )
+    _thread, _progress, finished = _run_thread([_label(), _separator(), banner])
+
+    assert len(printer_stub["calls"]["printto"]) == 1
+    # Separator and banner are adjacent raw items: one document.
+    ((_printer, data),) = printer_stub["calls"]["raw_zpl"]
+    assert b"JOB START" in data
+    assert finished[0][1].startswith(
+        "Printed 3 items (1 labels + 1 separators + 1 job banners)"
+    )
+
+
+def test_run_record_tracks_sent_items_and_resumes(
+    _qapp, printer_stub, tmp_path
+) -> None:
+    from print_run_record import PrintRunRecord
+
+    record = PrintRunRecord(str(tmp_path / "run"))
+    sequence = [_label(board=1), _separator(), _label(board=2), _label(board=3)]
+    record.start("Zebra GC420D", [("JOB", "CUSTOM_DESIGN")], sequence)
+
+    thread = LabelPrinterThread(
+        sequence=sequence,
+        settings=_fast_settings(),
+        zebra_printer="Zebra GC420D",
+        run_record=record,
+    )
+    sent: list[int] = []
+    thread.itemSent.connect(sent.append)
+    cancel = {"now": False}
+    thread.itemSent.connect(lambda count: cancel.update(now=count == 2))
+    thread.isInterruptionRequested = lambda: cancel["now"]
+    thread.run()
+
+    # Cancelled once the separator (item 2) was flushed.
+    assert sent == [1, 2]
+    assert record.load().sent == 2
+
+    resumed = LabelPrinterThread(
+        sequence=list(record.load().sequence),
+        settings=_fast_settings(),
+        zebra_printer="Zebra GC420D",
+        run_record=record,
+        start_index=2,
+    )
+    progress: list[tuple] = []
+    finished: list[tuple] = []
+    resumed.progress.connect(lambda *a: progress.append(a))
+    resumed.finished.connect(lambda *a: finished.append(a))
+    resumed.run()
+
+    assert [p[0] for p in progress] == [3, 4]
+    assert finished[0][0] is True
+    assert finished[0][1].startswith("Printed 2 items")
+    printed = [path for _printer, path in printer_stub["calls"]["printto"]]
+    assert printed == [sequence[0].file_path] + [
+        item.file_path for item in sequence[2:]
+    ]
+    assert record.load() is None
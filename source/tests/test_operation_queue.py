@@ -0,0 +1,208 @@
+"""Tests for source/operation_queue.py — the cross-job operation scheduler.
+
+Operations are stand-in QThreads that block until the test releases them,
+so the tests can observe exactly which entries run side by side and which
+wait their turn.
+"""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+pytest.importorskip("PyQt5.QtWidgets")
+
+from PyQt5.QtCore import QThread, pyqtSignal  # noqa: E402
+
+from operation_queue import (  # noqa: E402
+    PRINT_OPERATION,
+    TRANSFER_OPERATION,
+    USB_OPERATION,
+    OperationQueue,
+    job_resource,
+    printer_resource,
+    usb_resource,
+)
+from queue_panel import OperationQueuePanel  # noqa: E402
+
+
+class _GatedThread(QThread):
+    """Worker double: reports progress, then waits for the test's go-ahead."""
+
+    progress = pyqtSignal(str)
+    finished = pyqtSignal(bool, str)
+
+    def __init__(self, name: str, succeed: bool = True) -> None:
+        super().__init__()
+        self.name = name
+        self.gate = threading.Event()
+        self._succeed = succeed
+
+    def run(self) -> None:
+        self.progress.emit(f"{self.name} working")
+        while not self.gate.wait(0.01):
+            if self.isInterruptionRequested():
+                self.finished.emit(False, f"{self.name} cancelled")
+                return
+        self.finished.emit(self._succeed, f"{self.name} done")
+
+
+@pytest.fixture()
+def queue(qtbot):
+    q = OperationQueue()
+    yield q
+    q.cancel_all()
+    q.wait_for_running(2000)
+
+
+def _enqueue(queue, kind, name, resources, threads, **kwargs):
+    def make():
+        thread = _GatedThread(name, **kwargs)
+        threads[name] = thread
+        return thread
+
+    return queue.enqueue(kind, name, resources, make)
+
+
+def _release(qtbot, queue, thread) -> None:
+    with qtbot.waitSignal(queue.itemFinished, timeout=3000):
+        thread.gate.set()
+
+
+def test_independent_resources_run_concurrently(qtbot, queue) -> None:
+    threads: dict[str, _GatedThread] = {}
+    _enqueue(queue, USB_OPERATION, "usb A",
+             {job_resource("A"), usb_resource("E:")}, threads)
+    _enqueue(queue, PRINT_OPERATION, "print B",
+             {job_resource("B"), printer_resource("Zebra")}, threads)
+
+    assert set(threads) == {"usb A", "print B"}
+    assert queue.pending_count() == 0
+
+    _release(qtbot, queue, threads["usb A"])
+    _release(qtbot, queue, threads["print B"])
+    assert not queue.is_active()
+
+
+def test_conflicting_resources_run_in_queue_order(qtbot, queue) -> None:
+    threads: dict[str, _GatedThread] = {}
+    started: list[str] = []
+    queue.itemStarted.connect(lambda op_id: started.append(op_id))
+    first = _enqueue(queue, PRINT_OPERATION, "print A",
+                     {job_resource("A"), printer_resource("Zebra")}, threads)
+    second = _enqueue(queue, PRINT_OPERATION, "print B",
+                      {job_resource("B"), printer_resource("Zebra")}, threads)
+
+    assert started == [first]
+    _release(qtbot, queue, threads["print A"])
+    assert started == [first, second]
+    _release(qtbot, queue, threads["print B"])
+
+
+def test_later_entry_cannot_overtake_conflicting_earlier_entry(
+    qtbot, queue
+) -> None:
+    """print A waits on the printer; move A must not jump ahead of it."""
+    threads: dict[str, _GatedThread] = {}
+    _enqueue(queue, PRINT_OPERATION, "print B",
+             {job_resource("B"), printer_resource("Zebra")}, threads)
+    _enqueue(queue, PRINT_OPERATION, "print A",
+             {job_resource("A"), printer_resource("Zebra")}, threads)
+    _enqueue(queue, TRANSFER_OPERATION, "move A", {job_resource("A")}, threads)
+
+    assert set(threads) == {"print B"}
+
+    _release(qtbot, queue, threads["print B"])
+    assert set(threads) == {"print B", "print A"}
+    _release(qtbot, queue, threads["print A"])
+    assert "move A" in threads
+    _release(qtbot, queue, threads["move A"])
+
+
+def test_paused_queue_holds_new_starts(qtbot, queue) -> None:
+    threads: dict[str, _GatedThread] = {}
+    queue.set_paused(True)
+    _enqueue(queue, USB_OPERATION, "usb A", {usb_resource("E:")}, threads)
+    assert threads == {}
+
+    queue.set_paused(False)
+    assert set(threads) == {"usb A"}
+    _release(qtbot, queue, threads["usb A"])
+
+
+def test_cancel_pending_entry_reports_and_skips_it(qtbot, queue) -> None:
+    threads: dict[str, _GatedThread] = {}
+    finished: list[tuple] = []
+    queue.itemFinished.connect(lambda *a: finished.append(a))
+    _enqueue(queue, PRINT_OPERATION, "print A", {printer_resource("Z")}, threads)
+    waiting = _enqueue(
+        queue, PRINT_OPERATION, "print B", {printer_resource("Z")}, threads
+    )
+
+    queue.cancel(waiting)
+
+    assert finished == [(waiting, False, "Removed from the queue")]
+    _release(qtbot, queue, threads["print A"])
+    assert "print B" not in threads
+
+
+def test_failure_callback_and_panel_rows(qtbot, queue) -> None:
+    panel = OperationQueuePanel(queue)
+    qtbot.addWidget(panel)
+    results: list[tuple] = []
+    threads: dict[str, _GatedThread] = {}
+
+    def make():
+        threads["t"] = _GatedThread("copy", succeed=False)
+        return threads["t"]
+
+    op_id = queue.enqueue(
+        USB_OPERATION, "Job X", {usb_resource("E:")}, make,
+        on_finished=lambda ok, msg: results.append((ok, msg)),
+    )
+    qtbot.waitUntil(lambda: "copy working" in panel.row_text(op_id))
+
+    with qtbot.waitSignal(queue.idle, timeout=3000):
+        threads["t"].gate.set()
+
+    assert results == [(False, "copy done")]
+    assert "Failed" in panel.row_text(op_id)
+    panel.clear_finished()
+    assert panel.row_text(op_id) == ""
+
+
+def test_last_entry_failing_to_start_still_reports_idle(qtbot, queue) -> None:
+    def make():
+        raise OSError("drive gone")
+
+    idles: list[None] = []
+    queue.idle.connect(lambda: idles.append(None))
+    results: list[tuple] = []
+
+    queue.enqueue(
+        USB_OPERATION, "Job X", {usb_resource("E:")}, make,
+        on_finished=lambda ok, msg: results.append((ok, msg)),
+    )
+
+    assert results == [(False, "Could not start: drive gone")]
+    assert idles == [None]
+    assert not queue.is_active()
+
+
+def test_failed_start_after_a_finish_reports_idle_once(qtbot, queue) -> None:
+    threads: dict[str, _GatedThread] = {}
+    _enqueue(queue, PRINT_OPERATION, "print A", {printer_resource("Z")}, threads)
+
+    def make():
+        raise OSError("printer gone")
+
+    queue.enqueue(PRINT_OPERATION, "print B", {printer_resource("Z")}, make)
+    idles: list[None] = []
+    queue.idle.connect(lambda: idles.append(None))
+
+    with qtbot.waitSignal(queue.idle, timeout=3000):
+        threads["print A"].gate.set()
+    qtbot.wait(20)
+
+    assert idles == [None]
@@ -0,0 +1,204 @@
+"""Tests for source/print_farm.py.
+
+The controller tests run real ``LabelPrinterThread`` workers on real
+threads against :class:`FakePrinterBackend`, which stands in for
+``printer_service`` and records what each named printer received.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("PyQt5.QtWidgets")
+
+import print_profile  # noqa: E402
+import printer_service  # noqa: E402
+from print_farm import (  # noqa: E402
+    PrintFarmController,
+    assign_groups,
+    split_material_groups,
+)
+from print_sequencer import (  # noqa: E402
+    JOB_SEPARATOR_KIND,
+    LABEL_KIND,
+    SEPARATOR_LABEL_KIND,
+    BatchJob,
+    build_batch_print_sequence,
+    build_print_sequence,
+)
+from settings import AppSettings  # noqa: E402
+
+
+@pytest.fixture()
+def _qapp():
+    from PyQt5.QtWidgets import QApplication
+
+    yield QApplication.instance() or QApplication([])
+
+
+class FakePrinterBackend:
+    """Per-printer recording stand-in for the printer_service functions.
+
+    ``printed[name]`` lists what reached each printer in arrival order:
+    the label path for handler prints, ``b"..."`` ZPL for raw documents.
+    Printers named in ``rejecting`` refuse every ``printto``.
+    """
+
+    def __init__(self, monkeypatch, seconds_per_item: float = 0.0) -> None:
+        self.printed: dict[str, list] = {}
+        self.rejecting: set[str] = set()
+        self.default_changes: list[str] = []
+        self._delay = seconds_per_item
+        self._lock = threading.Lock()
+        backend = self
+
+        class Session:
+            def __init__(self, printer, coalesce=False):
+                self.printer = printer
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return None
+
+            def write_document(self, data, doc_name=""):
+                backend._record(self.printer, data)
+
+            def flush(self):
+                pass
+
+            def close(self):
+                pass
+
+        def printto(printer, path):
+            if printer in backend.rejecting:
+                raise OSError("printto rejected")
+            backend._record(printer, path)
+
+        monkeypatch.setattr(printer_service, "RawPrinterSession", Session)
+        monkeypatch.setattr(printer_service, "print_via_shellexecute", printto)
+        monkeypatch.setattr(
+            printer_service,
+            "set_default_printer",
+            lambda name: backend.default_changes.append(name),
+        )
+
+    def _record(self, printer: str, entry) -> None:
+        time.sleep(self._delay)
+        with self._lock:
+            self.printed.setdefault(printer, []).append(entry)
+
+
+def _sequence() -> list:
+    files = (
+        [f"/jobs/JOB_WHMR_{n:04d}.ljd" for n in range(1, 7)]
+        + [f"/jobs/JOB_OAK_{n:04d}.ljd" for n in range(1, 4)]
+        + [f"/jobs/JOB_MDF_{n:04d}.ljd" for n in range(1, 4)]
+    )
+    return build_print_sequence("JOB", files, material_priority=("WHMR",))
+
+
+def _settings() -> AppSettings:
+    return AppSettings(print_delay_seconds=0.0, separator_delay_seconds=0.0)
+
+
+def _run(controller, app, timeout: float = 10.0) -> list[tuple]:
+    finished: list[tuple] = []
+    controller.finished.connect(lambda *a: finished.append(a))
+    controller.start()
+    deadline = time.monotonic() + timeout
+    while not finished and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.01)
+    assert finished, "farm did not finish"
+    return finished
+
+
+def test_split_keeps_each_material_with_its_separator() -> None:
+    groups = split_material_groups(_sequence())
+    assert [g[0].material for g in groups] == ["OAK", "MDF", "WHMR"]
+    for group in groups:
+        # Print order: the separator comes last, on top of its stack.
+        assert group[-1].kind == SEPARATOR_LABEL_KIND
+        assert {item.material for item in group} == {group[0].material}
+
+
+def test_split_keeps_job_banner_with_the_stack_below_it() -> None:
+    sequence = build_batch_print_sequence(
+        [
+            BatchJob("J1", ("/j/J1_OAK_0001.ljd",)),
+            BatchJob("J2", ("/j/J2_OAK_0001.ljd",)),
+        ]
+    )
+    groups = split_material_groups(sequence)
+    assert [[i.kind for i in g] for g in groups] == [
+        [LABEL_KIND, SEPARATOR_LABEL_KIND, JOB_SEPARATOR_KIND]
+    ] * 2
+    assert [g[-1].job_name for g in groups] == ["J2", "J1"]
+
+
+def test_assign_balances_and_preserves_order() -> None:
+    sequence = _sequence()
+    assignments = assign_groups(sequence, ["A", "B"], 1.0, 1.0)
+
+    # WHMR (7 items) alone balances OAK + MDF (4 + 4).
+    assert [i.material for i in assignments["A"]] == ["WHMR"] * 7
+    assert {i.material for i in assignments["B"]} == {"MDF", "OAK"}
+    # Each printer's items appear in the original sequence order.
+    for items in assignments.values():
+        positions = [sequence.index(i) for i in items]
+        assert positions == sorted(positions)
+    assert sum(len(v) for v in assignments.values()) == len(sequence)
+
+
+def test_assign_single_group_uses_first_printer_only() -> None:
+    sequence = build_print_sequence("JOB", ["/j/JOB_OAK_0001.ljd"])
+    assert list(assign_groups(sequence, ["A", "B"], 1.0, 1.0)) == ["A"]
+
+
+def test_controller_prints_each_share_on_its_printer(
+    _qapp, monkeypatch, tmp_path
+) -> None:
+    monkeypatch.setattr(print_profile, "REPORT_DIR", str(tmp_path))
+    backend = FakePrinterBackend(monkeypatch, seconds_per_item=0.01)
+    assignments = assign_groups(_sequence(), ["Zebra A", "Zebra B"], 1.0, 1.0)
+    controller = PrintFarmController(assignments, _settings())
+    per_printer: list[tuple] = []
+    controller.printerProgress.connect(lambda *a: per_printer.append(a))
+    summaries: list[str] = []
+    controller.timingSummary.connect(summaries.append)
+
+    ((ok, message),) = _run(controller, _qapp)
+
+    assert ok is True
+    assert message.startswith("Printed 15 items on 2 printers")
+    assert "Timing:" not in message
+    (summary,) = summaries
+    assert summary.startswith("Zebra A: Timing:")
+    assert "  |  Zebra B: Timing:" in summary
+    for printer, items in assignments.items():
+        labels = [i.file_path for i in items if i.kind == LABEL_KIND]
+        sent = [e for e in backend.printed[printer] if isinstance(e, str)]
+        assert sent == labels
+    assert {p for p, *_ in per_printer} == {"Zebra A", "Zebra B"}
+    assert not controller.isRunning()
+
+
+def test_controller_never_swaps_default_printer(
+    _qapp, monkeypatch, tmp_path
+) -> None:
+    monkeypatch.setattr(print_profile, "REPORT_DIR", str(tmp_path))
+    backend = FakePrinterBackend(monkeypatch)
+    backend.rejecting.add("Zebra B")
+    assignments = assign_groups(_sequence(), ["Zebra A", "Zebra B"], 1.0, 1.0)
+
+    ((ok, message),) = _run(PrintFarmController(assignments, _settings()), _qapp)
+
+    assert ok is False
+    assert message.startswith("Printing failed on 1 of 2 printers")
+    assert backend.default_changes == []
+    assert len(backend.printed["Zebra A"]) == len(assignments["Zebra A"])
@@ -0,0 +1,129 @@
+"""Tests for source/print_pacing.py against a simulated spooler.
+
+The simulated spooler runs on a fake clock advanced only by the pacer's
+sleeps: a submitted label reaches the queue after a per-job handler latency,
+and the printer finishes one job every ``print_seconds``.
+"""
+
+from __future__ import annotations
+
+import random
+
+import printer_service
+from print_pacing import AdaptivePacer
+
+
+class _SimulatedSpooler:
+    def __init__(self, print_seconds: float, latencies: list[float]) -> None:
+        self.now = 0.0
+        self._print_seconds = print_seconds
+        self._latencies = list(latencies)
+        self._next_id = 1
+        # (label, time it reaches the queue)
+        self._in_flight: list[tuple[str, float]] = []
+        self._queue: list[tuple[int, str]] = []
+        self._printer_free_at = 0.0
+        self._printing_started: dict[int, float] = {}
+        self.spool_order: list[str] = []
+        self.printed: list[str] = []
+        self.readable = True
+        self.max_depth = 0
+
+    def submit(self, label: str) -> None:
+        self._in_flight.append((label, self.now + self._latencies.pop(0)))
+
+    def _advance(self) -> None:
+        # Spool arrivals in the order they reach the queue — this is where
+        # an early submission with a short latency would overtake.
+        for label, at in sorted(self._in_flight, key=lambda e: e[1]):
+            if at <= self.now:
+                self._queue.append((self._next_id, label))
+                self.spool_order.append(label)
+                self._next_id += 1
+                self._in_flight.remove((label, at))
+        self.max_depth = max(self.max_depth, len(self._queue))
+        # The printer works through the queue head.
+        while self._queue:
+            job_id, label = self._queue[0]
+            started = self._printing_started.setdefault(
+                job_id, max(self.now, self._printer_free_at)
+            )
+            if started + self._print_seconds > self.now:
+                break
+            self._queue.pop(0)
+            self._printer_free_at = started + self._print_seconds
+            self.printed.append(label)
+
+    def job_ids(self):
+        self._advance()
+        if not self.readable:
+            return None
+        return [job_id for job_id, _ in self._queue]
+
+    def sleep(self, seconds: float) -> bool:
+        self.now += seconds
+        self._advance()
+        return True
+
+
+def _run(spooler: _SimulatedSpooler, labels: int, delay: float, adaptive: bool):
+    pacer = AdaptivePacer(spooler.job_ids, clock=lambda: spooler.now)
+    for index in range(labels):
+        if adaptive:
+            pacer.before_submit()
+        spooler.submit(f"L{index:03d}")
+        if index == labels - 1:
+            spooler.sleep(1.0)  # let the last label reach the queue
+            break
+        if adaptive:
+            pacer.wait_after_submit(delay, spooler.sleep)
+        else:
+            spooler.sleep(delay)
+    return pacer
+
+
+def test_adaptive_run_is_faster_and_keeps_order() -> None:
+    rng = random.Random(7)
+    latencies = [rng.uniform(0.05, 0.6) for _ in range(120)]
+    fixed = _SimulatedSpooler(print_seconds=0.5, latencies=latencies)
+    adaptive = _SimulatedSpooler(print_seconds=0.5, latencies=latencies)
+
+    _run(fixed, 120, delay=2.0, adaptive=False)
+    _run(adaptive, 120, delay=2.0, adaptive=True)
+
+    expected = [f"L{i:03d}" for i in range(120)]
+    assert adaptive.spool_order == expected
+    assert adaptive.now < fixed.now / 2
+
+
+def test_wait_holds_back_while_queue_is_deep() -> None:
+    # Slow printer: each label takes 3 s, so the queue backs up and the
+    # pacer must wait for it to drain below the target depth.
+    spooler = _SimulatedSpooler(print_seconds=3.0, latencies=[0.1] * 10)
+    _run(spooler, 10, delay=2.0, adaptive=True)
+
+    assert spooler.spool_order == [f"L{i:03d}" for i in range(10)]
+    # Never more than the target depth (2) plus the one just submitted.
+    assert spooler.max_depth <= 3
+
+
+def test_unreadable_queue_falls_back_to_fixed_delay() -> None:
+    spooler = _SimulatedSpooler(print_seconds=0.1, latencies=[0.1] * 5)
+    spooler.readable = False
+
+    pacer = _run(spooler, 5, delay=2.0, adaptive=True)
+
+    assert spooler.now == 9.0  # four full 2 s gaps, then the final drain
+    assert pacer.fallbacks == 4
+
+
+def test_cancel_during_wait_returns_false() -> None:
+    pacer = AdaptivePacer(lambda: [1], clock=lambda: 0.0)
+    pacer.before_submit()  # the queue never changes: job never "appears"
+
+    assert pacer.wait_after_submit(2.0, lambda seconds: False) is False
+
+
+def test_get_queued_job_ids_none_without_win32(monkeypatch) -> None:
+    monkeypatch.setattr(printer_service, "HAS_WIN32", False)
+    assert printer_service.get_queued_job_ids("Zebra") is None
@@ -0,0 +1,68 @@
+"""Tests for source/print_profile.py."""
+
+from __future__ import annotations
+
+import json
+import os
+
+import print_profile
+from print_profile import PrintProfiler
+
+
+def _profiler() -> PrintProfiler:
+    return PrintProfiler(
+        printer="Zebra", label_delay=2.0, separator_delay=0.5, adaptive=False
+    )
+
+
+def test_measure_accumulates_per_item_stage() -> None:
+    profiler = _profiler()
+    profiler.start_item(1, "label", "a.ljd")
+    with profiler.measure("submit"):
+        pass
+    with profiler.measure("sleep"):
+        pass
+    profiler.start_item(2, "separator", "Separator: WHMR")
+    report = profiler.report("completed")
+
+    assert report["items"] == 2 and report["labels"] == 1
+    first, second = report["timings"]
+    assert first["submit"] > 0 and first["sleep"] > 0
+    assert second["submit"] == 0
+    assert report["totals"]["submit"] >= 0
+    assert "2 items" in print_profile.summary_line(report)
+
+
+def test_write_report_prunes_old_reports(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(print_profile, "MAX_REPORTS", 2)
+    for _ in range(4):
+        assert print_profile.write_report(
+            _profiler().report("completed"), str(tmp_path)
+        )
+    assert len(print_profile.list_reports(str(tmp_path))) == 2
+
+
+def test_write_report_failure_is_not_fatal(tmp_path) -> None:
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("x")
+    assert print_profile.write_report({}, str(blocker)) is None
+
+
+def test_cli_compares_saved_runs(tmp_path, capsys) -> None:
+    slow = _profiler().report("completed")
+    slow["started"] = "2026-01-01T08:00:00"
+    fast = {**slow, "started": "2026-01-02T08:00:00", "label_delay": 1.0}
+    for name, rep in (("a", slow), ("b", fast)):
+        path = os.path.join(tmp_path, f"print_profile_{name}.json")
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump(rep, fh)
+    (tmp_path / "print_profile_c.json").write_text("{broken")
+
+    assert print_profile.main(["--dir", str(tmp_path)]) == 0
+    out = capsys.readouterr().out.splitlines()
+    assert len(out) == 4
+    assert out[2].startswith("2026-01-01") and out[3].startswith("2026-01-02")
+
+
+def test_cli_without_reports_fails(tmp_path, capsys) -> None:
+    assert print_profile.main(["--dir", str(tmp_path)]) == 1
@@ -0,0 +1,46 @@
+"""Tests for source/print_run_record.py."""
+
+from __future__ import annotations
+
+from print_run_record import PrintRunRecord
+from print_sequencer import build_print_sequence
+
+SEQUENCE = build_print_sequence(
+    "JOB", ["/j/JOB_OAK_0001.ljd", "/j/JOB_OAK_0002.ljd", "/j/JOB_MDF_0001.ljd"]
+)
+
+
+def test_round_trip_survives_a_new_instance(tmp_path) -> None:
+    record = PrintRunRecord(str(tmp_path))
+    record.start("Zebra", [("JOB", "CUSTOM_DESIGN")], SEQUENCE)
+    record.mark_sent(3)
+
+    saved = PrintRunRecord(str(tmp_path)).load()
+    assert saved is not None
+    assert saved.sequence == tuple(SEQUENCE)
+    assert saved.printer == "Zebra"
+    assert saved.jobs == (("JOB", "CUSTOM_DESIGN"),)
+    assert saved.sent == 3 and saved.total == len(SEQUENCE)
+
+
+def test_finish_forgets_the_run(tmp_path) -> None:
+    record = PrintRunRecord(str(tmp_path))
+    record.start("Zebra", [], SEQUENCE)
+    assert record.has_unfinished()
+    record.finish()
+    assert not record.has_unfinished()
+    assert record.load() is None
+    record.finish()  # idempotent
+
+
+def test_damaged_record_is_ignored(tmp_path) -> None:
+    (tmp_path / "print_run.json").write_text("{not json")
+    assert PrintRunRecord(str(tmp_path)).load() is None
+
+
+def test_new_run_resets_progress(tmp_path) -> None:
+    record = PrintRunRecord(str(tmp_path))
+    record.start("Zebra", [], SEQUENCE)
+    record.mark_sent(2)
+    record.start("Zebra", [], SEQUENCE[:1])
+    assert record.load().sent == 0
@@ -2,20 +2,30 @@
 
 from __future__ import annotations
 
+import tracemalloc
 from dataclasses import FrozenInstanceError
 
 import pytest
 
 from print_sequencer import (  # noqa: E402
+    JOB_SEPARATOR_KIND,
     LABEL_KIND,
     SEPARATOR_LABEL_KIND,
     UNKNOWN_MATERIAL,
+    BatchJob,
     PrintItem,
+    PrintSequence,
+    build_batch_print_sequence,
     build_print_sequence,
+    build_print_sequence_from_groups,
+    build_reprint_sequence,
     compute_peel_order,
     detect_materials_in_job,
     extract_material_from_filename,
     group_ljd_files_by_material,
+    parse_board_selection,
+    parse_ljd_filenames,
+    separator_item,
 )
 
 
@@ -134,6 +144,79 @@ def test_group_by_material_preserves_full_paths():
     assert grouped["WHMR"][0][1] == "/abs/path/JOB_WHMR_0001.ljd"
 
 
+def _group_per_file(files):
+    """The original one-file-at-a-time grouping, as the reference."""
+    grouped = {}
+    for index, path in enumerate(files):
+        parsed = extract_material_from_filename(path)
+        if parsed is None:
+            grouped.setdefault(UNKNOWN_MATERIAL, []).append((-1 - index, path))
+            continue
+        grouped.setdefault(parsed[1], []).append((parsed[2], path))
+    for entries in grouped.values():
+        entries.sort()
+    return grouped
+
+
+_ODD_NAMES = [
+    "JOB_WHMR_0007.ljd",
+    "/abs/JOB_A_B_OAK_12.LJD",
+    "J_A_1.B_2",  # extension holds the underscores
+    "J_A.B_2",  # no usable stem once the extension is split off
+    "._A_1",  # leading dot is part of the job
+    "..J_A_1.ljd",
+    "J_A_.5",
+    "J__1.ljd",
+    "_A_1.ljd",
+    "J_A_²",
+    "J_A_12.34",
+    "",
+    "dir/",
+]
+
+
+def test_parse_ljd_filenames_matches_per_file_parser():
+    columns = parse_ljd_filenames(_ODD_NAMES)
+    assert len(columns.jobs) == len(_ODD_NAMES)
+    for index, name in enumerate(_ODD_NAMES):
+        parsed = extract_material_from_filename(name)
+        row = (
+            columns.jobs[index],
+            columns.materials[index],
+            columns.boards[index],
+        )
+        assert row == (parsed or (None, None, None)), name
+
+
+def test_parse_ljd_filenames_newline_falls_back_to_per_file():
+    columns = parse_ljd_filenames(["JOB_A_1.ljd", "bad\nJOB_B_2.ljd"])
+    assert columns.materials == ["A", "B"]
+    assert columns.boards == [1, 2]
+    assert parse_ljd_filenames([]) == ([], [], [])
+
+
+def test_group_by_material_matches_per_file_grouping():
+    files = [
+        f"/jobs/JOB_{material}_{board:04d}.ljd"
+        for board in (5, 1, 3, 2, 4)
+        for material in ("WHMR", "OAK", "MDF")
+    ] + ["bad.ljd", "JOB_OAK_0003.ljd", "also_bad.ljd"]
+    grouped = group_ljd_files_by_material(files)
+    expected = _group_per_file(files)
+    assert grouped == expected
+    assert list(grouped) == list(expected)
+
+
+def test_group_by_material_numpy_sort_matches(monkeypatch):
+    pytest.importorskip("numpy")
+    import print_sequencer
+
+    monkeypatch.setattr(print_sequencer, "_NUMPY_MIN_FILES", 1)
+    files = [f"JOB_{m}_{b}.ljd" for b in (3, 1, 2) for m in ("B", "A")]
+    files.append("unparseable")
+    assert group_ljd_files_by_material(files) == _group_per_file(files)
+
+
 # ---------------------------------------------------------------------------
 # compute_peel_order
 # ---------------------------------------------------------------------------
@@ -479,6 +562,63 @@ def test_detect_materials_includes_unknown_bucket():
     assert materials.index("WHMR") < materials.index(UNKNOWN_MATERIAL)
 
 
+# ---------------------------------------------------------------------------
+# PrintSequence
+# ---------------------------------------------------------------------------
+
+
+def _mixed_sequence() -> PrintSequence:
+    files = [f"JOB_WHMR_{i:04d}.ljd" for i in range(1, 6)]
+    files += [f"JOB_OAK_{i:04d}.ljd" for i in range(1, 4)]
+    return build_print_sequence("JOB", files, ("WHMR",))
+
+
+def test_print_sequence_random_access_matches_iteration():
+    seq = _mixed_sequence()
+    items = list(seq)
+    assert len(seq) == len(items) == 10
+    assert [seq[i] for i in range(len(seq))] == items
+    assert seq[-1] == items[-1] and seq[-10] == items[0]
+    assert seq[2:7] == items[2:7]
+    assert seq[::-3] == items[::-3]
+    with pytest.raises(IndexError):
+        seq[10]
+
+
+def test_print_sequence_reverses_and_compares_like_a_list():
+    seq = _mixed_sequence()
+    items = list(seq)
+    assert list(reversed(seq)) == items[::-1]
+    assert seq == items and seq == tuple(items)
+    assert seq != items[:-1]
+    assert PrintSequence([seq]) == seq
+    assert seq.index(items[4]) == 4 and items[4] in seq
+    assert not PrintSequence() and PrintSequence() == []
+
+
+def test_print_sequence_reverse_within_false_prints_ascending():
+    files = [f"JOB_OAK_{i:04d}.ljd" for i in range(1, 4)]
+    seq = build_print_sequence("JOB", files, reverse_within=False)
+    assert [item.board_number for item in seq] == [1, 2, 3, None]
+    assert [item.board_number for item in reversed(seq)] == [None, 3, 2, 1]
+
+
+def test_print_sequence_memory_stays_flat_with_job_size():
+    def peak_bytes(count: int) -> int:
+        grouped = {
+            "WHMR": tuple((i, f"JOB_WHMR_{i:05d}.ljd") for i in range(count))
+        }
+        tracemalloc.start()
+        try:
+            seq = build_print_sequence_from_groups("JOB", grouped)
+            assert seq[count // 2].board_number == count - 1 - count // 2
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    assert peak_bytes(50_000) < 2 * peak_bytes(500) + 4096
+
+
 # ---------------------------------------------------------------------------
 # PrintItem frozen dataclass
 # ---------------------------------------------------------------------------
@@ -495,6 +635,33 @@ def test_print_item_frozen():
         item.board_number = 2  # type: ignore[misc]
 
 
+def test_print_item_is_slotted_with_dataclass_repr():
+    item = PrintItem(LABEL_KIND, "x.ljd", "WHMR", 1)
+    assert not hasattr(item, "__dict__")
+    assert repr(item) == (
+        "PrintItem(kind='label', file_path='x.ljd', material='WHMR', "
+        "board_number=1, job_name='')"
+    )
+
+
+def test_separators_are_shared_between_sequences():
+    files = ["JOB_WHMR_0001.ljd", "JOB_OAK_0001.ljd"]
+    first = build_print_sequence("JOB", files)
+    second = build_print_sequence("JOB", list(reversed(files)))
+    firsts = {i.material: i for i in first if i.kind == SEPARATOR_LABEL_KIND}
+    seconds = {i.material: i for i in second if i.kind == SEPARATOR_LABEL_KIND}
+    assert firsts.keys() == {"WHMR", "OAK"}
+    assert all(firsts[m] is seconds[m] for m in firsts)
+    assert firsts["OAK"] is separator_item(SEPARATOR_LABEL_KIND, "OAK", "JOB")
+
+
+def test_parsed_materials_are_interned():
+    names = ["".join(["JOB_", "WH", "MR_", str(i), ".ljd"]) for i in (1, 2)]
+    columns = parse_ljd_filenames(names)
+    assert columns.materials[0] is columns.materials[1]
+    assert columns.jobs[0] is columns.jobs[1]
+
+
 def test_print_item_defaults():
     item = PrintItem(
         kind=LABEL_KIND,
@@ -503,3 +670,89 @@ def test_print_item_defaults():
         board_number=1,
     )
     assert item.job_name == ""
+
+
+# ---------------------------------------------------------------------------
+# build_batch_print_sequence
+# ---------------------------------------------------------------------------
+
+
+def test_batch_sequence_is_each_job_topped_by_a_banner() -> None:
+    first = BatchJob("JOB1", ("/j/JOB1_OAK_0001.ljd", "/j/JOB1_OAK_0002.ljd"))
+    second = BatchJob(
+        "JOB2",
+        ("/j/JOB2_WHMR_0001.ljd", "/j/JOB2_OAK_0001.ljd"),
+        material_priority=("OAK",),
+    )
+    merged = build_batch_print_sequence([first, second])
+
+    # First job peeled first = printed last.
+    expected = [
+        *build_print_sequence("JOB2", second.ljd_files, ("OAK",)),
+        PrintItem(JOB_SEPARATOR_KIND, "", "", None, job_name="JOB2"),
+        *build_print_sequence("JOB1", first.ljd_files),
+        PrintItem(JOB_SEPARATOR_KIND, "", "", None, job_name="JOB1"),
+    ]
+    assert merged == expected
+
+
+def test_batch_sequence_skips_jobs_without_labels() -> None:
+    merged = build_batch_print_sequence(
+        [BatchJob("EMPTY", ()), BatchJob("JOB", ("/j/JOB_OAK_0001.ljd",))]
+    )
+    assert [i.job_name for i in merged if i.kind == JOB_SEPARATOR_KIND] == [
+        "JOB"
+    ]
+
+
+# ---------------------------------------------------------------------------
+# parse_board_selection / build_reprint_sequence
+# ---------------------------------------------------------------------------
+
+REPRINT_FILES = [
+    *(f"/j/JOB_WHMR_{n:04d}.ljd" for n in range(1, 6)),
+    *(f"/j/JOB_OAK_{n:04d}.ljd" for n in range(1, 6)),
+]
+
+
+def test_parse_board_selection_terms() -> None:
+    selection = parse_board_selection("7, 12-15 whmr OAK:3-4")
+    assert selection.matches("MDF", 7)
+    assert selection.matches("MDF", 14) and not selection.matches("MDF", 16)
+    assert selection.matches("WHMR", 99)
+    assert selection.matches("oak", 3) and not selection.matches("OAK", 5)
+
+
+@pytest.mark.parametrize("text", ["", "  ", "3-", "5-2", ":4", "OAK:x"])
+def test_parse_board_selection_rejects_bad_input(text) -> None:
+    with pytest.raises(ValueError):
+        parse_board_selection(text)
+
+
+def test_reprint_single_board_gets_only_its_separator() -> None:
+    sequence = build_reprint_sequence(
+        "JOB", REPRINT_FILES, parse_board_selection("OAK:2")
+    )
+    assert sequence == build_print_sequence("JOB", ["/j/JOB_OAK_0002.ljd"])
+    assert [i.kind for i in sequence] == [LABEL_KIND, SEPARATOR_LABEL_KIND]
+
+
+def test_reprint_follows_full_print_order_rules() -> None:
+    selection = parse_board_selection("2-3")
+    for reverse in (True, False):
+        sequence = build_reprint_sequence(
+            "JOB", REPRINT_FILES, selection, ("OAK",), reverse, True
+        )
+        full = build_print_sequence("JOB", REPRINT_FILES, ("OAK",), reverse)
+        # Same relative order as the full print, minus unselected boards.
+        assert sequence == [
+            item
+            for item in full
+            if item.kind != LABEL_KIND or item.board_number in (2, 3)
+        ]
+
+
+def test_reprint_with_no_match_is_empty() -> None:
+    assert build_reprint_sequence(
+        "JOB", REPRINT_FILES, parse_board_selection("MDF")
+    ) == []
@@ -0,0 +1,169 @@
+"""Tests for ``source/printer_monitor.py``.
+
+The monitor thread runs for real against :class:`FakeChangeBackend`, so
+each test drives the spooler by calling ``notify`` and waits for the Qt
+signals with pytest-qt's ``qtbot``.
+"""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+pytest.importorskip("PyQt5.QtWidgets")
+pytest.importorskip("pytestqt")
+
+from printer_monitor import (  # noqa: E402
+    PRINTER_CHANGE_JOB,
+    PRINTER_CHANGE_PRINTER,
+    FakeChangeBackend,
+    PrinterMonitorThread,
+)
+from printer_status_widget import PrinterStatusWidget  # noqa: E402
+
+
+class FakeSpooler:
+    """Installed printers plus a count of enumerations."""
+
+    def __init__(self, names=()) -> None:
+        self.names = list(names)
+        self.calls = 0
+
+    def list_printers(self) -> list[str]:
+        self.calls += 1
+        return list(self.names)
+
+
+@pytest.fixture
+def monitor_parts(qtbot):
+    spooler = FakeSpooler(["Office Laser"])
+    backend = FakeChangeBackend()
+    monitor = PrinterMonitorThread(
+        backend, spooler.list_printers, fallback_interval_ms=20
+    )
+    yield spooler, backend, monitor
+    assert monitor.stop(2000)
+
+
+def test_initial_enumeration_lists_printers(qtbot, monitor_parts) -> None:
+    spooler, _backend, monitor = monitor_parts
+    with qtbot.waitSignal(monitor.printersListed, timeout=2000) as blocker:
+        monitor.start()
+    assert blocker.args == [["Office Laser"]]
+    assert spooler.calls == 1
+
+
+def test_printer_change_relists_printers(qtbot, monitor_parts) -> None:
+    spooler, backend, monitor = monitor_parts
+    with qtbot.waitSignal(monitor.printersListed, timeout=2000):
+        monitor.start()
+
+    spooler.names = ["ZDesigner GC420d"]
+    with qtbot.waitSignal(monitor.printersListed, timeout=2000) as blocker:
+        backend.notify(PRINTER_CHANGE_PRINTER)
+    assert blocker.args == [["ZDesigner GC420d"]]
+
+
+def test_job_change_emits_queue_changed_without_enumerating(
+    qtbot, monitor_parts
+) -> None:
+    spooler, backend, monitor = monitor_parts
+    with qtbot.waitSignal(monitor.printersListed, timeout=2000):
+        monitor.start()
+
+    with qtbot.waitSignal(monitor.queueChanged, timeout=2000):
+        backend.notify(PRINTER_CHANGE_JOB)
+    assert spooler.calls == 1
+
+
+def test_idle_monitor_makes_no_spooler_calls(qtbot, monitor_parts) -> None:
+    spooler, _backend, monitor = monitor_parts
+    with qtbot.waitSignal(monitor.printersListed, timeout=2000):
+        monitor.start()
+    qtbot.wait(200)
+    assert spooler.calls == 1
+
+
+def test_stop_wakes_an_idle_monitor_promptly(qtbot, monitor_parts) -> None:
+    _spooler, _backend, monitor = monitor_parts
+    with qtbot.waitSignal(monitor.printersListed, timeout=2000):
+        monitor.start()
+    started = time.monotonic()
+    assert monitor.stop(2000)
+    assert time.monotonic() - started < 1.0
+
+
+def test_unavailable_notifications_fall_back_to_polling(
+    qtbot, monitor_parts
+) -> None:
+    spooler, backend, monitor = monitor_parts
+    backend.open_error = OSError("no change notifications")
+    monitor.start()
+    qtbot.waitUntil(lambda: spooler.calls >= 3, timeout=2000)
+
+
+def test_event_driven_widget_follows_the_monitor(qtbot) -> None:
+    spooler = FakeSpooler([])
+    backend = FakeChangeBackend()
+    widget = PrinterStatusWidget(
+        poll_interval_ms=10_000,
+        event_driven=True,
+        monitor_factory=lambda interval_ms: PrinterMonitorThread(
+            backend, spooler.list_printers, fallback_interval_ms=interval_ms
+        ),
+    )
+    qtbot.addWidget(widget)
+    widget.start()
+    try:
+        spooler.names = ["ZDesigner GC420d"]
+        with qtbot.waitSignal(widget.statusChanged, timeout=2000) as blocker:
+            backend.notify(PRINTER_CHANGE_PRINTER)
+        assert blocker.args == [True]
+        assert widget.resolved_printer_name() == "ZDesigner GC420d"
+
+        # Re-targeting re-resolves from the last list: no spooler call.
+        calls = spooler.calls
+        with qtbot.waitSignal(widget.statusChanged, timeout=1000) as blocker:
+            widget.set_printer_name("Other Zebra")
+        assert blocker.args == [False]
+        assert spooler.calls == calls
+    finally:
+        widget.stop()
+
+
+def test_event_driven_widget_shows_the_queue_length(qtbot, monkeypatch) -> None:
+    import printer_status_widget
+
+    queue: list[int] = []
+    monkeypatch.setattr(
+        printer_status_widget, "get_queued_job_ids", lambda name: list(queue)
+    )
+    spooler = FakeSpooler(["ZDesigner GC420d"])
+    backend = FakeChangeBackend()
+    widget = PrinterStatusWidget(
+        poll_interval_ms=10_000,
+        event_driven=True,
+        monitor_factory=lambda interval_ms: PrinterMonitorThread(
+            backend, spooler.list_printers, fallback_interval_ms=interval_ms
+        ),
+    )
+    qtbot.addWidget(widget)
+    with qtbot.waitSignal(widget.statusChanged, timeout=2000):
+        widget.start()
+    try:
+        qtbot.waitUntil(lambda: widget.queued_jobs() == 0, timeout=2000)
+        assert widget._text_label.text() == "Zebra: Connected"
+
+        queue[:] = [11, 12, 13]
+        backend.notify(PRINTER_CHANGE_JOB)
+        qtbot.waitUntil(lambda: widget.queued_jobs() == 3, timeout=2000)
+        assert "3 queued" in widget._text_label.text()
+
+        spooler.names = []
+        with qtbot.waitSignal(widget.statusChanged, timeout=2000):
+            backend.notify(PRINTER_CHANGE_PRINTER)
+        assert widget.queued_jobs() is None
+        assert widget._text_label.text() == "Zebra: Disconnected"
+    finally:
+        widget.stop()
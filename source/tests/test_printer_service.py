@@ -187,6 +187,65 @@ def test_send_raw_zpl_raises_when_unavailable(no_win32):
         printer_service.send_raw_zpl("Zebra", b"data")
 
 
+# ---------------------------------------------------------------------------
+# RawPrinterSession
+# ---------------------------------------------------------------------------
+
+
+def test_session_opens_once_for_many_documents(fake_win32print):
+    fake_win32print.OpenPrinter.return_value = "HPRINTER"
+    fake_win32print.StartDocPrinter.side_effect = [11, 12, 13]
+
+    with printer_service.RawPrinterSession("Zebra") as session:
+        job_ids = [
+            session.write_document(b"^XA%d^XZ" % i, f"doc {i}")
+            for i in range(3)
+        ]
+
+    assert job_ids == [11, 12, 13]
+    fake_win32print.OpenPrinter.assert_called_once_with("Zebra")
+    fake_win32print.ClosePrinter.assert_called_once_with("HPRINTER")
+    assert fake_win32print.EndDocPrinter.call_count == 3
+
+
+def test_session_coalesces_until_flush(fake_win32print):
+    fake_win32print.OpenPrinter.return_value = "HPRINTER"
+    fake_win32print.StartDocPrinter.return_value = 7
+
+    session = printer_service.RawPrinterSession("Zebra", coalesce=True)
+    assert session.write_document(b"^XAone^XZ", "sep 1") is None
+    assert session.write_document(b"^XAtwo^XZ", "sep 2") is None
+    fake_win32print.OpenPrinter.assert_not_called()
+
+    assert session.flush() == 7
+    session.close()
+
+    fake_win32print.StartDocPrinter.assert_called_once_with(
+        "HPRINTER", 1, ("sep 1 (+1)", None, "RAW")
+    )
+    fake_win32print.WritePrinter.assert_called_once_with(
+        "HPRINTER", b"^XAone^XZ^XAtwo^XZ"
+    )
+    fake_win32print.ClosePrinter.assert_called_once_with("HPRINTER")
+
+
+def test_session_discards_buffer_when_run_fails(fake_win32print):
+    with pytest.raises(RuntimeError):
+        with printer_service.RawPrinterSession("Zebra", coalesce=True) as s:
+            s.write_document(b"^XA^XZ", "sep")
+            raise RuntimeError("run failed")
+
+    fake_win32print.WritePrinter.assert_not_called()
+    fake_win32print.OpenPrinter.assert_not_called()
+
+
+def test_session_raises_when_unavailable(no_win32):
+    session = printer_service.RawPrinterSession("Zebra")
+    with pytest.raises(PrinterServiceUnavailable):
+        session.write_document(b"data", "doc")
+    session.close()  # nothing was opened; must not raise
+
+
 # ---------------------------------------------------------------------------
 # print_via_shellexecute
 # ---------------------------------------------------------------------------
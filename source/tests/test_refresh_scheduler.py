@@ -0,0 +1,82 @@
+"""Tests for ``source/refresh_scheduler.py``."""
+
+from __future__ import annotations
+
+from refresh_scheduler import RefreshPolicy, RefreshScheduler
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _scheduler(rng=lambda: 0.5, **policy) -> tuple[RefreshScheduler, _Clock]:
+    clock = _Clock()
+    return RefreshScheduler(RefreshPolicy(**policy), clock=clock, rng=rng), clock
+
+
+def test_change_refreshes_fast_then_idle_backs_off_to_the_cap() -> None:
+    scheduler, _clock = _scheduler()
+    scheduler.note_scan(changed=True, cost_s=0.0)
+    assert scheduler.next_delay_ms() == 2000
+
+    delays = []
+    for _ in range(6):
+        scheduler.note_scan(changed=False, cost_s=0.0)
+        delays.append(scheduler.next_delay_ms())
+
+    assert delays == [5000, 10000, 20000, 40000, 60000, 60000]
+
+    scheduler.note_scan(changed=True, cost_s=0.0)
+    assert scheduler.next_delay_ms() == 2000
+
+
+def test_activity_keeps_the_fast_interval_for_a_while() -> None:
+    scheduler, clock = _scheduler()
+    for _ in range(4):
+        scheduler.note_scan(changed=False, cost_s=0.0)
+    assert scheduler.next_delay_ms() == 40000
+
+    scheduler.note_activity()
+    scheduler.note_scan(changed=False, cost_s=0.0)
+    assert scheduler.next_delay_ms() == 2000
+
+    clock.now += 31
+    assert scheduler.next_delay_ms() == 5000
+
+
+def test_failures_back_off_with_jitter_up_to_the_cap() -> None:
+    low, _ = _scheduler(rng=lambda: 0.0)
+    high, _ = _scheduler(rng=lambda: 1.0)
+    for scheduler in (low, high):
+        scheduler.note_failure(cost_s=0.0)
+
+    assert low.next_delay_ms() == 7500  # 10 s - 25 %
+    assert high.next_delay_ms() == 12500  # 10 s + 25 %
+
+    for _ in range(10):
+        high.note_failure(cost_s=0.0)
+    assert high.next_delay_ms() == 120000
+
+    high.note_scan(changed=False, cost_s=0.0)
+    assert high.failure_streak == 0
+    assert high.next_delay_ms() == 5000
+
+
+def test_slow_scans_are_repeated_less_often() -> None:
+    scheduler, _clock = _scheduler()
+    scheduler.note_scan(changed=True, cost_s=3.0)
+    assert scheduler.next_delay_ms() == 12000  # 4 x 3 s, not 2 s
+
+    scheduler.note_scan(changed=True, cost_s=1000.0)
+    assert scheduler.next_delay_ms() == 60000  # still capped
+
+
+def test_a_long_outage_stays_at_the_cap() -> None:
+    scheduler, _clock = _scheduler()
+    for _ in range(5000):
+        scheduler.note_failure(cost_s=0.0)
+    assert scheduler.next_delay_ms() == 120000
@@ -0,0 +1,127 @@
+"""Tests for ``source/scan_process.py``.
+
+The helper is a real spawned process, so the scan functions it runs live
+at module level where the child can import them.
+"""
+
+from __future__ import annotations
+
+import functools
+import os
+import time
+
+import pytest
+
+from scan_process import (
+    HelperScanTask,
+    ScanHelperError,
+    ScanProcess,
+    ScanTimeout,
+)
+from task_executor import CancelToken
+
+
+def _listing(concurrent: bool) -> tuple[list, list]:
+    return ["job-a", "job-b"], ["printed-a"] if not concurrent else []
+
+
+def _counting(counter_path: str, concurrent: bool) -> tuple[list, list]:
+    with open(counter_path, "a", encoding="utf-8") as fh:
+        fh.write("x")
+    with open(counter_path, encoding="utf-8") as fh:
+        return [f"scan {len(fh.read())}"], []
+
+
+def _hang_while_marked(marker: str, concurrent: bool) -> tuple[list, list]:
+    while os.path.exists(marker):
+        time.sleep(0.05)
+    return ["recovered"], []
+
+
+def _broken(concurrent: bool) -> tuple[list, list]:
+    raise OSError("S: drive unplugged")
+
+
+def _crash(concurrent: bool) -> tuple[list, list]:
+    os._exit(3)
+
+
+@pytest.fixture
+def make_process():
+    created: list[ScanProcess] = []
+
+    def make(scan, deadline_s: float = 20.0) -> ScanProcess:
+        process = ScanProcess(scan=scan, deadline_s=deadline_s)
+        created.append(process)
+        return process
+
+    yield make
+    for process in created:
+        process.shutdown(1000)
+
+
+def test_scan_runs_in_a_long_lived_helper(make_process) -> None:
+    process = make_process(_listing)
+
+    assert process.scan() == (["job-a", "job-b"], ["printed-a"])
+    pid = process.pid
+    assert pid is not None and pid != os.getpid()
+    assert process.scan(concurrent=True) == (["job-a", "job-b"], [])
+    assert process.pid == pid  # reused, not restarted
+
+
+def test_unchanged_result_is_served_from_the_local_copy(make_process) -> None:
+    process = make_process(_listing)
+
+    first = process.scan()
+    second = process.scan()
+
+    assert second is first  # only the digest crossed the pipe
+
+
+def test_hung_helper_is_killed_and_last_good_kept(tmp_path, make_process) -> None:
+    marker = tmp_path / "hang"
+    process = make_process(
+        functools.partial(_hang_while_marked, str(marker)), deadline_s=20.0
+    )
+    assert process.scan() == (["recovered"], [])
+    good = process.last_good
+    hung_pid = process.pid
+
+    marker.write_text("")
+    started = time.monotonic()
+    with pytest.raises(ScanTimeout):
+        process.scan(deadline_s=0.5)
+    assert time.monotonic() - started < 5
+    assert process.last_good is good
+    assert process.restarts == 1
+    assert process.pid != hung_pid
+
+    marker.unlink()
+    assert process.scan() == (["recovered"], [])
+
+
+def test_scan_errors_are_reported_without_a_restart(make_process) -> None:
+    process = make_process(_broken)
+
+    with pytest.raises(ScanHelperError, match="S: drive unplugged"):
+        process.scan()
+    assert process.restarts == 0
+
+
+def test_dead_helper_is_replaced(make_process) -> None:
+    process = make_process(_crash)
+
+    with pytest.raises(ScanHelperError):
+        process.scan()
+    assert process.restarts == 1
+    assert process.pid is not None
+
+
+def test_helper_task_counts_each_scan(tmp_path, make_process) -> None:
+    counter = tmp_path / "count"
+    process = make_process(functools.partial(_counting, str(counter)))
+    task = HelperScanTask(process)
+
+    assert task.run(CancelToken(), lambda *a: None) == (["scan 1"], [])
+    assert task.run(CancelToken(), lambda *a: None) == (["scan 2"], [])
@@ -0,0 +1,72 @@
+"""Tests for source/sequence_plan.py."""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("PyQt5.QtCore")
+
+import print_sequencer  # noqa: E402
+from sequence_plan import PlanPrefetchThread, SequencePlanCache  # noqa: E402
+
+FILES = tuple(
+    [f"/j/JOB_WHMR_{n:04d}.ljd" for n in range(1, 40)]
+    + [f"/j/JOB_OAK_{n:04d}.ljd" for n in range(1, 12)]
+    + ["/j/stray.ljd"]
+)
+
+
+def test_results_match_the_sequencer() -> None:
+    cache = SequencePlanCache()
+    assert cache.materials(FILES, ("OAK",)) == (
+        print_sequencer.detect_materials_in_job(FILES, ("OAK",))
+    )
+    for reverse in (True, False):
+        assert cache.sequence("JOB", FILES, ("OAK",), reverse, True) == (
+            print_sequencer.build_print_sequence(
+                "JOB", FILES, ("OAK",), reverse, True
+            )
+        )
+
+
+def test_filenames_are_parsed_once_per_file_tuple(monkeypatch) -> None:
+    calls: list[str] = []
+    original = print_sequencer.parse_ljd_filenames
+
+    def counting(names):
+        calls.extend(names)
+        return original(names)
+
+    monkeypatch.setattr(print_sequencer, "parse_ljd_filenames", counting)
+    cache = SequencePlanCache()
+    cache.materials(FILES, ("WHMR",))
+    cache.sequence("JOB", FILES, ("OAK", "WHMR"))
+    cache.sequence("JOB", list(FILES), ("WHMR",), reverse_within=False)
+    assert len(calls) == len(FILES)
+    assert cache.misses == 1 and cache.hits == 2
+
+    # A changed file list is a different plan.
+    cache.materials(FILES[:-1], ("WHMR",))
+    assert len(calls) == 2 * len(FILES) - 1
+
+
+def test_cached_sequences_are_shared_immutable_views() -> None:
+    cache = SequencePlanCache()
+    first = cache.sequence("JOB", FILES)
+    assert cache.sequence("JOB", FILES) is first
+    assert not hasattr(first, "clear") and not hasattr(first, "append")
+
+
+def test_lru_evicts_oldest_plan() -> None:
+    cache = SequencePlanCache(maxsize=1)
+    cache.groups(FILES)
+    cache.groups(FILES[:1])
+    cache.groups(FILES)
+    assert cache.misses == 3
+
+
+def test_prefetch_thread_fills_the_cache() -> None:
+    cache = SequencePlanCache()
+    PlanPrefetchThread(FILES, ("WHMR",), cache=cache).run()
+    cache.materials(FILES, ("WHMR",))
+    assert cache.misses == 1 and cache.hits == 1
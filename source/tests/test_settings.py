@@ -29,6 +29,17 @@ def test_default_settings():
     assert defaults.auto_mark_printed is False
     assert defaults.status_poll_interval_ms == 10000
     assert defaults.zebra_printer_name == ""
+    assert defaults.verify_usb_copy is False
+    assert defaults.adaptive_pacing is False
+    assert defaults.stored_separator_format is False
+    assert defaults.print_farm_enabled is False
+    assert defaults.printer_change_notifications is False
+    assert defaults.concurrent_job_scan is False
+    assert defaults.isolated_job_scan is False
+    assert defaults.adaptive_refresh is False
+    assert defaults.shared_job_index is False
+    assert defaults.usb_sync_mode is False
+    assert defaults.usb_remove_stale_nc is False
 
 
 def test_frozen_dataclass():
@@ -473,3 +473,14 @@ def test_font_size_nonpreset_value_shown_as_custom(qtbot, monkeypatch) -> None:
     assert dlg.font_size_combo.currentData() == 11
     assert "Custom" in dlg.font_size_combo.currentText()
     assert dlg._collect_settings().ui_font_size == 11
+
+
+def test_verify_usb_copy_collected_into_settings(qtbot, monkeypatch) -> None:
+    monkeypatch.setattr("settings_dialog.save_settings", lambda *a, **k: None)
+    dlg = SettingsDialog(AppSettings())
+    qtbot.addWidget(dlg)
+
+    assert dlg.verify_usb_copy_checkbox.isChecked() is False
+    dlg.verify_usb_copy_checkbox.setChecked(True)
+
+    assert dlg._collect_settings().verify_usb_copy is True
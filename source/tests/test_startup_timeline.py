@@ -0,0 +1,62 @@
+"""Tests for ``source/startup_timeline.py``."""
+
+from __future__ import annotations
+
+import logging
+
+from startup_timeline import StartupTimeline
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 10.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_marks_are_relative_to_creation_and_keep_the_first() -> None:
+    clock = _Clock()
+    timeline = StartupTimeline(clock=clock)
+    clock.now = 10.120
+    timeline.mark("imports")
+    clock.now = 10.155
+    timeline.mark("ui")
+    clock.now = 10.500
+    timeline.mark("imports")
+
+    assert round(timeline.elapsed_ms("imports")) == 120
+    assert timeline.elapsed_ms("first scan") is None
+    assert timeline.summary() == "imports 120 ms, ui +35 ms"
+
+
+def test_reports_once_when_paint_and_scan_are_both_in(caplog) -> None:
+    clock = _Clock()
+    timeline = StartupTimeline(clock=clock)
+    caplog.set_level(logging.INFO, logger="startup_timeline")
+
+    clock.now = 10.2
+    timeline.mark("first paint")
+    assert not timeline.reported
+    clock.now = 10.9
+    timeline.mark("first scan")
+    timeline.mark("later")
+
+    assert timeline.reported
+    lines = [r.getMessage() for r in caplog.records]
+    assert lines == ["Startup: first paint 200 ms, first scan +700 ms"]
+
+
+def test_warns_when_first_paint_misses_the_budget(caplog) -> None:
+    clock = _Clock()
+    timeline = StartupTimeline(clock=clock)
+    caplog.set_level(logging.INFO, logger="startup_timeline")
+
+    clock.now = 10.45
+    timeline.mark("first scan")
+    timeline.mark("first paint")
+
+    warnings = [r for r in caplog.records if r.levelno == logging.WARNING]
+    assert [r.getMessage() for r in warnings] == [
+        "First paint took 450 ms (budget 300 ms)"
+    ]
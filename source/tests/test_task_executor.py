@@ -0,0 +1,128 @@
+"""Tests for ``source/task_executor.py``."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+pytest.importorskip("PyQt5.QtWidgets")
+pytest.importorskip("pytestqt")
+
+from task_executor import (  # noqa: E402
+    CallableTask,
+    Task,
+    TaskExecutor,
+)
+
+
+@pytest.fixture
+def executor(qtbot):
+    pool = TaskExecutor(max_workers=2)
+    yield pool
+    pool.shutdown(2000)
+
+
+class _ThreadTask(Task):
+    name = "thread probe"
+
+    def run(self, token, progress):
+        progress(1, 2, "half")
+        return threading.get_ident()
+
+
+def test_result_and_progress_arrive_on_the_gui_thread(qtbot, executor) -> None:
+    got: dict[str, list] = {"result": [], "progress": [], "thread": []}
+
+    def on_result(ident):
+        got["result"].append(ident)
+        got["thread"].append(threading.get_ident())
+
+    handle = executor.submit(
+        _ThreadTask(),
+        on_result=on_result,
+        on_progress=lambda *a: got["progress"].append(a),
+    )
+    qtbot.waitUntil(lambda: bool(got["result"]), timeout=2000)
+
+    assert handle.done()
+    assert got["result"][0] != threading.get_ident()  # ran on a worker
+    assert got["thread"] == [threading.get_ident()]  # delivered here
+    assert got["progress"] == [(1, 2, "half")]
+
+
+def test_errors_go_to_the_error_callback(qtbot, executor) -> None:
+    errors: list[BaseException] = []
+
+    def boom():
+        raise OSError("S: drive unplugged")
+
+    handle = executor.submit(CallableTask(boom), on_error=errors.append)
+    qtbot.waitUntil(lambda: bool(errors), timeout=2000)
+    assert str(errors[0]) == "S: drive unplugged"
+    assert handle.error is errors[0]
+
+
+def test_workers_persist_across_tasks(qtbot, executor) -> None:
+    idents: list[int] = []
+    for _ in range(20):
+        executor.submit(_ThreadTask(), on_result=idents.append)
+    qtbot.waitUntil(lambda: len(idents) == 20, timeout=2000)
+    assert len(set(idents)) <= executor.max_workers
+
+
+def test_key_refuses_a_second_task_until_the_first_finishes(
+    qtbot, executor
+) -> None:
+    release = threading.Event()
+    results: list[str] = []
+
+    first = executor.submit(
+        CallableTask(lambda: release.wait(2) and "first"),
+        key="scan",
+        on_result=results.append,
+    )
+    assert first is not None
+    assert executor.is_running("scan")
+    assert executor.submit(CallableTask(lambda: "second"), key="scan") is None
+
+    # The key is free by the time the result is delivered, so the receiver
+    # can start the next run straight from its callback.
+    resubmitted: list[bool] = []
+    first.discard()
+    first._on_result = lambda _r: resubmitted.append(
+        executor.submit(CallableTask(lambda: "next"), key="scan") is not None
+    )
+    release.set()
+    qtbot.waitUntil(lambda: bool(resubmitted), timeout=2000)
+    assert resubmitted == [True]
+
+
+def test_cancelled_tasks_deliver_nothing(qtbot, executor) -> None:
+    delivered: list = []
+
+    class Cooperative(Task):
+        def run(self, token, progress):
+            while True:
+                token.raise_if_cancelled()
+
+    handle = executor.submit(
+        Cooperative(), on_result=delivered.append, on_error=delivered.append
+    )
+    handle.cancel()
+    assert handle.wait(2000)
+    qtbot.wait(50)
+    assert delivered == []
+
+
+def test_shutdown_cancels_queued_tasks(qtbot) -> None:
+    pool = TaskExecutor(max_workers=1)
+    release = threading.Event()
+    running = pool.submit(CallableTask(lambda: release.wait(2)))
+    queued = pool.submit(CallableTask(lambda: "never"))
+    release.set()
+    pool.shutdown(2000)
+    assert running.wait(0)
+    assert queued.done() and (queued.token.cancelled or queued.result)
+    with pytest.raises(RuntimeError):
+        pool.submit(CallableTask(lambda: None))
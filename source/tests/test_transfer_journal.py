@@ -0,0 +1,350 @@
+"""Tests for source/transfer_journal.py and the resumable FileTransferThread.
+
+Interruptions are simulated with a file-like source that raises partway
+through a read, standing in for the S: share dropping mid-copy.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+
+import pytest
+
+import transfer_journal
+from transfer_journal import (
+    PARTIAL_SUFFIX,
+    TransferJournal,
+    copy_resumable,
+    source_identity,
+)
+
+
+class _FlakySource(io.BytesIO):
+    """Serves the real file's bytes, then fails after ``fail_after`` bytes."""
+
+    def __init__(self, data: bytes, fail_after: int) -> None:
+        super().__init__(data)
+        self._fail_after = fail_after
+        self.seeks: list[int] = []
+
+    def seek(self, offset, whence=0):  # noqa: D102 - io override
+        self.seeks.append(offset)
+        return super().seek(offset, whence)
+
+    def read(self, size=-1):  # noqa: D102 - io override
+        if self.tell() >= self._fail_after and self.tell() < len(
+            self.getvalue()
+        ):
+            raise OSError(64, "The specified network name is no longer available")
+        size = min(size, self._fail_after - self.tell())
+        return super().read(size)
+
+
+def _flaky_opener(fail_after: int, sources: list):
+    def opener(path, mode="rb"):
+        with open(path, "rb") as fh:
+            source = _FlakySource(fh.read(), fail_after)
+        sources.append(source)
+        return source
+
+    return opener
+
+
+@pytest.fixture()
+def journal(tmp_path) -> TransferJournal:
+    return TransferJournal(journal_dir=str(tmp_path / "state"))
+
+
+# ---------------------------------------------------------------------------
+# TransferJournal
+# ---------------------------------------------------------------------------
+
+
+def test_complete_file_is_remembered(journal, tmp_path) -> None:
+    src = tmp_path / "a.mdb"
+    src.write_bytes(b"data")
+    identity = source_identity(str(src))
+
+    journal.mark_complete("JOB", "C:/dest", str(src), identity)
+
+    assert journal.is_complete("JOB", "C:/dest", str(src), identity)
+    assert len(journal.completed_files("JOB", "C:/dest")) == 1
+    # Keyed per destination and per job.
+    assert not journal.is_complete("JOB", "D:/other", str(src), identity)
+    assert not journal.is_complete("OTHER", "C:/dest", str(src), identity)
+
+
+def test_changed_source_is_not_complete(journal) -> None:
+    journal.mark_complete("JOB", "dest", "src", (100, 1000.0))
+
+    assert not journal.is_complete("JOB", "dest", "src", (101, 1000.0))
+    assert not journal.is_complete("JOB", "dest", "src", (100, 1010.0))
+
+
+def test_journal_survives_a_new_instance(journal, tmp_path) -> None:
+    journal.mark_partial("JOB", "dest", "src", (10, 5.0))
+
+    reopened = TransferJournal(journal_dir=str(tmp_path / "state"))
+
+    assert reopened.can_resume_partial("JOB", "dest", "src", (10, 5.0))
+
+
+def test_complete_clears_partial_and_clear_forgets_job(journal) -> None:
+    journal.mark_partial("JOB", "dest", "src", (10, 5.0))
+    journal.mark_complete("JOB", "dest", "src", (10, 5.0))
+    assert not journal.can_resume_partial("JOB", "dest", "src", (10, 5.0))
+
+    journal.clear("JOB", "dest")
+
+    assert journal.completed_files("JOB", "dest") == {}
+
+
+def test_corrupt_journal_reads_as_empty(journal, tmp_path) -> None:
+    (tmp_path / "state" / "transfer_journal.json").write_text("{not json")
+    assert journal.completed_files("JOB", "dest") == {}
+
+
+# ---------------------------------------------------------------------------
+# copy_resumable
+# ---------------------------------------------------------------------------
+
+
+def test_interrupted_copy_resumes_from_partial_offset(tmp_path) -> None:
+    data = os.urandom(10_000)
+    src = tmp_path / "big.mdb"
+    src.write_bytes(data)
+    dest = tmp_path / "out.mdb"
+    sources: list[_FlakySource] = []
+
+    with pytest.raises(OSError):
+        copy_resumable(
+            str(src), str(dest), resume=False,
+            opener=_flaky_opener(6_000, sources), chunk_size=1_000,
+        )
+
+    # Nothing half-written at the real destination; the partial holds
+    # exactly what was read before the failure.
+    assert not dest.exists()
+    partial = tmp_path / ("out.mdb" + PARTIAL_SUFFIX)
+    assert partial.read_bytes() == data[:6_000]
+
+    offset = copy_resumable(str(src), str(dest), resume=True, chunk_size=1_000)
+
+    assert offset == 6_000
+    assert dest.read_bytes() == data
+    assert not partial.exists()
+
+
+def test_resume_seeks_the_source_instead_of_rereading(tmp_path) -> None:
+    data = os.urandom(4_000)
+    src = tmp_path / "big.mdb"
+    src.write_bytes(data)
+    dest = tmp_path / "out.mdb"
+    (tmp_path / ("out.mdb" + PARTIAL_SUFFIX)).write_bytes(data[:3_000])
+    sources: list[_FlakySource] = []
+
+    copy_resumable(
+        str(src), str(dest), resume=True,
+        opener=_flaky_opener(len(data), sources), chunk_size=500,
+    )
+
+    assert sources[0].seeks == [3_000]
+    assert dest.read_bytes() == data
+
+
+def test_no_resume_overwrites_stale_partial(tmp_path) -> None:
+    src = tmp_path / "a.mdb"
+    src.write_bytes(b"fresh contents")
+    dest = tmp_path / "out.mdb"
+    (tmp_path / ("out.mdb" + PARTIAL_SUFFIX)).write_bytes(b"stale junk")
+
+    offset = copy_resumable(str(src), str(dest), resume=False)
+
+    assert offset == 0
+    assert dest.read_bytes() == b"fresh contents"
+
+
+# ---------------------------------------------------------------------------
+# FileTransferThread with a journal
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture()
+def _qapp():
+    pytest.importorskip("PyQt5.QtWidgets")
+    from PyQt5.QtWidgets import QApplication
+
+    app = QApplication.instance() or QApplication([])
+    yield app
+
+
+def _run_transfer(tmp_path, mdb, wmf, journal):
+    from file_transfer import FileTransferThread
+
+    thread = FileTransferThread(
+        mdb_files=mdb,
+        wmf_files=wmf,
+        dest_base=str(tmp_path / "CADCode"),
+        journal=journal,
+        job_key="JOB",
+    )
+    finished: list[tuple] = []
+    copies: list[str] = []
+    original = thread._copy_file
+    thread._copy_file = lambda src, dest, **kw: (  # type: ignore[method-assign]
+        copies.append(os.path.basename(src)), original(src, dest, **kw)
+    )
+    thread.finished.connect(lambda *a: finished.append(a))
+    thread.run()
+    return finished, copies
+
+
+def test_transfer_resumes_staging_after_failure(
+    _qapp, journal, tmp_path
+) -> None:
+    src_dir = tmp_path / "src"
+    src_dir.mkdir()
+    mdb = []
+    for name in ("a.mdb", "b.mdb", "c.mdb"):
+        (src_dir / name).write_text(f"mdb:{name}")
+        mdb.append(str(src_dir / name))
+    missing = src_dir / "c.mdb"
+    saved = missing.read_text()
+    missing.unlink()  # the share "drops" before the third file
+
+    finished, copies = _run_transfer(tmp_path, tuple(mdb), (), journal)
+    assert finished[0][0] is False
+    assert copies == ["a.mdb", "b.mdb", "c.mdb"]
+
+    missing.write_text(saved)  # share is back
+    finished, copies = _run_transfer(tmp_path, tuple(mdb), (), journal)
+
+    assert finished[0][0] is True
+    assert copies == ["c.mdb"]  # a and b were not pulled again
+    label_dir = tmp_path / "CADCode" / "Label Data"
+    # No staging folder left behind once the commit has happened.
+    assert sorted(p.name for p in label_dir.iterdir()) == [
+        "a.mdb", "b.mdb", "c.mdb",
+    ]
+    # Success clears the journal for this job.
+    assert journal._read_all()["transfers"] == {}
+
+
+def test_large_pix_file_resumes_from_partial(
+    _qapp, journal, tmp_path, monkeypatch
+) -> None:
+    monkeypatch.setattr("file_transfer.RESUME_MIN_BYTES", 1_000)
+    src_dir = tmp_path / "src"
+    src_dir.mkdir()
+    (src_dir / "a.mdb").write_text("mdb")
+    big = src_dir / "big.wmf"
+    data = os.urandom(5_000)
+    big.write_bytes(data)
+
+    pix_dir = tmp_path / "CADCode" / "Pix"
+    pix_dir.mkdir(parents=True)
+    # An earlier run got 2 000 bytes in before the app was closed.
+    (pix_dir / ("big.wmf" + PARTIAL_SUFFIX)).write_bytes(data[:2_000])
+    journal.mark_partial(
+        "JOB", str(pix_dir), str(big), source_identity(str(big))
+    )
+
+    resumed: list[int] = []
+    original = transfer_journal.copy_resumable
+    monkeypatch.setattr(
+        "file_transfer.copy_resumable",
+        lambda *a, **k: (resumed.append(original(*a, **k)), resumed[-1])[1],
+    )
+
+    finished, _ = _run_transfer(
+        tmp_path, (str(src_dir / "a.mdb"),), (str(big),), journal
+    )
+
+    assert finished[0][0] is True
+    assert resumed == [2_000]
+    assert (pix_dir / "big.wmf").read_bytes() == data
+
+
+def test_commit_discards_stale_and_partial_staged_files(
+    _qapp, journal, tmp_path
+) -> None:
+    import hashlib
+
+    src_dir = tmp_path / "src"
+    src_dir.mkdir()
+    (src_dir / "a.mdb").write_text("mdb:a")
+    label_dir = tmp_path / "CADCode" / "Label Data"
+    digest = hashlib.sha1(b"JOB").hexdigest()[:12]
+    staging = label_dir / f".staging_resume_{digest}"
+    staging.mkdir(parents=True)
+    # Left by an earlier attempt when the job still listed old.mdb, plus an
+    # abandoned chunked copy.
+    (staging / "old.mdb").write_text("stale")
+    (staging / ("big.mdb" + PARTIAL_SUFFIX)).write_text("half")
+
+    finished, _ = _run_transfer(
+        tmp_path, (str(src_dir / "a.mdb"),), (), journal
+    )
+
+    assert finished[0][0] is True
+    assert sorted(p.name for p in label_dir.iterdir()) == ["a.mdb"]
+
+
+def test_journal_write_failure_does_not_fail_transfer(
+    _qapp, journal, tmp_path, monkeypatch
+) -> None:
+    src_dir = tmp_path / "src"
+    src_dir.mkdir()
+    mdb = []
+    for name in ("a.mdb", "b.mdb"):
+        (src_dir / name).write_text(name)
+        mdb.append(str(src_dir / name))
+
+    def disk_full(*args, **kwargs):
+        raise OSError(28, "No space left on device")
+
+    monkeypatch.setattr(journal, "mark_complete", disk_full)
+
+    finished, copies = _run_transfer(tmp_path, tuple(mdb), (), journal)
+
+    assert finished[0][0] is True
+    assert copies == ["a.mdb", "b.mdb"]
+    label_dir = tmp_path / "CADCode" / "Label Data"
+    assert sorted(p.name for p in label_dir.iterdir()) == ["a.mdb", "b.mdb"]
+
+
+def test_journal_is_read_once_and_small_pix_files_are_not_journaled(
+    _qapp, journal, tmp_path, monkeypatch
+) -> None:
+    src_dir = tmp_path / "src"
+    src_dir.mkdir()
+    mdb = []
+    for name in ("a.mdb", "b.mdb", "c.mdb"):
+        (src_dir / name).write_text(name)
+        mdb.append(str(src_dir / name))
+    wmf = []
+    for index in range(5):
+        path = src_dir / f"img{index}.wmf"
+        path.write_bytes(b"w" * 10)
+        wmf.append(str(path))
+
+    snapshots: list[str] = []
+    completes: list[str] = []
+    real_snapshot = journal.completed_files
+    real_complete = journal.mark_complete
+    monkeypatch.setattr(
+        journal, "completed_files",
+        lambda *a: (snapshots.append(a[1]), real_snapshot(*a))[1],
+    )
+    monkeypatch.setattr(
+        journal, "mark_complete",
+        lambda *a: (completes.append(os.path.basename(a[2])),
+                    real_complete(*a))[1],
+    )
+
+    finished, _ = _run_transfer(tmp_path, tuple(mdb), tuple(wmf), journal)
+
+    assert finished[0][0] is True
+    assert len(snapshots) == 1
+    assert completes == ["a.mdb", "b.mdb", "c.mdb"]
@@ -1,18 +1,26 @@
 """Tests for source/usb_transfer.py.
 
 Pins the duplicate-basename hard stop (a silent overwrite would send the
-wrong program to the CNC machine) and per-file failure reporting.
+wrong program to the CNC machine), per-file failure reporting, and the
+read-ahead pipeline keeping each file's bytes to itself.
 """
 
 from __future__ import annotations
 
 import os
+import threading
 
 import pytest
 
 pytest.importorskip("PyQt5.QtWidgets")
 
-from usb_transfer import USBTransferThread, find_duplicate_basenames  # noqa: E402
+import usb_transfer  # noqa: E402
+from usb_transfer import (  # noqa: E402
+    USBTransferThread,
+    collect_sizes,
+    find_duplicate_basenames,
+    verify_copy,
+)
 
 
 @pytest.fixture()
@@ -127,3 +135,284 @@ def test_cancel_reports_progress(_qapp, tmp_path) -> None:
     assert success is False
     assert "Cancelled" in message
     assert "copied 1 of 2" in message
+
+
+# ---------------------------------------------------------------------------
+# Pipelined copy
+# ---------------------------------------------------------------------------
+
+
+def test_collect_sizes_lists_each_folder_once(tmp_path) -> None:
+    nc = _make_nc(tmp_path, ["a/one.nc", "a/two.nc", "b/three.nc"])
+    missing = str(tmp_path / "src" / "a" / "gone.nc")
+
+    sizes = collect_sizes(nc + (missing,))
+
+    assert sizes == {p: os.path.getsize(p) for p in nc}
+
+
+def test_multi_chunk_files_copy_intact_through_small_queue(
+    _qapp, tmp_path, monkeypatch
+) -> None:
+    monkeypatch.setattr(usb_transfer, "_CHUNK_BYTES", 1_000)
+    monkeypatch.setattr(usb_transfer, "_READ_AHEAD_CHUNKS", 2)
+    src = tmp_path / "src"
+    src.mkdir()
+    payloads = {f"p{i}.nc": os.urandom(7_500 + i) for i in range(4)}
+    for name, data in payloads.items():
+        (src / name).write_bytes(data)
+    (src / "empty.nc").write_bytes(b"")
+    nc = tuple(str(src / name) for name in [*payloads, "empty.nc"])
+
+    target, finished = _run(tmp_path, nc)
+
+    assert finished[0][0] is True
+    for name, data in payloads.items():
+        assert (target / name).read_bytes() == data
+    assert (target / "empty.nc").read_bytes() == b""
+
+
+def test_write_failure_does_not_leak_into_next_file(
+    _qapp, tmp_path, monkeypatch
+) -> None:
+    monkeypatch.setattr(usb_transfer, "_CHUNK_BYTES", 100)
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "bad.nc").write_bytes(b"x" * 1_000)
+    (src / "good.nc").write_bytes(b"g" * 250)
+    nc = (str(src / "bad.nc"), str(src / "good.nc"))
+
+    real_open = open
+
+    class _FailingWriter:
+        def __init__(self, fh):
+            self._fh = fh
+
+        def write(self, data):
+            raise OSError(28, "No space left on device")
+
+        def close(self):
+            self._fh.close()
+
+    def fake_open(path, mode="r", *args, **kwargs):
+        fh = real_open(path, mode, *args, **kwargs)
+        if str(path).endswith("bad.nc") and "w" in mode:
+            return _FailingWriter(fh)
+        return fh
+
+    monkeypatch.setattr("builtins.open", fake_open)
+
+    target, finished = _run(tmp_path, nc)
+
+    success, message = finished[0]
+    assert success is False
+    assert "bad.nc" in message
+    assert "Copied 1 of 2" in message
+    assert [p.name for p in target.iterdir()] == ["good.nc"]
+    assert (target / "good.nc").read_bytes() == b"g" * 250
+
+
+def test_files_are_flushed_once_at_the_end(
+    _qapp, tmp_path, monkeypatch
+) -> None:
+    nc = _make_nc(tmp_path, ["one.nc", "two.nc", "three.nc"])
+    synced: list[int] = []
+    monkeypatch.setattr(usb_transfer.os, "fsync", synced.append)
+    progress: list[str] = []
+    target = tmp_path / "usb"
+    target.mkdir()
+    thread = USBTransferThread(nc_files=nc, target_drive=str(target))
+    thread.progress.connect(
+        lambda text: progress.append(f"{text}|{len(synced)}")
+    )
+    thread.run()
+
+    assert len(synced) == 3
+    # No file was flushed before the last one had been written.
+    assert progress[-1].startswith("Flushing") and progress[-1].endswith("|0")
+
+
+def test_cancel_releases_a_reader_blocked_on_a_full_queue(
+    _qapp, tmp_path, monkeypatch
+) -> None:
+    monkeypatch.setattr(usb_transfer, "_CHUNK_BYTES", 10)
+    monkeypatch.setattr(usb_transfer, "_READ_AHEAD_CHUNKS", 1)
+    src = tmp_path / "src"
+    src.mkdir()
+    nc = []
+    for i in range(3):
+        (src / f"{i}.nc").write_bytes(b"z" * 500)
+        nc.append(str(src / f"{i}.nc"))
+    target = tmp_path / "usb"
+    target.mkdir()
+    thread = USBTransferThread(nc_files=tuple(nc), target_drive=str(target))
+    thread.isInterruptionRequested = (  # type: ignore[method-assign]
+        lambda: True
+    )
+    finished: list[tuple] = []
+    thread.finished.connect(lambda *a: finished.append(a))
+
+    thread.run()
+
+    assert finished[0][0] is False
+    assert "Cancelled" in finished[0][1]
+    assert not any(t.name == "usb-read-ahead" for t in threading.enumerate())
+
+
+# ---------------------------------------------------------------------------
+# Verify mode
+# ---------------------------------------------------------------------------
+
+
+def _run_verified(tmp_path, nc_files):
+    target = tmp_path / "usb"
+    target.mkdir(exist_ok=True)
+    thread = USBTransferThread(
+        nc_files=nc_files, target_drive=str(target), verify=True
+    )
+    finished: list[tuple] = []
+    verified: list[tuple] = []
+    thread.finished.connect(lambda *a: finished.append(a))
+    thread.fileVerified.connect(lambda *a: verified.append(a))
+    return thread, target, finished, verified
+
+
+def test_verify_copy_checks_size_then_contents(tmp_path) -> None:
+    import hashlib
+
+    dest = tmp_path / "part.nc"
+    dest.write_bytes(b"G1 X10")
+    digest = hashlib.sha256(b"G1 X10").hexdigest()
+
+    assert verify_copy(dest, 6, digest) is None
+    assert "expected 9" in verify_copy(dest, 9, digest)
+    assert verify_copy(dest, 6, "0" * 64) == "contents differ from the source"
+
+
+def test_verified_copy_reports_every_file(_qapp, tmp_path) -> None:
+    nc = _make_nc(tmp_path, ["one.nc", "two.nc", "three.nc"])
+    thread, target, finished, verified = _run_verified(tmp_path, nc)
+
+    thread.run()
+
+    assert finished[0] == (True, f"Copied and verified 3 NC files to {target}")
+    assert sorted(name for name, ok, _ in verified if ok) == [
+        "one.nc", "three.nc", "two.nc",
+    ]
+
+
+def test_truncated_copy_is_reported_and_removed(
+    _qapp, tmp_path
+) -> None:
+    nc = _make_nc(tmp_path, ["good.nc", "short.nc"])
+    thread, target, finished, verified = _run_verified(tmp_path, nc)
+    original = thread._write_file
+
+    def truncating_write(reader, src, dest):
+        summary = original(reader, src, dest)
+        if dest.name == "short.nc":
+            with open(dest, "r+b") as fh:
+                fh.truncate(3)
+        return summary
+
+    thread._write_file = truncating_write  # type: ignore[method-assign]
+    thread.run()
+
+    success, message = finished[0]
+    assert success is False
+    assert "short.nc: verify failed" in message
+    assert "Copied 1 of 2" in message
+    assert ("short.nc", False) in [(n, ok) for n, ok, _ in verified]
+    assert [p.name for p in target.iterdir()] == ["good.nc"]
+
+
+# ---------------------------------------------------------------------------
+# Sync mode
+# ---------------------------------------------------------------------------
+
+
+def _run_sync(tmp_path, nc_files, remove_stale=False):
+    target = tmp_path / "usb"
+    target.mkdir(exist_ok=True)
+    thread = USBTransferThread(
+        nc_files=nc_files,
+        target_drive=str(target),
+        sync=True,
+        remove_stale=remove_stale,
+    )
+    finished: list[tuple] = []
+    thread.finished.connect(lambda *a: finished.append(a))
+    thread.run()
+    return target, finished
+
+
+def test_sync_skips_unchanged_and_replaces_changed(
+    _qapp, tmp_path, monkeypatch
+) -> None:
+    nc = _make_nc(tmp_path, ["same.nc", "edited.nc", "new.nc"])
+    target = tmp_path / "usb"
+    target.mkdir()
+    (target / "same.nc").write_text("nc:same.nc")
+    # Same size, different contents — only the hash can tell.
+    (target / "edited.nc").write_text("nc:EDITED.nc")
+    (tmp_path / "src" / "edited.nc").write_text("nc:edited!nc")
+    opened_for_write: list[str] = []
+    real_open = open
+
+    def spy_open(path, mode="r", *args, **kwargs):
+        if "w" in mode:
+            opened_for_write.append(os.path.basename(str(path)))
+        return real_open(path, mode, *args, **kwargs)
+
+    monkeypatch.setattr("builtins.open", spy_open)
+
+    target, finished = _run_sync(tmp_path, nc)
+
+    success, message = finished[0]
+    assert success is True
+    assert "2 written, 1 unchanged" in message
+    assert "same.nc.jmtmp" not in opened_for_write
+    assert "same.nc" not in opened_for_write
+    assert (target / "edited.nc").read_text() == "nc:edited!nc"
+    assert sorted(p.name for p in target.iterdir()) == [
+        "edited.nc", "new.nc", "same.nc",
+    ]
+
+
+def test_sync_removes_stale_nc_only_when_asked(_qapp, tmp_path) -> None:
+    nc = _make_nc(tmp_path, ["keep.nc"])
+    target = tmp_path / "usb"
+    target.mkdir()
+    (target / "OLDJOB.NC").write_text("old")
+    (target / "notes.txt").write_text("operator notes")
+    (target / "keep.nc.jmtmp").write_text("left by a pulled stick")
+
+    _, finished = _run_sync(tmp_path, nc)
+    assert (target / "OLDJOB.NC").exists()
+
+    _, finished = _run_sync(tmp_path, nc, remove_stale=True)
+
+    success, message = finished[0]
+    assert success is True
+    assert "0 written, 1 unchanged, 1 old removed" in message
+    assert sorted(p.name for p in target.iterdir()) == ["keep.nc", "notes.txt"]
+
+
+def test_failed_sync_write_keeps_the_old_copy(
+    _qapp, tmp_path, monkeypatch
+) -> None:
+    nc = _make_nc(tmp_path, ["part.nc"])
+    target = tmp_path / "usb"
+    target.mkdir()
+    (target / "part.nc").write_text("previous program")
+
+    def fail_replace(src, dst):
+        raise OSError(28, "No space left on device")
+
+    monkeypatch.setattr(usb_transfer.os, "replace", fail_replace)
+
+    _, finished = _run_sync(tmp_path, nc)
+
+    assert finished[0][0] is False
+    assert (target / "part.nc").read_text() == "previous program"
+    assert [p.name for p in target.iterdir()] == ["part.nc"]
@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
-
+import zpl_templates
 from zpl_templates import (
+    SEPARATOR_FORMAT_NAME,
+    ZplCache,
+    build_job_banner,
     build_job_separator,
+    build_separator_format,
+    build_separator_recall,
     build_test_separator,
+    cached_job_separator,
     sanitize_zpl_field,
 )
 
@@ -126,3 +132,73 @@ def test_job_separator_handles_caret_in_material():
     assert result.startswith(b"^XA")
     assert b"WH MR" in result
     assert b"WH^MR" not in result
+
+
+# ---------------------------------------------------------------------------
+# ZplCache and stored formats
+# ---------------------------------------------------------------------------
+
+
+def test_cache_builds_once_and_evicts_least_recently_used():
+    cache = ZplCache(maxsize=2)
+    built: list[str] = []
+
+    def get(name):
+        return cache.get(
+            "t", (name,), 203, lambda: built.append(name) or name.encode()
+        )
+
+    get("a"), get("b"), get("a")  # "a" is now most recent
+    get("c")  # evicts "b"
+    get("a"), get("b")
+
+    assert built == ["a", "b", "c", "b"]
+    assert len(cache) == 2
+
+
+def test_cache_key_includes_dpi():
+    cache = ZplCache()
+    first = cache.get(
+        "sep", ("J", "M"), 203, lambda: build_job_separator("J", "M", 203)
+    )
+    second = cache.get(
+        "sep", ("J", "M"), 300, lambda: build_job_separator("J", "M", 300)
+    )
+    assert first != second
+    assert b"^FO40,110" in first
+    assert b"^FO59,163" in second
+
+
+def test_cached_separator_matches_uncached():
+    expected = build_job_separator("JOB", "WHMR")
+    assert cached_job_separator("JOB", "WHMR") == expected
+
+
+def test_stored_format_and_recall_share_a_name():
+    fmt = build_separator_format()
+    recall = build_separator_recall("JOB ^1", "WHMR")
+
+    assert f"^DF{SEPARATOR_FORMAT_NAME}".encode() in fmt
+    assert b"^FN1^FS" in fmt and b"^FN2^FS" in fmt
+    assert f"^XF{SEPARATOR_FORMAT_NAME}".encode() in recall
+    assert b"^FN1^FDJOB  1^FS" in recall
+    assert len(recall) < len(build_job_separator("JOB ^1", "WHMR")) + 20
+
+
+def test_job_banner_names_the_job_and_differs_from_separator() -> None:
+    banner = build_job_banner("KITCHEN^1")
+    assert banner.startswith(b"^XA") and banner.rstrip().endswith(b"^XZ")
+    assert b"JOB START" in banner
+    assert b"^FDKITCHEN 1^FS" in banner
+    assert banner != build_job_separator("KITCHEN 1", "")
+
+
+def test_job_banner_cache_hit_skips_formatting(monkeypatch) -> None:
+    first = build_job_banner("BANNER CACHE JOB")
+    sanitized: list[str] = []
+    monkeypatch.setattr(
+        zpl_templates, "sanitize_zpl_field", lambda v: sanitized.append(v) or v
+    )
+
+    assert build_job_banner("BANNER CACHE JOB") == first
+    assert sanitized == []
@@ -0,0 +1,242 @@
+"""Persistent transfer journal so an interrupted transfer can resume.
+
+If the S: share drops halfway through a transfer, or the app is closed, the
+next "Transfer Files" used to start from zero and re-pull every file over
+the network. The journal records, per job and destination, which source
+files have already landed, and large files are copied through a
+``.partial`` file that a later run appends to from the last byte written.
+
+State lives next to the history file at
+``~/.jobmanager/transfer_journal.json`` and is written atomically (temp
+file, then rename) after every staged label file and around each
+large-file copy. A source is only treated as "already done" — or its
+partial as safe to append to — while its (size, mtime) still matches what
+was journaled, so a file edited on S: between attempts is always copied
+afresh.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import shutil
+import tempfile
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_JOURNAL_DIR = os.path.join(os.path.expanduser("~"), ".jobmanager")
+
+#: Suffix of the in-progress copy of a large file.
+PARTIAL_SUFFIX = ".partial"
+
+#: Files smaller than this are copied in one go with ``shutil.copy2`` —
+#: re-pulling a small file costs less than the bookkeeping to resume it.
+RESUME_MIN_BYTES = 4 * 1024 * 1024
+
+_CHUNK_BYTES = 1024 * 1024
+
+#: (size, mtime) of a source file, as journaled.
+SourceIdentity = tuple[int, float]
+
+
+def source_identity(path: str) -> SourceIdentity:
+    """Return ``(size, mtime)`` for *path*. Raises ``OSError`` if missing."""
+    st = os.stat(path)
+    return (st.st_size, st.st_mtime)
+
+
+def copy_resumable(
+    src: str,
+    dest: str,
+    resume: bool,
+    opener: Callable = open,
+    chunk_size: int = _CHUNK_BYTES,
+) -> int:
+    """Copy *src* to *dest* through ``dest + PARTIAL_SUFFIX``.
+
+    With ``resume`` True an existing partial file is appended to, starting
+    at its current size; otherwise any stale partial is overwritten. Only
+    once every byte has arrived is the partial renamed over *dest*, so
+    *dest* never holds a truncated file. A failure mid-copy leaves the
+    partial in place for the next attempt and propagates the error.
+
+    ``opener`` opens the source and is injectable so tests can stand in a
+    source that fails partway. Returns the offset the copy resumed from.
+    """
+    partial = dest + PARTIAL_SUFFIX
+    offset = 0
+    if resume:
+        try:
+            offset = os.path.getsize(partial)
+        except OSError:
+            offset = 0
+
+    with opener(src, "rb") as fsrc:
+        if offset:
+            fsrc.seek(offset)
+        with open(partial, "ab" if offset else "wb") as fdst:
+            while True:
+                chunk = fsrc.read(chunk_size)
+                if not chunk:
+                    break
+                fdst.write(chunk)
+
+    shutil.copystat(src, partial)
+    os.replace(partial, dest)
+    return offset
+
+
+class TransferJournal:
+    """Records finished (and partially copied) files per job + destination.
+
+    Keys are the caller's job key (the job name) and the destination folder,
+    so the same job transferred to two places keeps separate progress.
+    """
+
+    def __init__(self, journal_dir: str | None = None) -> None:
+        self._dir = journal_dir or DEFAULT_JOURNAL_DIR
+        os.makedirs(self._dir, exist_ok=True)
+        self._path = os.path.join(self._dir, "transfer_journal.json")
+
+    # -- public API --------------------------------------------------
+
+    def is_complete(
+        self, job_key: str, dest: str, src: str, identity: SourceIdentity
+    ) -> bool:
+        """True if *src* finished earlier and has not changed since."""
+        return identity_matches(
+            self.completed_files(job_key, dest).get(src), identity
+        )
+
+    def completed_files(self, job_key: str, dest: str) -> dict:
+        """Snapshot of ``{src: [size, mtime]}`` finished for job + destination.
+
+        One read of the journal; a caller checking many files loads this
+        once and tests each against :func:`identity_matches`.
+        """
+        complete = self._entry(job_key, dest).get("complete", {})
+        return dict(complete) if isinstance(complete, dict) else {}
+
+    def can_resume_partial(
+        self, job_key: str, dest: str, src: str, identity: SourceIdentity
+    ) -> bool:
+        """True if a partial copy of *src* may be appended to."""
+        entry = self._entry(job_key, dest)
+        return identity_matches(entry.get("partial", {}).get(src), identity)
+
+    def mark_partial(
+        self, job_key: str, dest: str, src: str, identity: SourceIdentity
+    ) -> None:
+        """Record that a chunked copy of *src* has started."""
+        self._update(job_key, dest, "partial", src, identity)
+
+    def mark_complete(
+        self, job_key: str, dest: str, src: str, identity: SourceIdentity
+    ) -> None:
+        """Record that *src* has fully arrived at the destination."""
+        self._update(job_key, dest, "complete", src, identity)
+
+    def forget_partial(self, job_key: str, dest: str, src: str) -> None:
+        """Drop the partial record of *src* without marking it complete."""
+        entry = self._entry(job_key, dest)
+        if src not in entry.get("partial", {}):
+            return
+        data = self._read_all()
+        per_job = data["transfers"].get(job_key, {})
+        partial = {k: v for k, v in entry["partial"].items() if k != src}
+        transfers = {
+            **data["transfers"],
+            job_key: {**per_job, dest: {**entry, "partial": partial}},
+        }
+        self._write_all({**data, "transfers": transfers})
+
+    def clear(self, job_key: str, dest: str) -> None:
+        """Forget a job + destination — called once its transfer succeeds."""
+        data = self._read_all()
+        per_job = data["transfers"].get(job_key)
+        if not isinstance(per_job, dict) or dest not in per_job:
+            return
+        per_job = {k: v for k, v in per_job.items() if k != dest}
+        transfers = {**data["transfers"], job_key: per_job}
+        if not per_job:
+            del transfers[job_key]
+        self._write_all({**data, "transfers": transfers})
+
+    # -- internal helpers --------------------------------------------
+
+    def _entry(self, job_key: str, dest: str) -> dict:
+        per_job = self._read_all()["transfers"].get(job_key)
+        if not isinstance(per_job, dict):
+            return {}
+        entry = per_job.get(dest)
+        return entry if isinstance(entry, dict) else {}
+
+    def _update(
+        self,
+        job_key: str,
+        dest: str,
+        section: str,
+        src: str,
+        identity: SourceIdentity,
+    ) -> None:
+        data = self._read_all()
+        per_job = data["transfers"].get(job_key)
+        if not isinstance(per_job, dict):
+            per_job = {}
+        entry = self._entry(job_key, dest)
+        records = {**entry.get(section, {}), src: list(identity)}
+        entry = {**entry, section: records}
+        if section == "complete":
+            # A finished file no longer has a partial worth resuming.
+            entry["partial"] = {
+                k: v for k, v in entry.get("partial", {}).items() if k != src
+            }
+        transfers = {**data["transfers"], job_key: {**per_job, dest: entry}}
+        self._write_all({**data, "transfers": transfers})
+
+    def _read_all(self) -> dict:
+        """Load the journal, returning an empty structure on any error."""
+        try:
+            with open(self._path, "r", encoding="utf-8") as fh:
+                data = json.load(fh)
+        except FileNotFoundError:
+            return {"transfers": {}}
+        except (json.JSONDecodeError, OSError) as exc:
+            logger.warning("Failed to read transfer journal: %s", exc)
+            return {"transfers": {}}
+        if not isinstance(data, dict) or not isinstance(
+            data.get("transfers"), dict
+        ):
+            return {"transfers": {}}
+        return data
+
+    def _write_all(self, data: dict) -> None:
+        """Atomically write *data* to the journal file."""
+        fd, tmp_path = tempfile.mkstemp(
+            dir=self._dir, suffix=".tmp", prefix="transfer_journal_"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(data, fh, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, self._path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+
+def identity_matches(recorded, identity: SourceIdentity) -> bool:
+    """Compare a journaled ``[size, mtime]`` against a live identity.
+
+    Uses the same 2-second mtime tolerance as
+    :func:`transfer_common.files_identical`.
+    """
+    if not isinstance(recorded, list) or len(recorded) != 2:
+        return False
+    try:
+        size, mtime = int(recorded[0]), float(recorded[1])
+    except (TypeError, ValueError):
+        return False
+    return size == identity[0] and abs(mtime - identity[1]) < 2.0
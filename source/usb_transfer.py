@@ -1,9 +1,33 @@
-"""Worker thread for copying NC files to USB and USB drive detection."""
+"""Worker thread for copying NC files to USB and USB drive detection.
+
+The copy is pipelined. S: reads are quick but pay a network round trip per
+file, and USB sticks write slowly, so a reader thread pulls the sources into
+a bounded queue of chunks — starting while the free-space check runs — and
+the worker writes them to the stick with large sequential buffers. Memory
+stays capped at ``_READ_AHEAD_CHUNKS`` chunks whatever the job size, and the
+written files are flushed to the stick (``fsync``) in one pass at the end
+rather than once per file.
+
+With ``verify`` on, the reader also hashes each source as it streams past,
+and a verifier thread reads every written file back from the stick — while
+the next file is being written — and compares size, then hash. A truncated
+``.nc`` mills the wrong part, so a copy that fails verification is deleted
+from the stick and reported by name.
+
+With ``sync`` on, files the stick already holds with the same size and
+content hash are skipped, changed ones are written to a temp name and
+renamed over the old copy, and — with ``remove_stale`` too — ``.nc`` files
+left in the drive root by earlier jobs are deleted in the same pass.
+"""
 
 import ctypes
+import hashlib
 import logging
 import os
+import queue
 import shutil
+import tempfile
+import threading
 from collections import Counter
 from pathlib import Path
 
@@ -19,6 +43,21 @@ _DRIVE_REMOVABLE = 2
 # Safety buffer demanded on top of the summed NC file sizes.
 _FREE_SPACE_BUFFER_BYTES = 1024 * 1024
 
+# Read-ahead chunk size, and how many chunks may wait in memory for the
+# stick (bounds the pipeline at 16 MB).
+_CHUNK_BYTES = 1024 * 1024
+_READ_AHEAD_CHUNKS = 16
+
+# Write buffer for the stick: big sequential writes suit flash controllers.
+_WRITE_BUFFER_BYTES = 4 * 1024 * 1024
+
+# Sync mode: a source compared against the stick is held in memory up to
+# this size while its hash is computed, then spills to a temp file.
+_SPOOL_BYTES = 16 * 1024 * 1024
+
+# Suffix of a changed file being written in sync mode, before the rename.
+_TEMP_SUFFIX = ".jmtmp"
+
 
 def detect_usb_drives() -> list[str]:
     """Return drive letters of removable USB drives (e.g. ['E:', 'F:']).
@@ -54,31 +93,260 @@ def find_duplicate_basenames(paths: tuple[str, ...]) -> dict[str, list[str]]:
     return by_name
 
 
+def collect_sizes(paths: tuple[str, ...]) -> dict[str, int]:
+    """Return ``{path: size}`` using one directory listing per folder.
+
+    NC files sit in a handful of job subfolders, so listing each folder
+    once costs far fewer S: round trips than a ``getsize`` per file — on
+    Windows the listing already carries the sizes. Paths that are missing
+    are left out; the copy reports them per file.
+    """
+    wanted: dict[str, set[str]] = {}
+    for path in paths:
+        wanted.setdefault(os.path.dirname(path), set()).add(
+            os.path.basename(path)
+        )
+    sizes: dict[str, int] = {}
+    for folder, names in wanted.items():
+        try:
+            with os.scandir(folder or ".") as entries:
+                for entry in entries:
+                    if entry.name in names and entry.is_file():
+                        sizes[os.path.join(folder, entry.name)] = (
+                            entry.stat().st_size
+                        )
+        except OSError:
+            continue
+    return sizes
+
+
+def _drop_cached_pages(fd: int) -> None:
+    """Best effort: evict a file's cached pages so reads hit the device.
+
+    Without this the read-back would be served from the write cache and
+    prove nothing about the stick. Only POSIX offers a per-file call; on
+    Windows the fsync before it at least forces the data to the device.
+    """
+    fadvise = getattr(os, "posix_fadvise", None)
+    if fadvise is None:
+        return
+    try:
+        fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    except OSError:
+        pass
+
+
+def verify_copy(
+    dest: Path, expected_size: int, expected_digest: str
+) -> str | None:
+    """Read *dest* back and compare it with the source's size and hash.
+
+    Returns a description of the mismatch, or None when the copy is good.
+    The size is compared first — a truncated copy is the usual failure and
+    is caught without reading a byte.
+    """
+    try:
+        actual_size = os.stat(dest).st_size
+        if actual_size != expected_size:
+            return (
+                f"{actual_size} bytes on the USB drive, "
+                f"expected {expected_size}"
+            )
+        digest = hashlib.sha256()
+        with open(dest, "rb+") as fh:
+            os.fsync(fh.fileno())
+            _drop_cached_pages(fh.fileno())
+            while True:
+                chunk = fh.read(_CHUNK_BYTES)
+                if not chunk:
+                    break
+                digest.update(chunk)
+    except OSError as exc:
+        return f"could not read it back: {describe_failure(exc)}"
+    if digest.hexdigest() != expected_digest:
+        return "contents differ from the source"
+    return None
+
+
+def file_digest(path: Path) -> str:
+    """SHA-256 hex digest of *path*, read in ``_CHUNK_BYTES`` pieces."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        while True:
+            chunk = fh.read(_CHUNK_BYTES)
+            if not chunk:
+                return digest.hexdigest()
+            digest.update(chunk)
+
+
+# Messages passed from the reader to the writer: (kind, file index, payload).
+# An _END payload is the source's (size, sha256 hex) when hashing is on.
+_DATA = "data"
+_END = "end"
+_ERROR = "error"
+
+
+class _ReadAhead:
+    """Reads the sources, in order, into a bounded queue on its own thread."""
+
+    def __init__(
+        self, paths: tuple[str, ...], hash_sources: bool = False
+    ) -> None:
+        self._paths = paths
+        self._hash_sources = hash_sources
+        self._queue: queue.Queue = queue.Queue(maxsize=_READ_AHEAD_CHUNKS)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="usb-read-ahead", daemon=True
+        )
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop reading and release the reader (it may be blocked on put)."""
+        self._stop.set()
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+        self._thread.join(timeout=5)
+
+    def next_message(self) -> tuple:
+        return self._queue.get()
+
+    def _put(self, message: tuple) -> bool:
+        while not self._stop.is_set():
+            try:
+                self._queue.put(message, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _run(self) -> None:
+        for index, src in enumerate(self._paths):
+            if self._stop.is_set():
+                return
+            digest = hashlib.sha256() if self._hash_sources else None
+            size = 0
+            try:
+                with open(src, "rb") as fh:
+                    while True:
+                        chunk = fh.read(_CHUNK_BYTES)
+                        if not chunk:
+                            break
+                        size += len(chunk)
+                        if digest is not None:
+                            digest.update(chunk)
+                        if not self._put((_DATA, index, chunk)):
+                            return
+            except Exception as exc:  # noqa: BLE001 - handed to the writer
+                if not self._put((_ERROR, index, exc)):
+                    return
+                continue
+            summary = None
+            if digest is not None:
+                summary = (size, digest.hexdigest())
+            if not self._put((_END, index, summary)):
+                return
+
+
+class _SpoolReader:
+    """Replays a spooled file to :meth:`USBTransferThread._receive`."""
+
+    def __init__(self, spool, summary) -> None:
+        self._spool = spool
+        self._summary = summary
+
+    def next_message(self) -> tuple:
+        chunk = self._spool.read(_CHUNK_BYTES)
+        if chunk:
+            return (_DATA, 0, chunk)
+        return (_END, 0, self._summary)
+
+
+class _ReadBackVerifier:
+    """Verifies written files on its own thread, one behind the writer."""
+
+    def __init__(self) -> None:
+        self._queue: queue.Queue = queue.Queue()
+        self._results: queue.Queue = queue.Queue()
+        self._thread = threading.Thread(
+            target=self._run, name="usb-verify", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, dest: Path, size: int, digest: str) -> None:
+        self._queue.put((dest, size, digest))
+
+    def results(self, wait: bool = False) -> list[tuple[Path, str | None]]:
+        """Return the ``(dest, problem)`` results finished so far.
+
+        With ``wait`` True, first let every submitted file finish.
+        """
+        if wait:
+            self._queue.put(None)
+            self._thread.join()
+        done = []
+        while True:
+            try:
+                done.append(self._results.get_nowait())
+            except queue.Empty:
+                return done
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            dest, size, digest = item
+            self._results.put((dest, verify_copy(dest, size, digest)))
+
+
 class USBTransferThread(QThread):
     """Copies .nc files to the root of a USB drive."""
 
     progress = pyqtSignal(str)
     finished = pyqtSignal(bool, str)
 
-    def __init__(self, nc_files: tuple[str, ...], target_drive: str) -> None:
+    #: Per-file verify outcome: (file name, verified OK, detail).
+    fileVerified = pyqtSignal(str, bool, str)
+
+    def __init__(
+        self,
+        nc_files: tuple[str, ...],
+        target_drive: str,
+        verify: bool = False,
+        sync: bool = False,
+        remove_stale: bool = False,
+    ) -> None:
         super().__init__()
         self._nc_files = nc_files
-        self._target = Path(target_drive + "\\")
+        self._target = Path(target_drive + os.sep)
+        self._verify = verify
+        self._sync = sync
+        # Only meaningful when syncing: a plain copy never deletes anything.
+        self._remove_stale = sync and remove_stale
+        self._sizes: dict[str, int] = {}
 
-    def _check_free_space(self) -> str | None:
+    def _check_free_space(self, sizes: dict[str, int]) -> str | None:
         """Verify the stick can hold every NC file. Returns error or None.
 
-        The per-file ``getsize`` calls hit the S: share, which is exactly why
-        this runs on the worker thread rather than in the click handler.
+        Sources missing from *sizes* are not counted: the copy reports them
+        per-file with a friendlier message, so they don't block it here.
         """
-        required = 0
-        for src in self._nc_files:
-            try:
-                required += os.path.getsize(src)
-            except OSError:
-                # Missing/unreadable source: the copy loop will report it
-                # per-file with a friendlier message; don't block on it here.
-                continue
+        required = sum(sizes.values())
+        if self._sync:
+            # A file already on the stick is replaced (or kept), so only
+            # the growth needs free space.
+            for src, size in sizes.items():
+                try:
+                    on_stick = os.stat(self._target / Path(src).name).st_size
+                except OSError:
+                    continue
+                required -= min(size, on_stick)
 
         try:
             free = shutil.disk_usage(self._target).free
@@ -95,6 +363,151 @@ class USBTransferThread(QThread):
             )
         return None
 
+    def _receive(self, reader: _ReadAhead, sink) -> tuple[int, str] | None:
+        """Feed one file's chunks from *reader* to ``sink(chunk)``.
+
+        Returns the reader's ``(size, digest)`` summary of the source (None
+        unless it was hashing). Raises the reader's error, or the first
+        ``OSError`` from *sink* — but only after every message belonging to
+        this file has been taken off the queue, so the next file starts at
+        its own first chunk.
+        """
+        error: Exception | None = None
+        while True:
+            kind, _, payload = reader.next_message()
+            if kind == _ERROR:
+                error = error or payload
+                break
+            if kind == _END:
+                if error is None:
+                    return payload
+                break
+            if error is not None:
+                continue  # discard the rest of a file that already failed
+            try:
+                sink(payload)
+            except OSError as exc:
+                error = exc
+        raise error
+
+    def _write_file(self, reader: _ReadAhead, src: str, dest: Path):
+        """Drain one file's chunks from *reader* into *dest*.
+
+        Returns the source summary from :meth:`_receive`. In sync mode the
+        bytes go to a temp name that replaces *dest* only once complete, so
+        a pulled stick never holds half of a changed program under the real
+        name. On failure the file this call created or truncated is removed;
+        a missing source leaves whatever the stick already held untouched.
+        """
+        target = dest
+        if self._sync:
+            target = dest.with_name(dest.name + _TEMP_SUFFIX)
+        fdst = None
+        opened = False
+
+        def sink(chunk: bytes) -> None:
+            nonlocal fdst, opened
+            if fdst is None:
+                fdst = open(target, "wb", buffering=_WRITE_BUFFER_BYTES)
+                opened = True
+            fdst.write(chunk)
+
+        try:
+            summary = self._receive(reader, sink)
+            if fdst is None:  # empty source
+                sink(b"")
+            fdst.close()
+            fdst = None
+            shutil.copystat(src, target)
+            if target != dest:
+                os.replace(target, dest)
+            return summary
+        except BaseException:
+            if opened:
+                if fdst is not None:
+                    try:
+                        fdst.close()
+                    except OSError:
+                        pass
+                try:
+                    os.unlink(target)
+                except OSError:
+                    pass
+            raise
+
+    def _sync_file(
+        self, reader: _ReadAhead, src: str, dest: Path, size: int | None
+    ) -> tuple[tuple[int, str] | None, bool]:
+        """Copy *src* unless the stick already holds identical bytes.
+
+        Returns ``(summary, skipped)``. Only a same-size copy on the stick
+        is worth hashing; its hash is taken before the source arrives, and
+        the source is spooled (in memory, or a temp file once large) until
+        its own hash is known — so an unchanged file costs a read of the
+        stick and no write at all.
+        """
+        try:
+            on_stick = os.stat(dest).st_size
+        except OSError:
+            on_stick = None
+        if size is None or on_stick != size:
+            return self._write_file(reader, src, dest), False
+
+        try:
+            stick_digest = file_digest(dest)
+        except OSError:
+            stick_digest = None
+        with tempfile.SpooledTemporaryFile(max_size=_SPOOL_BYTES) as spool:
+            summary = self._receive(reader, spool.write)
+            if stick_digest is not None and summary[1] == stick_digest:
+                return summary, True
+            spool.seek(0)
+            replay = _SpoolReader(spool, summary)
+            return self._write_file(replay, src, dest), False
+
+    def _remove_stale_nc(self) -> tuple[int, list[str]]:
+        """Delete root ``.nc`` files (and our temp files) not in this job.
+
+        Returns ``(removed, failure lines)``. Only the drive root is touched
+        — that is where the flat copy puts every program — and only files
+        ending in ``.nc``, so anything else the operator keeps on the stick
+        is left alone.
+        """
+        keep = {Path(src).name.lower() for src in self._nc_files}
+        removed = 0
+        failures: list[str] = []
+        for entry in os.scandir(self._target):
+            name = entry.name.lower()
+            if not entry.is_file():
+                continue
+            if name.endswith(_TEMP_SUFFIX) or (
+                name.endswith(".nc") and name not in keep
+            ):
+                try:
+                    os.unlink(entry.path)
+                except OSError as exc:
+                    failures.append(
+                        f"{entry.name}: could not remove — "
+                        f"{describe_failure(exc)}"
+                    )
+                    continue
+                if name.endswith(".nc"):
+                    removed += 1
+        return removed, failures
+
+    def _flush_to_stick(self, written: list[Path]) -> list[str]:
+        """fsync every written file in one pass. Returns failure lines."""
+        self.progress.emit("Flushing files to the USB drive...")
+        failures: list[str] = []
+        for dest in written:
+            try:
+                with open(dest, "rb+") as fh:
+                    os.fsync(fh.fileno())
+            except OSError as exc:
+                logger.exception("Failed to flush %s", dest)
+                failures.append(f"{dest.name}: {describe_failure(exc)}")
+        return failures
+
     def run(self) -> None:
         try:
             if not self._target.exists():
@@ -120,47 +533,138 @@ class USBTransferThread(QThread):
                 )
                 return
 
-            space_error = self._check_free_space()
-            if space_error is not None:
-                self.finished.emit(False, space_error)
-                return
+            # Reads start now; the free-space answer comes back while the
+            # first chunks are already in memory.
+            self._sizes = collect_sizes(self._nc_files)
+            reader = _ReadAhead(
+                self._nc_files, hash_sources=self._verify or self._sync
+            )
+            reader.start()
+            try:
+                space_error = self._check_free_space(self._sizes)
+                if space_error is not None:
+                    self.finished.emit(False, space_error)
+                    return
+                self._copy_all(reader)
+            finally:
+                reader.stop()
 
-            total = len(self._nc_files)
-            logger.info("Copying %d NC files to %s", total, self._target)
-
-            copied = 0
-            failures: list[str] = []
-            for index, src in enumerate(self._nc_files, start=1):
-                if self.isInterruptionRequested():
-                    self.finished.emit(
-                        False,
-                        f"Cancelled — copied {copied} of {total} NC files "
-                        f"to {self._target}.",
+        except Exception as exc:  # noqa: BLE001 - worker must never die silently
+            logger.exception("USB transfer failed")
+            self.finished.emit(
+                False, f"USB transfer failed: {describe_failure(exc)}"
+            )
+
+    def _collect_verified(
+        self,
+        results: list[tuple[Path, str | None]],
+        written: list[Path],
+        failures: list[str],
+    ) -> None:
+        """Report verify results; bad copies are deleted from the stick."""
+        for dest, problem in results:
+            self.fileVerified.emit(dest.name, problem is None, problem or "")
+            if problem is None:
+                continue
+            logger.error("Verify failed for %s: %s", dest, problem)
+            failures.append(f"{dest.name}: verify failed — {problem}")
+            if dest in written:
+                written.remove(dest)
+            try:
+                os.unlink(dest)
+            except OSError:
+                pass
+
+    def _copy_all(self, reader: _ReadAhead) -> None:
+        total = len(self._nc_files)
+        logger.info(
+            "%s %d NC files to %s",
+            "Syncing" if self._sync else "Copying", total, self._target,
+        )
+
+        verifier = _ReadBackVerifier() if self._verify else None
+        written: list[Path] = []
+        skipped = 0
+        failures: list[str] = []
+        cancelled = False
+        for index, src in enumerate(self._nc_files, start=1):
+            if self.isInterruptionRequested():
+                cancelled = True
+                break
+            name = Path(src).name
+            self.progress.emit(f"Copying file {index} of {total}: {name}")
+            dest = self._target / name
+            try:
+                if self._sync:
+                    summary, unchanged = self._sync_file(
+                        reader, src, dest, self._sizes.get(src)
                     )
-                    return
-                name = Path(src).name
-                self.progress.emit(f"Copying file {index} of {total}: {name}")
-                try:
-                    shutil.copy2(src, self._target / name)
-                    copied += 1
-                except Exception as exc:  # noqa: BLE001 - collected per file
-                    logger.exception("Failed to copy %s", src)
-                    failures.append(f"{name}: {describe_failure(exc)}")
+                else:
+                    summary = self._write_file(reader, src, dest)
+                    unchanged = False
+                if unchanged:
+                    skipped += 1
+                else:
+                    written.append(dest)
+                    if verifier is not None:
+                        verifier.submit(dest, *summary)
+            except Exception as exc:  # noqa: BLE001 - collected per file
+                logger.exception("Failed to copy %s", src)
+                failures.append(f"{name}: {describe_failure(exc)}")
+            if verifier is not None:
+                self._collect_verified(verifier.results(), written, failures)
+
+        if verifier is not None:
+            self.progress.emit("Verifying files on the USB drive...")
+            self._collect_verified(
+                verifier.results(wait=True), written, failures
+            )
+
+        # Already-written files are flushed even after a cancel, so pulling
+        # the stick does not lose them.
+        flush_failures = self._flush_to_stick(written)
+        if cancelled:
+            self.finished.emit(
+                False,
+                f"Cancelled — copied {len(written) + skipped} of {total} NC "
+                f"files to {self._target}.",
+            )
+            return
 
+        removed = 0
+        if self._remove_stale:
+            self.progress.emit("Removing old NC files from the USB drive...")
+            removed, remove_failures = self._remove_stale_nc()
+            failures.extend(remove_failures)
+
+        copied = len(written) - len(flush_failures)
+        failures.extend(flush_failures)
+
+        if self._sync:
+            counts = f"{copied} written, {skipped} unchanged"
+            if self._remove_stale:
+                counts += f", {removed} old removed"
             if failures:
                 self.finished.emit(
                     False,
-                    f"Copied {copied} of {total} NC files to {self._target}. "
-                    f"{len(failures)} failed:\n" + "\n".join(failures),
+                    f"Synced {copied + skipped} of {total} NC files to "
+                    f"{self._target} ({counts}). {len(failures)} failed:\n"
+                    + "\n".join(failures),
                 )
                 return
+            message = f"Synced {total} NC files to {self._target}: {counts}."
+            if verifier is not None:
+                message += " Written files verified."
+            self.finished.emit(True, message)
+            return
 
+        if failures:
             self.finished.emit(
-                True, f"Copied {total} NC files to {self._target}"
+                False,
+                f"Copied {copied} of {total} NC files to {self._target}. "
+                f"{len(failures)} failed:\n" + "\n".join(failures),
             )
+            return
 
-        except Exception as exc:  # noqa: BLE001 - worker must never die silently
-            logger.exception("USB transfer failed")
-            self.finished.emit(
-                False, f"USB transfer failed: {describe_failure(exc)}"
-            )
+        verb = "Copied and verified" if verifier is not None else "Copied"
+        self.finished.emit(True, f"{verb} {total} NC files to {self._target}")
@@ -13,14 +13,90 @@ ZPL reference (only the commands used here):
     ^FO<x>,<y>      field origin in dots from top-left
     ^FD<text>^FS    field data followed by field separator
     ^XZ             end label
+    ^DF<name>^FS    store the rest of this label as a format on the printer
+    ^XF<name>^FS    recall a stored format
+    ^FN<n>          numbered field: a placeholder in a stored format, or the
+                    field being filled in when recalling one
+
+Built ZPL is memoised in :data:`ZPL_CACHE`, an LRU keyed by template,
+inputs and printer dpi, so a reprint (or a run with the same separator
+repeated) does not rebuild and re-encode identical bytes.
 """
 
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional
+
 # Maximum characters allowed in a single ZPL field before truncation.
 # Chosen to comfortably fit a 4x2" label at the font sizes used below.
 MAX_FIELD_LENGTH = 60
 
+#: Resolution the layouts below were designed at (GC420D: 203 dpi).
+DEFAULT_DPI = 203
+
+#: Printer-RAM name of the stored separator format. ``R:`` is volatile, so
+#: the format disappears on a power cycle — callers download it at the
+#: start of every print run rather than trusting an earlier run's copy.
+SEPARATOR_FORMAT_NAME = "R:JMSEP.ZPL"
+
+
+class ZplCache:
+    """Thread-safe LRU of built ZPL, keyed by (template, inputs, dpi).
+
+    Values may be None, which is cached like any other result.
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        self._maxsize = max(1, int(maxsize))
+        self._entries: OrderedDict[Hashable, Optional[bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self,
+        template: str,
+        inputs: tuple,
+        dpi: int,
+        build: Callable[[], Optional[bytes]],
+    ) -> Optional[bytes]:
+        """Return the cached result for the key, building it on a miss."""
+        key = (template, inputs, dpi)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+        # Built outside the lock, so a slow build does not hold up hits.
+        value = build()
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+#: Process-wide cache used by the label printer.
+ZPL_CACHE = ZplCache()
+
+
+def _dots(value: int, dpi: int) -> int:
+    """Scale a coordinate from the 203-dpi design to *dpi*."""
+    return round(value * dpi / DEFAULT_DPI)
+
 
 def sanitize_zpl_field(text: str) -> str:
     """Sanitize user text for safe embedding in a ZPL ^FD field.
@@ -52,7 +128,9 @@ def _encode(zpl: str) -> bytes:
     return zpl.encode("ascii", errors="replace")
 
 
-def build_job_separator(job_name: str, material: str) -> bytes:
+def build_job_separator(
+    job_name: str, material: str, dpi: int = DEFAULT_DPI
+) -> bytes:
     """Build a ZPL label showing job name on top and material below.
 
     Used as the leading separator for each job's label stack. The job
@@ -64,15 +142,90 @@ def build_job_separator(job_name: str, material: str) -> bytes:
     safe_material = sanitize_zpl_field(material)
     zpl = (
         "^XA\n"
-        "^CF0,50\n"
-        f"^FO40,40^FD{safe_job}^FS\n"
-        "^CF0,80\n"
-        f"^FO40,110^FD{safe_material}^FS\n"
+        f"^CF0,{_dots(50, dpi)}\n"
+        f"^FO{_dots(40, dpi)},{_dots(40, dpi)}^FD{safe_job}^FS\n"
+        f"^CF0,{_dots(80, dpi)}\n"
+        f"^FO{_dots(40, dpi)},{_dots(110, dpi)}^FD{safe_material}^FS\n"
+        "^XZ\n"
+    )
+    return _encode(zpl)
+
+
+def build_job_banner(job_name: str, dpi: int = DEFAULT_DPI) -> bytes:
+    """Build the banner topping each job's stack in a batch print.
+
+    Reads ``JOB START`` above the job name so it cannot be mistaken for a
+    material separator while peeling. Built through :data:`ZPL_CACHE`.
+    """
+    return ZPL_CACHE.get(
+        "job_banner", (job_name,), dpi, lambda: _job_banner(job_name, dpi)
+    )
+
+
+def _job_banner(job_name: str, dpi: int) -> bytes:
+    safe_job = sanitize_zpl_field(job_name)
+    zpl = (
+        "^XA\n"
+        f"^CF0,{_dots(40, dpi)}\n"
+        f"^FO{_dots(40, dpi)},{_dots(30, dpi)}^FD*** JOB START ***^FS\n"
+        f"^CF0,{_dots(80, dpi)}\n"
+        f"^FO{_dots(40, dpi)},{_dots(90, dpi)}^FD{safe_job}^FS\n"
         "^XZ\n"
     )
     return _encode(zpl)
 
 
+def cached_job_separator(
+    job_name: str, material: str, dpi: int = DEFAULT_DPI
+) -> bytes:
+    """:func:`build_job_separator` through :data:`ZPL_CACHE`."""
+    return ZPL_CACHE.get(
+        "job_separator",
+        (job_name, material),
+        dpi,
+        lambda: build_job_separator(job_name, material, dpi),
+    )
+
+
+def build_separator_format(dpi: int = DEFAULT_DPI) -> bytes:
+    """Store the separator layout on the printer as a recallable format.
+
+    Same layout as :func:`build_job_separator`, with the job and material
+    as numbered fields. Downloading it prints nothing; each separator then
+    only needs :func:`build_separator_recall`'s few bytes of field data.
+    """
+    zpl = (
+        "^XA\n"
+        f"^DF{SEPARATOR_FORMAT_NAME}^FS\n"
+        f"^CF0,{_dots(50, dpi)}\n"
+        f"^FO{_dots(40, dpi)},{_dots(40, dpi)}^FN1^FS\n"
+        f"^CF0,{_dots(80, dpi)}\n"
+        f"^FO{_dots(40, dpi)},{_dots(110, dpi)}^FN2^FS\n"
+        "^XZ\n"
+    )
+    return ZPL_CACHE.get(
+        "separator_format", (), dpi, lambda: _encode(zpl)
+    )
+
+
+def build_separator_recall(job_name: str, material: str) -> bytes:
+    """Print a separator from the stored format (see above)."""
+    safe_job = sanitize_zpl_field(job_name)
+    safe_material = sanitize_zpl_field(material)
+    return ZPL_CACHE.get(
+        "separator_recall",
+        (job_name, material),
+        0,  # field data only — independent of the printer's dpi
+        lambda: _encode(
+            "^XA\n"
+            f"^XF{SEPARATOR_FORMAT_NAME}^FS\n"
+            f"^FN1^FD{safe_job}^FS\n"
+            f"^FN2^FD{safe_material}^FS\n"
+            "^XZ\n"
+        ),
+    )
+
+
 def build_test_separator() -> bytes:
     """Build a minimal test label used by the Settings 'Test Print' button.
 